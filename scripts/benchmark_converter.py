@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+from collections.abc import Callable, Iterator
+from dataclasses import fields, is_dataclass
+import json
+from pathlib import Path
+import time
+from typing import Any
+
+import click
+
+from allotropy.allotrope.converter import (
+    _convert_dict_to_model_key,
+    _convert_model_key_to_dict_key,
+    _get_key_tables,
+    structure,
+    unstructure,
+)
+from allotropy.allotrope.schema_parser.path_util import ROOT_DIR
+from allotropy.constants import DEFAULT_ENCODING
+
+DEFAULT_FIXTURE = Path(
+    ROOT_DIR,
+    "tests",
+    "parsers",
+    "appbio_quantstudio",
+    "testdata",
+    "appbio_quantstudio_example03.json",
+)
+
+
+def _iter_dataclasses(model: Any) -> Iterator[Any]:
+    if isinstance(model, list):
+        for value in model:
+            yield from _iter_dataclasses(value)
+    elif is_dataclass(model):
+        yield model
+        for field in fields(model):
+            yield from _iter_dataclasses(getattr(model, field.name))
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def _translate_keys(
+    classes: list[type],
+    to_dict_key: Callable[[type, str], str],
+    to_model_key: Callable[[type, str], str],
+) -> None:
+    for cls in classes:
+        for field in fields(cls):
+            to_model_key(cls, to_dict_key(cls, field.name))
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--fixture",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=DEFAULT_FIXTURE,
+    help="ASM document to convert.",
+)
+@click.option("-n", "--iterations", default=3, help="Times to run each conversion.")
+def _benchmark_converter(fixture: Path, iterations: int) -> None:
+    """Time key translation, structuring and unstructuring of an ASM document."""
+    with open(fixture, encoding=DEFAULT_ENCODING) as f:
+        asm = json.load(f)
+    model = structure(asm)
+    classes = [type(obj) for obj in _iter_dataclasses(model)]
+    key_count = sum(len(fields(cls)) for cls in classes)
+    print(f"{fixture.name}: {len(classes)} objects, {key_count} fields")
+
+    results = {
+        "keys (replace chain)": _time(
+            lambda: _translate_keys(
+                classes,
+                lambda _, key: _convert_model_key_to_dict_key.__wrapped__(key),
+                lambda _, key: _convert_dict_to_model_key.__wrapped__(key),
+            ),
+            iterations,
+        ),
+        "keys (tables)": _time(
+            lambda: _translate_keys(
+                classes,
+                lambda cls, key: _get_key_tables(cls)[0][key],
+                lambda cls, key: _get_key_tables(cls)[1][key],
+            ),
+            iterations,
+        ),
+        "structure": _time(lambda: structure(asm), iterations),
+        "unstructure": _time(lambda: unstructure(model), iterations),
+    }
+    for label, elapsed in results.items():
+        print(f"{label:>20}: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    _benchmark_converter()
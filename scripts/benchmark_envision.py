@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+from collections.abc import Callable
+from io import BytesIO
+from pathlib import Path
+import time
+from typing import Any
+
+import click
+from envision_export import create_export, DEFAULT_FIXTURE
+
+from allotropy.named_file_contents import NamedFileContents
+from allotropy.parser_factory import Vendor
+from allotropy.parsers.lines_reader import CsvReader, read_to_lines
+from allotropy.parsers.perkin_elmer_envision.perkin_elmer_envision_structure import (
+    create_calculated_data,
+    create_measurement_groups,
+    Data,
+)
+
+
+def _time(fn: Callable[[], Any]) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _time_steps(export: bytes, name: str) -> list[float]:
+    read, data = _time(
+        lambda: Data.create(
+            CsvReader(read_to_lines(NamedFileContents(BytesIO(export), name)))
+        )
+    )
+    groups, _ = _time(lambda: create_measurement_groups(data))
+    calculated, _ = _time(
+        lambda: create_calculated_data(data.plate_list, data.labels.get_read_type())
+    )
+    parser = Vendor.PERKIN_ELMER_ENVISION.get_parser()
+    total, _ = _time(
+        lambda: parser.create_data(NamedFileContents(BytesIO(export), name))
+    )
+    return [read, groups, calculated, total]
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--fixture",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=DEFAULT_FIXTURE,
+    help="EnVision export to repeat the first plate of.",
+)
+@click.option(
+    "-p",
+    "--plates",
+    multiple=True,
+    type=int,
+    default=[1, 10, 50, 100, 200],
+    help="Numbers of plates to time (can be given more than once).",
+)
+def _benchmark_envision(fixture: Path, plates: list[int]) -> None:
+    """Time converting synthetic EnVision exports with increasing numbers of plates."""
+    contents = fixture.read_text()
+    print(f"{fixture.name} repeated for each number of plates")
+    steps = ["read", "measurements", "calculated", "create_data"]
+    print(f"{'plates':>6}" + "".join(f"{step:>14}" for step in steps))
+    for count in plates:
+        export = create_export(contents, count).encode()
+        elapsed = _time_steps(export, fixture.name)
+        print(f"{count:>6}" + "".join(f"{e * 1000:>12.0f}ms" for e in elapsed))
+
+
+if __name__ == "__main__":
+    _benchmark_envision()
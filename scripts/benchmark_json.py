@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+from collections.abc import Callable
+from functools import partial
+import json
+from pathlib import Path
+import time
+from typing import Any
+from unittest import mock
+
+import click
+
+from allotropy.allotrope import allotrope
+from allotropy.allotrope.allotrope import allotrope_to_json_bytes
+from allotropy.allotrope.schema_parser.path_util import ROOT_DIR
+from allotropy.constants import DEFAULT_ENCODING
+
+ENCODERS: dict[str, Callable[[dict[str, Any]], bytes]] = {
+    "json": lambda asm: json.dumps(asm, ensure_ascii=False).encode(),
+    "bytes": allotrope_to_json_bytes,
+}
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def _largest_fixtures(count: int) -> list[Path]:
+    fixtures = Path(ROOT_DIR, "tests", "parsers").glob("*/testdata/**/*.json")
+    return sorted(fixtures, key=lambda path: path.stat().st_size, reverse=True)[:count]
+
+
+@click.command()
+@click.option(
+    "-c", "--count", default=10, help="Number of the largest fixtures to encode."
+)
+@click.option("-n", "--iterations", default=5, help="Times to encode each fixture.")
+def _benchmark_json(count: int, iterations: int) -> None:
+    """Time encoding the largest ASM fixtures as JSON with json and allotrope_to_json_bytes."""
+    print(
+        f"{'fixture':<80}{'size':>8}"
+        + "".join(f"{label:>10}" for label in ENCODERS)
+        + f"{'orjson':>8}"
+    )
+    for fixture in _largest_fixtures(count):
+        with open(fixture, encoding=DEFAULT_ENCODING) as f:
+            asm = json.load(f)
+        expected = json.dumps(asm, ensure_ascii=False).encode()
+        if allotrope_to_json_bytes(asm) != expected:
+            msg = f"allotrope_to_json_bytes output differs from json for {fixture}"
+            raise AssertionError(msg)
+        results = [
+            _time(partial(encode, asm), iterations) for encode in ENCODERS.values()
+        ]
+        # Whether the fixture was encoded by orjson, rather than falling back to json.
+        with mock.patch.object(allotrope, "json") as json_mock:
+            allotrope_to_json_bytes(asm)
+        used_orjson = not json_mock.dumps.called
+        print(
+            f"{fixture.relative_to(ROOT_DIR / 'tests' / 'parsers')!s:<80}"
+            f"{len(expected) / 1024 / 1024:>6.1f}MB"
+            + "".join(f"{elapsed * 1000:>8.1f}ms" for elapsed in results)
+            + f"{'yes' if used_orjson else 'no':>8}"
+        )
+
+
+if __name__ == "__main__":
+    _benchmark_json()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+from collections.abc import Callable
+from pathlib import Path
+import time
+from typing import Any
+
+import click
+import pandas as pd
+
+from allotropy.allotrope.schema_parser.path_util import ROOT_DIR
+from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.beckman_vi_cell_blu.vi_cell_blu_reader import ViCellBluReader
+from allotropy.parsers.beckman_vi_cell_blu.vi_cell_blu_structure import (
+    create_measurement_group,
+)
+from allotropy.parsers.utils.pandas import map_rows, SeriesData
+
+DEFAULT_FIXTURE = Path(
+    ROOT_DIR,
+    "tests",
+    "parsers",
+    "beckman_vi_cell_blu",
+    "testdata",
+    "Beckman_Vi-Cell-BLU_example01.csv",
+)
+
+
+def _apply_rows(data_frame: pd.DataFrame, func: Callable[[SeriesData], Any]) -> Any:
+    # The row-wise map_rows that ColumnData replaced, for comparison.
+    return list(
+        data_frame.apply(lambda series: func(SeriesData(series)), axis="columns")
+    )
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--fixture",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=DEFAULT_FIXTURE,
+    help="Vi-CELL BLU export to read rows from.",
+)
+@click.option("-r", "--rows", default=10_000, help="Number of rows to map.")
+@click.option("-n", "--iterations", default=1, help="Times to run each step.")
+def _benchmark_map_rows(fixture: Path, rows: int, iterations: int) -> None:
+    """Time mapping the rows of a large Vi-CELL BLU export to measurement groups."""
+    with open(fixture, "rb") as f:
+        data = ViCellBluReader.read(NamedFileContents(f, fixture.name))
+    data = pd.concat([data] * (rows // len(data) + 1), ignore_index=True)[:rows]
+    print(f"{fixture.name} with {len(data)} rows and {len(data.columns)} columns")
+
+    results = {
+        "apply (SeriesData)": _time(
+            lambda: _apply_rows(data, create_measurement_group), iterations
+        ),
+        "map_rows (ColumnData)": _time(
+            lambda: map_rows(data, create_measurement_group), iterations
+        ),
+    }
+    for label, elapsed in results.items():
+        print(f"{label:>22}: {elapsed * 1000:.1f}ms, {len(data) / elapsed:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    _benchmark_map_rows()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+from collections.abc import Iterator
+from dataclasses import fields, is_dataclass
+from io import BytesIO
+from multiprocessing import get_context
+from pathlib import Path
+import sys
+from typing import Any
+
+import click
+from envision_export import create_export, DEFAULT_FIXTURE
+
+from allotropy.parser_factory import Vendor
+from allotropy.to_allotrope import allotrope_model_from_io
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    class _ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [  # noqa: RUF012
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            *(
+                (name, ctypes.c_size_t)
+                for name in [
+                    "PeakWorkingSetSize",
+                    "WorkingSetSize",
+                    "QuotaPeakPagedPoolUsage",
+                    "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage",
+                    "QuotaNonPagedPoolUsage",
+                    "PagefileUsage",
+                    "PeakPagefileUsage",
+                ]
+            ),
+        ]
+
+else:
+    import resource
+
+
+def _iter_dataclasses(model: Any) -> Iterator[Any]:
+    if isinstance(model, list):
+        for value in model:
+            yield from _iter_dataclasses(value)
+    elif is_dataclass(model):
+        yield model
+        for field in fields(model):
+            yield from _iter_dataclasses(getattr(model, field.name))
+
+
+def _max_rss_mb() -> float:
+    if sys.platform == "win32":
+        # The peak working set is the closest Windows has to the peak RSS.
+        counters = _ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(),
+            ctypes.byref(counters),
+            counters.cb,
+        )
+        return float(counters.PeakWorkingSetSize) / (1024 * 1024)
+    else:
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _convert(fixture: Path, plates: int) -> tuple[float, float, int, int]:
+    # Run in a new process for each export, so that the peak RSS is for that conversion only.
+    export = create_export(fixture.read_text(), plates).encode()
+    start_rss = _max_rss_mb()
+    model = allotrope_model_from_io(
+        BytesIO(export), fixture.name, Vendor.PERKIN_ELMER_ENVISION
+    )
+    objects = list(_iter_dataclasses(model))
+    with_dict = sum(hasattr(obj, "__dict__") for obj in objects)
+    return start_rss, _max_rss_mb(), len(objects), with_dict
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--fixture",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=DEFAULT_FIXTURE,
+    help="EnVision export to repeat the first plate of.",
+)
+@click.option(
+    "-p",
+    "--plates",
+    multiple=True,
+    type=int,
+    default=[10, 100, 200],
+    help="Numbers of plates to convert (can be given more than once).",
+)
+def _benchmark_memory(fixture: Path, plates: list[int]) -> None:
+    """Measure the peak RSS of converting synthetic EnVision exports to plate reader models."""
+    print(f"{fixture.name} repeated for each number of plates")
+    print(
+        f"{'plates':>6}{'models':>10}{'with __dict__':>15}{'start RSS':>12}{'peak RSS':>12}"
+    )
+    with get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        for count in plates:
+            start_rss, peak_rss, objects, with_dict = pool.apply(
+                _convert, (fixture, count)
+            )
+            print(
+                f"{count:>6}{objects:>10}{with_dict:>15}{start_rss:>10.0f}MB{peak_rss:>10.0f}MB"
+            )
+
+
+if __name__ == "__main__":
+    _benchmark_memory()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+from collections import defaultdict
+from collections.abc import Callable
+from importlib.metadata import version
+import json
+from pathlib import Path
+import time
+from typing import Any
+
+import click
+import jsonschema
+
+from allotropy.allotrope.schema_parser.path_util import ROOT_DIR
+from allotropy.allotrope.schema_parser.schema_bundler import (
+    get_unresolved_references,
+)
+from allotropy.allotrope.schemas import (
+    get_schema_bundle_from_manifest,
+    get_schema_from_manifest,
+)
+from allotropy.constants import DEFAULT_ENCODING
+
+
+def _load_documents(pattern: str) -> dict[str, list[dict[str, Any]]]:
+    documents = defaultdict(list)
+    for path in Path(ROOT_DIR, "tests", "parsers").glob(pattern):
+        with open(path, encoding=DEFAULT_ENCODING) as f:
+            try:
+                document = json.load(f)
+            except json.JSONDecodeError:
+                continue
+        if isinstance(document, dict) and "$asm.manifest" in document:
+            documents[document["$asm.manifest"]].append(document)
+    return documents
+
+
+def _time_validation(
+    documents: dict[str, list[dict[str, Any]]],
+    get_schema: Callable[[str], dict[str, Any]],
+    iterations: int,
+) -> float:
+    validators = {
+        manifest: jsonschema.validators.Draft202012Validator(get_schema(manifest))
+        for manifest in documents
+    }
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for manifest, manifest_documents in documents.items():
+            for document in manifest_documents:
+                error = jsonschema.exceptions.best_match(
+                    validators[manifest].iter_errors(document)
+                )
+                if error is not None:
+                    raise error
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("-n", "--iterations", default=3, help="Times to validate each document.")
+@click.option(
+    "-g",
+    "--glob",
+    "pattern",
+    default="*/testdata/**/*.json",
+    help="Glob (relative to tests/parsers) of ASM documents to validate.",
+)
+@click.option(
+    "-s",
+    "--schema-type",
+    "schema_types",
+    type=click.Choice(["referenced", "bundled"]),
+    multiple=True,
+    default=("bundled", "referenced"),
+    help="Which schemas to validate against.",
+)
+def _benchmark_schema_validation(
+    iterations: int, pattern: str, schema_types: tuple[str, ...]
+) -> None:
+    """Compare validation throughput of referenced schemas and $ref-free bundles."""
+    documents = _load_documents(pattern)
+    for manifest in list(documents):
+        # Skip schemas with references that can only be resolved by downloading them, so that network time
+        # is not measured.
+        if get_unresolved_references(get_schema_bundle_from_manifest(manifest)):
+            print(f"Skipping {manifest}, bundle has unresolved references.")
+            del documents[manifest]
+    count = iterations * sum(len(docs) for docs in documents.values())
+    print(
+        f"jsonschema {version('jsonschema')}: validating {count} documents against {len(documents)} schemas"
+    )
+    get_schemas = {
+        "referenced": get_schema_from_manifest,
+        "bundled": get_schema_bundle_from_manifest,
+    }
+    for label in schema_types:
+        get_schema = get_schemas[label]
+        elapsed = _time_validation(documents, get_schema, iterations)
+        print(f"{label:>10}: {elapsed:.2f}s ({count / elapsed:.1f} documents/s)")
+
+
+if __name__ == "__main__":
+    _benchmark_schema_validation()
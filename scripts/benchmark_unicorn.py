@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+from collections.abc import Callable
+from io import BytesIO
+from pathlib import Path
+import struct
+import time
+from typing import Any
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import click
+
+from allotropy.allotrope.schema_parser.path_util import ROOT_DIR
+from allotropy.named_file_contents import NamedFileContents
+from allotropy.parser_factory import Vendor
+from allotropy.parsers.cytiva_unicorn.structure.data_cube.converters import (
+    FloatConverter,
+)
+from allotropy.parsers.cytiva_unicorn.structure.data_cube.transformations import (
+    Min2Sec,
+)
+
+DEFAULT_FIXTURE = Path(
+    ROOT_DIR, "tests", "parsers", "cytiva_unicorn", "testdata", "unicorn_1.zip"
+)
+# CoordinateData blobs are a header, 4 byte floats and a trailer.
+HEADER_SIZE = 47
+TRAILER_SIZE = 48
+
+
+def _resize_coordinate_data(data: bytes, points: int) -> bytes:
+    header, values = data[:HEADER_SIZE], data[HEADER_SIZE:-TRAILER_SIZE]
+    if values:
+        values = (values * (points * 4 // len(values) + 1))[: points * 4]
+    return header + values + data[-TRAILER_SIZE:]
+
+
+def _resize_zip(data: bytes, points: int) -> bytes:
+    """Repeat the points of every curve in a UNICORN result zip (and the zips in it) up to the given number."""
+    out = BytesIO()
+    with ZipFile(BytesIO(data)) as zip_in, ZipFile(out, "w", ZIP_DEFLATED) as zip_out:
+        for name in zip_in.namelist():
+            contents = zip_in.read(name)
+            if name.endswith(".zip") and contents:
+                contents = _resize_zip(contents, points)
+            elif name.startswith("CoordinateData.") and not name.endswith("DataType"):
+                contents = _resize_coordinate_data(contents, points)
+            zip_out.writestr(name, contents)
+    return out.getvalue()
+
+
+def _struct_decode(data: bytes) -> tuple[float, ...]:
+    # The per element decoding FloatConverter and Min2Sec replaced, for comparison.
+    values = tuple(
+        struct.unpack("<f", data[i : i + 4])[0]
+        for i in range(HEADER_SIZE, len(data) - TRAILER_SIZE, 4)
+    )
+    return tuple(value * 60 for value in values)
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+@click.command()
+@click.option(
+    "-f",
+    "--fixture",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=DEFAULT_FIXTURE,
+    help="UNICORN result zip to convert.",
+)
+@click.option(
+    "-p", "--points", default=1_000_000, help="Number of points in each curve."
+)
+@click.option("-n", "--iterations", default=1, help="Times to run each step.")
+def _benchmark_unicorn(fixture: Path, points: int, iterations: int) -> None:
+    """Time decoding and converting a large Cytiva UNICORN result zip."""
+    data = _resize_zip(fixture.read_bytes(), points)
+    blob = bytes(HEADER_SIZE) + struct.pack("<f", 1.5) * points + bytes(TRAILER_SIZE)
+    print(f"{fixture.name} with {points} points per curve: {len(data) / 1e6:.1f}MB zip")
+
+    parser = Vendor.CYTIVA_UNICORN.get_parser()
+    results = {
+        "decode (struct)": _time(lambda: _struct_decode(blob), iterations),
+        "decode (numpy)": _time(
+            lambda: Min2Sec().transform(FloatConverter().convert(blob)).tolist(),
+            iterations,
+        ),
+        "create_data": _time(
+            lambda: parser.create_data(NamedFileContents(BytesIO(data), fixture.name)),
+            iterations,
+        ),
+    }
+    for label, elapsed in results.items():
+        print(f"{label:>16}: {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    _benchmark_unicorn()
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+import click
+
+from allotropy.allotrope.schema_parser.generate_schemas import generate_schema_bundles
+
+
+@click.command()
+@click.option("-r", "--regex", help="Regex to determine which schemas to bundle.")
+def _bundle_schemas(regex: str | None = None) -> None:
+    """Write $ref-free schema bundles used at runtime for validation."""
+    generate_schema_bundles(schema_regex=regex)
+
+
+if __name__ == "__main__":
+    _bundle_schemas()
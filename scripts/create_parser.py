@@ -38,8 +38,7 @@ def add_to_parser_factory(parser_name: str, enum_name: str, class_name: str) ->
 
     line_and_condition = {
         f'    {enum_name} = "{enum_name}"\n': "class Vendor",
-        f"    Vendor.{enum_name}: {class_name},\n": "_VENDOR_TO_PARSER",
-        f"from allotropy.parsers.{parser_name}.{parser_name}_parser import {class_name}\n": "from allotropy.parsers",
+        f'    Vendor.{enum_name}: "allotropy.parsers.{parser_name}.{parser_name}_parser.{class_name}",\n': "_VENDOR_TO_PARSER",
     }
     in_condition: dict[str, bool] = {}
 
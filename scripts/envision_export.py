@@ -0,0 +1,61 @@
+"""Synthetic PerkinElmer EnVision exports with many plates, shared by the EnVision benchmark scripts."""
+from pathlib import Path
+
+from allotropy.allotrope.schema_parser.path_util import ROOT_DIR
+
+DEFAULT_FIXTURE = Path(
+    ROOT_DIR,
+    "tests",
+    "parsers",
+    "perkin_elmer_envision",
+    "testdata",
+    "PE_Envision_fluorescence_example04.csv",
+)
+
+
+def _renumber(lines: list[str], plate_number: int) -> list[str]:
+    # Rows following a "Plate,..." header (plate and background information) start with the plate number.
+    renumbered = []
+    in_table = False
+    for line in lines:
+        if in_table and line.strip():
+            line = f"{plate_number}," + line.split(",", 1)[1]  # noqa: PLW2901
+        in_table = line.startswith("Plate,") or (in_table and bool(line.strip()))
+        renumbered.append(line)
+    return renumbered
+
+
+def create_export(contents: str, plates: int) -> str:
+    """Repeat the sections of plate 1 of an EnVision export (and its plate map) for the given number of plates."""
+    lines = contents.splitlines()
+    starts = [i for i, line in enumerate(lines) if line.startswith("Plate information")]
+    assay_start = next(
+        i for i, line in enumerate(lines) if line.startswith("Basic assay information")
+    )
+    sections = [
+        lines[start:end]
+        for start, end in zip(starts, [*starts[1:], assay_start], strict=True)
+    ]
+    plate_sections = [
+        line for section in sections if section[2].startswith("1,") for line in section
+    ]
+
+    map_start = next(i for i, line in enumerate(lines) if line.startswith("Platemap:"))
+    map_end = next(
+        i
+        for i, line in enumerate(lines)
+        if i > map_start and line.startswith("Calculations")
+    )
+    map_starts = [
+        i for i in range(map_start, map_end) if lines[i].startswith("Plate,,,,")
+    ]
+    plate_map = lines[map_starts[0] : map_starts[1] if len(map_starts) > 1 else map_end]
+
+    output = []
+    for plate in range(1, plates + 1):
+        output += _renumber(plate_sections, plate)
+    output += lines[assay_start : map_start + 1]
+    for plate in range(1, plates + 1):
+        output += [f"Plate,,,,{plate}", *plate_map[1:]]
+    output += lines[map_end:]
+    return "\n".join(output)
@@ -1,17 +1,43 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import partial
+import json
+import re
+from typing import Any, IO
 
 import jsonschema
+import numpy as np
+import orjson
 
-from allotropy.allotrope.converter import unstructure
-from allotropy.allotrope.schemas import get_schema_from_model
+from allotropy.allotrope.converter import unstructure, unstructure_document_skeleton
+from allotropy.allotrope.schemas import get_schema_validator_from_model
 from allotropy.exceptions import (
     AllotropeSerializationError,
     AllotropeValidationError,
 )
 
 
+def _get_validator(model: Any) -> jsonschema.protocols.Validator:
+    try:
+        return get_schema_validator_from_model(model)
+    except Exception as e:
+        msg = f"Failed to retrieve schema for model: {e}"
+        raise AllotropeSerializationError(msg) from e
+
+
+def _validate(validator: jsonschema.protocols.Validator, allotrope_dict: Any) -> None:
+    try:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(allotrope_dict))
+        if error is not None:
+            raise error
+    except Exception as e:
+        msg = f"Failed to validate allotrope model against schema: {e}"
+        raise AllotropeValidationError(msg) from e
+
+
 def serialize_and_validate_allotrope(model: Any) -> dict[str, Any]:
     try:
         allotrope_dict = unstructure(model)
@@ -19,19 +45,243 @@ def serialize_and_validate_allotrope(model: Any) -> dict[str, Any]:
         msg = f"Failed to serialize allotrope model: {e}"
         raise AllotropeSerializationError(msg) from e
 
+    _validate(_get_validator(model), allotrope_dict)
+    return allotrope_dict
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, np.generic):
+        return value.item()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+# Floats below 1e-4, which json writes in exponent notation (e.g. 1e-05) while orjson writes 0.00001. Floats
+# from 1e16 on are written in exponent notation by both, but differently (1e+16 and 1e16).
+_ORJSON_SMALL_FLOAT = re.compile(rb"[,:\[]-?0\.0000")
+
+
+def _add_separator_spaces(data: bytes) -> bytes | None:
+    """Add the spaces json writes after "," and ":" to compact orjson output.
+
+    Returns None if json would write the document differently: for numbers in exponent notation or below 1e-4,
+    or for strings with escaped quotes (or ending in a backslash), which make splitting on quotes ambiguous.
+    """
+    if b'\\"' in data:
+        return None
+    # Splitting on quotes gives the text between strings, where all numbers and separators are, at even indices.
+    # orjson escapes control characters, so NUL never appears in its output and can join that text.
+    parts = data.split(b'"')
+    between_strings = b"\x00".join(parts[::2])
+    # Outside strings, "e" is only in true, false and exponents. Counting is much faster than a regex, which is
+    # only needed to tell small floats from e.g. 10.00001.
+    exponents = (
+        between_strings.count(b"e")
+        - between_strings.count(b"true")
+        - between_strings.count(b"false")
+    )
+    if exponents or (
+        b"0.0000" in between_strings and _ORJSON_SMALL_FLOAT.search(between_strings)
+    ):
+        return None
+    parts[::2] = (
+        between_strings.replace(b",", b", ").replace(b":", b": ").split(b"\x00")
+    )
+    return b'"'.join(parts)
+
+
+def allotrope_to_json_bytes(allotrope_dict: dict[str, Any]) -> bytes:
+    """Return allotrope_dict as UTF-8 encoded JSON.
+
+    The bytes are the same as json.dumps(allotrope_dict, ensure_ascii=False).encode(), as written by
+    write_allotrope, with enum values and numpy scalars written as their values, but are encoded with orjson
+    where it gives the same result. Documents that orjson would write differently (e.g. floats in exponent
+    notation, NaN or infinite floats, which orjson writes as null, integers over 64 bits, which it cannot write,
+    or strings with quotes, which get in the way of adding the spaces after separators) are encoded with json.
+    """
     try:
-        allotrope_schema = get_schema_from_model(model)
+        data = orjson.dumps(allotrope_dict, default=_json_default)
+        spaced_data = _add_separator_spaces(data)
+        if spaced_data is not None and (
+            b"null" not in data or orjson.loads(data) == allotrope_dict
+        ):
+            return spaced_data
+    except orjson.JSONEncodeError:
+        pass
+
+    try:
+        return json.dumps(
+            allotrope_dict, ensure_ascii=False, default=_json_default
+        ).encode()
+    except (TypeError, ValueError) as e:
+        msg = f"Failed to serialize allotrope dict to JSON: {e}"
+        raise AllotropeSerializationError(msg) from e
+
+
+# Sub-documents with up to this many values are unstructured, validated and written whole, in batches of up to
+# this many values. Larger sub-documents are written one of their own sub-documents at a time.
+_BATCH_SIZE = 10000
+
+
+def _unstructure(model: Any) -> dict[str, Any]:
+    try:
+        return unstructure(model)
     except Exception as e:
-        msg = f"Failed to retrieve schema for model: {e}"
+        msg = f"Failed to serialize allotrope model: {e}"
         raise AllotropeSerializationError(msg) from e
 
+
+def _unstructure_document_skeleton(
+    model: Any,
+) -> tuple[dict[str, Any], dict[str, Any]]:
     try:
-        jsonschema.validate(
-            allotrope_dict,
-            allotrope_schema,
-            cls=jsonschema.validators.Draft202012Validator,
-        )
+        return unstructure_document_skeleton(model)
     except Exception as e:
-        msg = f"Failed to validate allotrope model against schema: {e}"
-        raise AllotropeValidationError(msg) from e
-    return allotrope_dict
+        msg = f"Failed to serialize allotrope model: {e}"
+        raise AllotropeSerializationError(msg) from e
+
+
+def _get_size(value: Any, sizes: dict[int, int]) -> int:
+    """Estimate the number of values in the dict form of value, storing the size of each model in sizes."""
+    if isinstance(value, list):
+        if value and (
+            isinstance(value[0], list | np.ndarray) or is_dataclass(value[0])
+        ):
+            return sum(_get_size(item, sizes) for item in value)
+        return len(value)
+    if isinstance(value, np.ndarray):
+        return int(value.size)
+    if not is_dataclass(value):
+        return 1
+    size = sum(_get_size(getattr(value, field.name), sizes) for field in fields(value))
+    sizes[id(value)] = size
+    return size
+
+
+def _get_projection(model: Any) -> dict[str, Any]:
+    """Get the dict of model with each list of sub-documents reduced to (the projection of) its first item."""
+    skeleton, sub_documents = _unstructure_document_skeleton(model)
+    for key, value in sub_documents.items():
+        skeleton[key] = (
+            [_get_projection(value[0])]
+            if isinstance(value, list)
+            else _get_projection(value)
+        )
+    return skeleton
+
+
+def _write_document(
+    skeleton: dict[str, Any],
+    sub_documents: dict[str, Any],
+    out: IO[str],
+    validate: Callable[[dict[str, Any]], None] | None,
+    sizes: dict[int, int],
+) -> None:
+    projections: dict[str, Any] = {}
+
+    def _validate_in_document(key: str, documents: list[dict[str, Any]]) -> None:
+        if validate is None:
+            return
+        for other_key, other_value in sub_documents.items():
+            if other_key != key and other_key not in projections:
+                projections[other_key] = (
+                    [_get_projection(other_value[0])]
+                    if isinstance(other_value, list)
+                    else _get_projection(other_value)
+                )
+        is_list = isinstance(sub_documents[key], list)
+        validate(
+            {**skeleton, **projections, key: documents if is_list else documents[0]}
+        )
+
+    out.write("{")
+    for index, (key, value) in enumerate(skeleton.items()):
+        if index:
+            out.write(", ")
+        out.write(f"{json.dumps(key, ensure_ascii=False)}: ")
+        if key not in sub_documents:
+            out.write(json.dumps(value, ensure_ascii=False))
+            continue
+        validate_documents = partial(_validate_in_document, key) if validate else None
+        if isinstance(sub_documents[key], list):
+            out.write("[")
+            _write_documents(sub_documents[key], out, validate_documents, sizes)
+            out.write("]")
+        else:
+            _write_documents([sub_documents[key]], out, validate_documents, sizes)
+    out.write("}")
+
+
+def _write_documents(
+    models: list[Any],
+    out: IO[str],
+    validate: Callable[[list[dict[str, Any]]], None] | None,
+    sizes: dict[int, int],
+) -> None:
+    # Small documents are validated together, so that the documents containing them are not validated again for
+    # each of them.
+    batch: list[dict[str, Any]] = []
+    batch_size = 0
+    written = 0
+
+    def _write_separator() -> None:
+        nonlocal written
+        if written:
+            out.write(", ")
+        written += 1
+
+    def _write_batch() -> None:
+        nonlocal batch_size
+        if validate is not None and batch:
+            validate(batch)
+        for document in batch:
+            _write_separator()
+            out.write(json.dumps(document, ensure_ascii=False))
+        batch.clear()
+        batch_size = 0
+
+    for model in models:
+        size = sizes[id(model)]
+        if size > _BATCH_SIZE:
+            skeleton, sub_documents = _unstructure_document_skeleton(model)
+            if sub_documents:
+                _write_batch()
+                _write_separator()
+                _write_document(
+                    skeleton,
+                    sub_documents,
+                    out,
+                    (lambda document: validate([document])) if validate else None,
+                    sizes,
+                )
+                continue
+        if batch_size + size > _BATCH_SIZE:
+            _write_batch()
+        batch.append(_unstructure(model))
+        batch_size += size
+    _write_batch()
+
+
+def write_allotrope(model: Any, out: IO[str], *, validate: bool = True) -> None:
+    """Write model to out as ASM JSON, one sub-document at a time.
+
+    The text written is the same as json.dumps(serialize_and_validate_allotrope(model), ensure_ascii=False), but
+    large documents are never held in memory as a whole: they are written one (batch of) sub-documents at a
+    time, i.e. aggregate documents and items of document lists, along with the top level values of the
+    documents that contain them.
+
+    If validate is set, sub-documents are validated before they are written, together with the documents that
+    contain them and the first item of any other lists of sub-documents in those. Constraints between items of
+    the same list (e.g. uniqueItems) are not checked. On failure, out will contain a partial document.
+    """
+    validator = _get_validator(model) if validate else None
+    sizes: dict[int, int] = {}
+    _get_size(model, sizes)
+    _write_documents(
+        [model],
+        out,
+        (lambda documents: _validate(validator, documents[0])) if validator else None,
+        sizes,
+    )
@@ -2,21 +2,31 @@ from __future__ import annotations
 
 import builtins
 from collections.abc import Callable, Mapping, Sequence
-from dataclasses import asdict, field, fields, is_dataclass, make_dataclass, MISSING
+from dataclasses import (
+    asdict,
+    field,
+    fields,
+    is_dataclass,
+    make_dataclass,
+    MISSING,
+    replace,
+)
 from enum import Enum
+from functools import lru_cache, wraps
 from types import GenericAlias, UnionType
 from typing import (
     Any,
     cast,
     get_args,
     get_origin,
+    get_type_hints,
     TypeVar,
     Union,
 )
 
 from cattrs import Converter
 from cattrs.errors import ClassValidationError
-from cattrs.gen import make_dict_structure_fn, make_dict_unstructure_fn, override
+from cattrs.gen import make_dict_structure_fn, override
 import numpy as np
 
 from allotropy.allotrope.models.adm.pcr.benchling._2023._09.qpcr import (
@@ -152,6 +162,8 @@ def add_custom_information_document(
     return model
 
 
+# Bound the key caches, as custom information documents can contain arbitrary keys.
+@lru_cache(maxsize=4096)
 def _convert_model_key_to_dict_key(key: str) -> str:
     key = SPECIAL_KEYS.get(key, key)
     for dict_val, model_val in DICT_KEY_TO_MODEL_KEY_REPLACEMENTS.items():
@@ -159,6 +171,7 @@ def _convert_model_key_to_dict_key(key: str) -> str:
     return key
 
 
+@lru_cache(maxsize=4096)
 def _convert_dict_to_model_key(key: str) -> str:
     key = SPECIAL_KEYS_INVERSE.get(key, key)
     for dict_val, model_val in DICT_KEY_TO_MODEL_KEY_REPLACEMENTS.items():
@@ -166,6 +179,66 @@ def _convert_dict_to_model_key(key: str) -> str:
     return key
 
 
+CachedResult = TypeVar("CachedResult")
+# Package of the model classes, which are defined once and used for the lifetime of the process.
+_MODELS_MODULE = "allotropy.allotrope.models."
+
+
+def _cache_by_class(
+    func: Callable[[Any], CachedResult]
+) -> Callable[[Any], CachedResult]:
+    """Cache the result of func for each class.
+
+    Results for the model classes (over a thousand, more than fit a bounded cache) are kept for good, so a long
+    running process converting many schemas never computes them twice. Results for other classes, e.g. the
+    custom information document classes created at runtime, are kept in a bounded cache.
+    """
+    model_results: dict[Any, CachedResult] = {}
+    other_results = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def cached(cls: Any) -> CachedResult:
+        result = model_results.get(cls)
+        if result is None:
+            if not cls.__module__.startswith(_MODELS_MODULE):
+                return other_results(cls)
+            result = model_results[cls] = func(cls)
+        return result
+
+    return cached
+
+
+@_cache_by_class
+def _get_key_tables(cls: Any) -> tuple[dict[str, str], dict[str, str]]:
+    """Get the model key -> dict key and dict key -> model key tables for the fields of a dataclass."""
+    model_to_dict_keys = {
+        a.name: _convert_model_key_to_dict_key(a.name) for a in fields(cls)
+    }
+    dict_to_model_keys = {value: key for key, value in model_to_dict_keys.items()}
+    return model_to_dict_keys, dict_to_model_keys
+
+
+@_cache_by_class
+def _get_field_names(cls: Any) -> tuple[str, ...]:
+    return tuple(a.name for a in fields(cls))
+
+
+def _get_field_types(cls: Any) -> dict[str, Any]:
+    field_types = {a.name: a.type for a in fields(cls)}
+    # PEP 563 annotations need to be resolved, as in cattrs.
+    if any(isinstance(field_type, str) for field_type in field_types.values()):
+        field_types |= get_type_hints(cls)
+    return field_types
+
+
+def _get_model_key(model: Any, key: str) -> str:
+    if is_dataclass(model):
+        model_key = _get_key_tables(model.__class__)[1].get(key)
+        if model_key is not None:
+            return model_key
+    return _convert_dict_to_model_key(key)
+
+
 def _validate_structuring(val: Any, model: Any) -> None:
     """Validate that all keys in val are stored in model."""
     if isinstance(val, list):
@@ -177,7 +250,7 @@ def _validate_structuring(val: Any, model: Any) -> None:
         return
 
     for key, value in val.items():
-        model_key = _convert_dict_to_model_key(key)
+        model_key = _get_model_key(model, key)
         # If the key is unit, and this is a unit model, ensure the unit is correct.
         if key == "unit" and isinstance(model, HasUnit):
             unit_field = next(field for field in fields(model) if field.name == "unit")
@@ -206,6 +279,8 @@ def register_data_cube_hooks(converter: Converter) -> None:
         TDimensionArray | TFunction, structure_dimension_array
     )
     converter.register_structure_hook(TMeasureArray, lambda val, _: val)
+    # Data cubes can hold numpy arrays (see schema_mappers.data_cube), which are only converted here.
+    converter.register_unstructure_hook(np.ndarray, lambda val: val.tolist())
 
 
 # TODO: this code is copied from cattrs 24.1.0. We currently pin to 23.1.2 because some other libraries that
@@ -229,6 +304,111 @@ def is_sequence(type_: Any) -> bool:
     )
 
 
+def _get_union_members(field_type: Any) -> tuple[tuple[Any, ...], tuple[Any, ...]]:
+    """Get the dataclasses and the dataclass list item types a field can be structured with."""
+    members = (
+        get_args(field_type)
+        if get_origin(field_type) in (Union, UnionType)
+        else (field_type,)
+    )
+    return (
+        tuple(member for member in members if is_dataclass(member)),
+        tuple(
+            member.__args__[0]
+            for member in members
+            if is_sequence(member)
+            and len(getattr(member, "__args__", ())) == 1
+            and is_dataclass(member.__args__[0])
+        ),
+    )
+
+
+@_cache_by_class
+def _get_shape(
+    cls: Any,
+) -> tuple[
+    frozenset[str],
+    frozenset[str],
+    Any,
+    dict[str, tuple[tuple[Any, ...], tuple[Any, ...]]],
+]:
+    """Get the required keys, allowed keys, unit and nested dataclass types of the dict form of cls."""
+    dict_keys = _get_key_tables(cls)[0]
+    field_types = _get_field_types(cls)
+    required_keys = frozenset(
+        dict_keys[a.name]
+        for a in fields(cls)
+        if a.default is MISSING and a.default_factory is MISSING
+    )
+    unit = (
+        next(a.default for a in fields(cls) if a.name == "unit")
+        if is_subclass(cls, HasUnit)
+        else MISSING
+    )
+    nested = {
+        dict_keys[name]: members
+        for name, field_type in field_types.items()
+        if any(members := _get_union_members(field_type))
+    }
+    return required_keys, frozenset(dict_keys.values()), unit, nested
+
+
+def _matches_shape(val: Any, cls: Any) -> bool:
+    """Check if val has the shape of the dict form of cls, i.e. if _validate_structuring would accept it.
+
+    The check is made against the types of cls, so no value needs to be structured to decide.
+    """
+    if not isinstance(val, dict):
+        return False
+    required_keys, allowed_keys, unit, nested = _get_shape(cls)
+    if not required_keys <= val.keys():
+        return False
+    for key, value in val.items():
+        if key not in allowed_keys:
+            # The legacy custom information document is set by dataclass_structure_fn, not by a field.
+            if key == "custom information document" and isinstance(value, dict):
+                continue
+            return False
+        if key == "unit" and unit is not MISSING and value != unit:
+            return False
+        if key not in nested:
+            continue
+        classes, list_classes = nested[key]
+        if isinstance(value, dict) and classes:
+            if not any(_matches_shape(value, subcls) for subcls in classes):
+                return False
+        elif isinstance(value, list) and value and list_classes:
+            if not any(
+                all(_matches_shape(v, subcls) for v in value) for subcls in list_classes
+            ):
+                return False
+    return True
+
+
+def _make_union_discriminator(
+    classes: Sequence[Any],
+) -> Callable[[list[Any]], Any | None]:
+    """Make a function that picks the dataclass in classes that values should be structured with.
+
+    This picks the same class as trying every class in turn and keeping the first that passes
+    _validate_structuring would, but without structuring any value. The function returns None if no class
+    matches, in which case the caller must fall back to trying every class.
+    """
+    # There is nothing to pick from a single class, and trying it is as fast as checking it.
+    if len(classes) < 2:
+        return lambda _: None
+
+    def discriminate(values: list[Any]) -> Any | None:
+        if not values:
+            return None
+        return next(
+            (cls for cls in classes if all(_matches_shape(val, cls) for val in values)),
+            None,
+        )
+
+    return discriminate
+
+
 def register_dataclass_union_hooks(converter: Converter) -> None:
     # Handles any union of dataclass, lists of dataclasses, and primitive values.
     # First checks if the value is a list, and if so tries to parse with any of the list types.
@@ -252,8 +432,25 @@ def register_dataclass_union_hooks(converter: Converter) -> None:
     def dataclass_union_structure_fn(
         cls: Any,
     ) -> Callable[[dict[str, Any] | str | None, Any], Any | None]:
+        list_discriminator = _make_union_discriminator(
+            [
+                subcls.__args__[0]
+                for subcls in get_args(cls)
+                if is_sequence(subcls) and len(getattr(subcls, "__args__", ())) == 1
+            ]
+        )
+        discriminator = _make_union_discriminator(
+            [subcls for subcls in get_args(cls) if is_dataclass(subcls)]
+        )
+
         def structure_item(val: dict[str, Any] | str | None, _: Any) -> Any | None:
             if isinstance(val, list):
+                if (subcls := list_discriminator(val)) is not None:
+                    try:
+                        return [converter.structure(v, subcls) for v in val]
+                    except (ClassValidationError, TypeError):
+                        pass
+
                 valid_models = []
                 for subcls in get_args(cls):
                     if not is_sequence(subcls):
@@ -283,6 +480,12 @@ def register_dataclass_union_hooks(converter: Converter) -> None:
 
             if type(val) in PRIMITIVE_TYPES:
                 return val
+            if (subcls := discriminator([val])) is not None:
+                try:
+                    return converter.structure(val, subcls)
+                except ClassValidationError:
+                    pass
+
             valid_models = []
             for subcls in get_args(cls):
                 if not is_dataclass(subcls):
@@ -330,9 +533,22 @@ def structure_custom_information_document(val: dict[str, Any], name: str) -> Any
         structured_dict[_convert_dict_to_model_key(key)] = structured_value
 
     name = name.title().replace(" ", "")
+    cls = _get_custom_information_document_class(
+        name, tuple((k, type(v)) for k, v in structured_dict.items())
+    )
+    return cls(**structured_dict)
+
+
+# Documents with the same name, keys and value types share a class, rather than creating one for every document.
+@lru_cache(maxsize=1024)
+def _get_custom_information_document_class(
+    name: str, field_types: tuple[tuple[str, type], ...]
+) -> Any:
     return make_dataclass(
-        name, ((k, type(v), field(default=None)) for k, v in structured_dict.items())
-    )(**structured_dict)
+        name,
+        ((k, field_type, field(default=None)) for k, field_type in field_types),
+        slots=True,
+    )
 
 
 def _create_should_omit_function(
@@ -357,14 +573,24 @@ def _unstructure_value(value: Any) -> Any:
 def unstructure_custom_information_document(model: Any) -> dict[str, Any]:
     should_omit = _create_should_omit_function(model)
 
-    def dict_factory(kv_pairs: Sequence[tuple[str, Any]]) -> dict[str, Any]:
+    # The same as asdict(model, dict_factory=...) with the dict factory below, without copying every value.
+    def unstructure_dataclass(obj: Any) -> dict[str, Any]:
         return {
             _convert_model_key_to_dict_key(key): _unstructure_value(value)
-            for key, value in kv_pairs
-            if not should_omit(key, value)
+            for key in _get_field_names(obj.__class__)
+            if not should_omit(key, value := unstructure_item(getattr(obj, key)))
         }
 
-    return asdict(model, dict_factory=dict_factory)
+    def unstructure_item(value: Any) -> Any:
+        if is_dataclass(value) and not isinstance(value, type):
+            return unstructure_dataclass(value)
+        if isinstance(value, list | tuple):
+            return type(value)(unstructure_item(v) for v in value)
+        if isinstance(value, dict):
+            return {unstructure_item(k): unstructure_item(v) for k, v in value.items()}
+        return value
+
+    return unstructure_dataclass(model)
 
 
 def register_dataclass_hooks(converter: Converter) -> None:
@@ -373,8 +599,8 @@ def register_dataclass_hooks(converter: Converter) -> None:
             cls,
             converter,
             **{
-                a.name: override(rename=_convert_model_key_to_dict_key(a.name))
-                for a in fields(cls)
+                key: override(rename=dict_key)
+                for key, dict_key in _get_key_tables(cls)[0].items()
             },
         )
 
@@ -411,24 +637,73 @@ EMPTY_VALUE_CLASS_AND_FIELD = {
 }
 
 
+def _make_compiled_unstructure_fn(
+    cls: Any,
+    converter: Converter,
+    field_hooks: Mapping[str, Callable[[Any], Any]],
+    required_keys: set[str],
+    *,
+    keep_null_value: bool,
+) -> Callable[[Any], dict[str, Any]]:
+    """Generate a straight-line function that unstructures an instance of cls to an ASM dict.
+
+    This is equivalent to make_dict_unstructure_fn followed by renaming keys with _convert_model_key_to_dict_key
+    and dropping keys with should_omit, but the ASM keys and omit rules are resolved once, when the function is
+    generated, instead of for every field of every object.
+    """
+    field_types = _get_field_types(cls)
+    dict_keys = _get_key_tables(cls)[0]
+    globs: dict[str, Any] = {}
+    lines = ["def unstructure(instance):", "  res = {}"]
+    for a in fields(cls):
+        handler: Callable[..., Any] | None = field_hooks.get(a.name)
+        if handler is None:
+            try:
+                handler = converter._unstructure_func.dispatch(field_types[a.name])
+            except RecursionError:
+                handler = converter.unstructure
+        if handler is converter._unstructure_identity:  # type: ignore[comparison-overlap]
+            invoke = f"instance.{a.name}"
+        else:
+            globs[f"__h_{a.name}"] = handler
+            invoke = f"__h_{a.name}(instance.{a.name})"
+
+        key = repr(dict_keys[a.name])
+        if a.name in required_keys or (keep_null_value and a.name == "value"):
+            lines.append(f"  res[{key}] = {invoke}")
+        else:
+            lines.extend(
+                [
+                    f"  value = {invoke}",
+                    "  if value is not None:",
+                    f"    res[{key}] = value",
+                ]
+            )
+    lines.append("  return res")
+
+    exec(  # noqa: S102
+        compile("\n".join(lines), f"<unstructure {cls.__qualname__}>", "exec"), globs
+    )
+    return cast(Callable[[Any], dict[str, Any]], globs["unstructure"])
+
+
 def register_unstructure_hooks(converter: Converter) -> None:
     unstructure_fn_cache = {}
 
     def unstructure_dataclass_fn(
         cls: Any, parent_cls: Any | None = None, field_name: str | None = None
     ) -> Callable[[Any], dict[str, Any]]:
-        should_omit = _create_should_omit_function(cls, parent_cls, field_name)
+        required_keys = {a.name for a in fields(cls) if a.default == MISSING}
+        keep_null_value = field_name in EMPTY_VALUE_CLASS_AND_FIELD.get(
+            parent_cls, set()
+        )
 
         def unstructure(obj: Any) -> Any:
             # Break out of dataclass recursion by calling back to converter.unstructure
             if not is_dataclass(obj):
                 return converter.unstructure(obj)
 
-            dataclass_dict = {
-                _convert_model_key_to_dict_key(k): v
-                for k, v in make_unstructure_fn(type(obj))(obj).items()
-                if not should_omit(k, v)
-            }
+            dataclass_dict = make_unstructure_fn(type(obj))(obj)
             # NOTE: this handles custom implementation of custom info document, not the ASM version that came
             # later. The ASM version will always be a list, so we can differentiate using that.
             if hasattr(obj, "custom_information_document") and not isinstance(
@@ -443,20 +718,21 @@ def register_unstructure_hooks(converter: Converter) -> None:
 
         # This custom unstructure function overrides the unstruct_hook. We need to do this at this level
         # because we need to know both the parent class and the field name at the same time to create the
-        # should_omit function.
+        # omit rules.
         def make_unstructure_fn(subcls: Any) -> Callable[[Any], dict[str, Any]]:
-            if (cls, subcls) not in unstructure_fn_cache:
-                unstructure_fn_cache[(cls, subcls)] = make_dict_unstructure_fn(
+            cache_key = (cls, subcls, keep_null_value)
+            if cache_key not in unstructure_fn_cache:
+                unstructure_fn_cache[cache_key] = _make_compiled_unstructure_fn(
                     subcls,
                     converter,
-                    **{
-                        a.name: override(
-                            unstruct_hook=unstructure_dataclass_fn(subcls, cls, a.name)
-                        )
+                    {
+                        a.name: unstructure_dataclass_fn(subcls, cls, a.name)
                         for a in fields(cls)
                     },
+                    required_keys,
+                    keep_null_value=keep_null_value,
                 )
-            return unstructure_fn_cache[(cls, subcls)]
+            return unstructure_fn_cache[cache_key]
 
         return unstructure
 
@@ -479,6 +755,56 @@ def unstructure(model: Any) -> dict[str, Any]:
     return cast(dict[str, Any], CONVERTER.unstructure(model))
 
 
+def _is_sub_document(dict_key: str, value: Any) -> bool:
+    if isinstance(value, list):
+        return (
+            dict_key.endswith(" document")
+            and bool(value)
+            and all(is_dataclass(item) for item in value)
+        )
+    return dict_key.endswith(" aggregate document") and is_dataclass(value)
+
+
+def unstructure_document_skeleton(model: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Unstructure model, except for its sub-documents.
+
+    Sub-documents are aggregate documents and non-empty lists of documents. Returns the dict of model, with
+    sub-documents keys set to None (so that key order is kept), and the sub-document models (or lists of
+    models) keyed by their dict key.
+    """
+    model_to_dict_keys, dict_to_model_keys = _get_key_tables(model.__class__)
+    sub_documents = {
+        dict_key: value
+        for key, dict_key in model_to_dict_keys.items()
+        if _is_sub_document(dict_key, value := getattr(model, key))
+    }
+    if not sub_documents:
+        return unstructure(model), {}
+
+    skeleton_model = replace(
+        model,
+        **{
+            dict_to_model_keys[dict_key]: [] if isinstance(value, list) else None
+            for dict_key, value in sub_documents.items()
+        },
+    )
+    # replace only copies fields, the custom information document can also be set as an attribute.
+    if (
+        hasattr(model, "custom_information_document")
+        and "custom_information_document" not in model_to_dict_keys
+    ):
+        skeleton_model.custom_information_document = model.custom_information_document
+    dataclass_dict = unstructure(skeleton_model)
+    skeleton = {
+        dict_key: None if dict_key in sub_documents else dataclass_dict.pop(dict_key)
+        for dict_key in model_to_dict_keys.values()
+        if dict_key in sub_documents or dict_key in dataclass_dict
+    }
+    # Keys that are not fields, i.e. the custom information document, come last.
+    skeleton.update(dataclass_dict)
+    return skeleton, sub_documents
+
+
 def structure(asm: Mapping[str, Any], model_class: Any | None = None) -> Any:
     model_class = model_class or get_model_class_from_schema(asm)
     return CONVERTER.structure(asm, model_class)
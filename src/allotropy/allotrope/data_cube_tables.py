@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import fields, is_dataclass
+import math
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from allotropy.allotrope.converter import add_custom_information_document
+from allotropy.allotrope.models.shared.definitions.definitions import (
+    TDatacubeComponent,
+    TDatacubeData,
+)
+from allotropy.parsers.utils.data_sink import DataSink, read_parquet_table, TableData
+
+# Key in the custom information document of a data cube, for the path of the table holding its data.
+DATA_FILE_KEY = "data file"
+
+
+def _iter_data_cubes(model: Any) -> Iterator[Any]:
+    if isinstance(model, list):
+        for value in model:
+            yield from _iter_data_cubes(value)
+    elif is_dataclass(model):
+        if isinstance(getattr(model, "data", None), TDatacubeData) and getattr(
+            model, "cube_structure", None
+        ):
+            yield model
+            return
+        for field in fields(model):
+            value = getattr(model, field.name)
+            if isinstance(value, list) or is_dataclass(value):
+                yield from _iter_data_cubes(value)
+
+
+def _get_column(values: Any) -> npt.NDArray[Any]:
+    if isinstance(values, np.ndarray):
+        return values
+    # Missing values of numeric measures are stored as NaN.
+    if all(value is None or isinstance(value, float) for value in values):
+        return np.array(values, dtype=np.float64)
+    return np.array(values, dtype=object)
+
+
+def _get_column_names(components: list[TDatacubeComponent]) -> list[str]:
+    concepts = [component.concept for component in components]
+    return [
+        concept if concepts.count(concept) == 1 else f"{concept} ({idx})"
+        for idx, concept in enumerate(concepts)
+    ]
+
+
+def _get_table(cube: Any) -> TableData | None:
+    # Only data cubes with one value per point of every dimension and measure fit in a table, e.g. chromatograms
+    # or kinetic reads, other data cubes keep their data.
+    data = cube.data
+    arrays = [*data.dimensions, *(data.measures or [])]
+    if not data.measures or not all(
+        isinstance(array, list | np.ndarray) for array in arrays
+    ):
+        return None
+    if len({len(array) for array in arrays}) != 1:
+        return None
+    components = [*cube.cube_structure.dimensions, *cube.cube_structure.measures]
+    if len(components) != len(arrays):
+        return None
+    return {
+        name: _get_column(array)
+        for name, array in zip(_get_column_names(components), arrays, strict=True)
+    }
+
+
+def write_data_cube_tables(model: Any, sink: DataSink, name: str) -> None:
+    """
+    Moves the data of the data cubes in model to tables, so that it is not written out in the ASM
+    :param model: the ASM model, data cubes are changed in place
+    :param sink: where to write the tables, with a column for each dimension and measure
+    :param name: prefix of the table names, <name>_data_cube_<index>.parquet
+    """
+    index = 0
+    for cube in _iter_data_cubes(model):
+        if hasattr(cube, "custom_information_document"):
+            continue
+        table = _get_table(cube)
+        if table is None:
+            continue
+        path = sink.write(f"{name}_data_cube_{index}.parquet", table)
+        index += 1
+        cube.data = None
+        add_custom_information_document(cube, {DATA_FILE_KEY: path})
+
+
+def _get_values(column: npt.NDArray[Any]) -> list[Any]:
+    values: list[Any] = column.tolist()
+    if column.dtype.kind != "f":
+        return values
+    return [None if math.isnan(value) else value for value in values]
+
+
+def _read_data_cube(
+    cube: dict[str, Any], read_table: Callable[[str], TableData]
+) -> dict[str, Any]:
+    custom_document = dict(cube["custom information document"])
+    columns = list(read_table(custom_document.pop(DATA_FILE_KEY)).values())
+    dimension_count = len(cube["cube-structure"]["dimensions"])
+    data = {
+        "dimensions": [column.tolist() for column in columns[:dimension_count]],
+        "measures": [_get_values(column) for column in columns[dimension_count:]],
+    }
+    result = {}
+    for key, value in cube.items():
+        if key == "custom information document":
+            result["data"] = data
+            if custom_document:
+                result[key] = custom_document
+        else:
+            result[key] = value
+    return result
+
+
+def read_data_cube_tables(
+    allotrope_dict: dict[str, Any],
+    read_table: Callable[[str], TableData] = read_parquet_table,
+) -> dict[str, Any]:
+    """
+    Returns the ASM with the data of data cubes read back from the tables written by write_data_cube_tables
+    :param allotrope_dict: the ASM, referring to the tables
+    :param read_table: reads the table at a path, by default a parquet file (e.g. written by DirectorySink)
+    """
+
+    def read(value: Any) -> Any:
+        if isinstance(value, list):
+            return [read(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        custom_document = value.get("custom information document")
+        if (
+            "cube-structure" in value
+            and isinstance(custom_document, dict)
+            and DATA_FILE_KEY in custom_document
+        ):
+            return _read_data_cube(value, read_table)
+        return {key: read(item) for key, item in value.items()}
+
+    result: dict[str, Any] = read(allotrope_dict)
+    return result
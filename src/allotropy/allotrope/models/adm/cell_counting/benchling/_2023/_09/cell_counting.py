@@ -18,6 +18,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TDatacubeData,
     TDatacubeStructure,
     TDateTimeValue,
@@ -25,15 +26,15 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
     device_serial_number: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -43,16 +44,16 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue | None = None
     batch_identifier: TStringValue | None = None
     sample_role_type: TStringValue | None = None
     location_identifier: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     sample_volume_setting: TQuantityValueMicroliter | None = None
     detection_type: TStringValue | None = None
@@ -65,39 +66,39 @@ class DeviceControlDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DataProcessingDocument:
+@dataclass(kw_only=True, slots=True)
+class DataProcessingDocument(CustomInformationDocumentHolder):
     cell_type_processing_method: TStringValue | None = None
     minimum_cell_diameter: TQuantityValueMicrometer | None = None
     maximum_cell_diameter: TQuantityValueMicrometer | None = None
     cell_density_dilution_factor: TQuantityValueUnitless | None = None
 
 
-@dataclass(kw_only=True)
-class ImageDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ImageDocumentItem(CustomInformationDocumentHolder):
     experimental_data_identifier: TStringValue | None = None
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class ImageAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ImageAggregateDocument(CustomInformationDocumentHolder):
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class TotalCellDiameterDistributionDataCube:
+@dataclass(kw_only=True, slots=True)
+class TotalCellDiameterDistributionDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocument(CustomInformationDocumentHolder):
     data_processing_document: DataProcessingDocument
     viability__cell_counter_: TQuantityValuePercent
     viable_cell_density__cell_counter_: TQuantityValueMillionCellsPerMilliliter
@@ -123,8 +124,8 @@ class ProcessedDataDocument:
     fluorescence_tag_positive_cell_percentage: TQuantityValueTODO | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_identifier: TStringValue
     measurement_time: TDateTimeValue
     sample_document: SampleDocument
@@ -133,26 +134,26 @@ class MeasurementDocumentItem:
     image_aggregate_document: ImageAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocumentItem]
 
 
-@dataclass(kw_only=True)
-class CellCountingDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CellCountingDocumentItem(CustomInformationDocumentHolder):
     analyst: TStringValue
     measurement_aggregate_document: MeasurementAggregateDocument
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CellCountingAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CellCountingAggregateDocument(CustomInformationDocumentHolder):
     device_system_document: DeviceSystemDocument
     cell_counting_document: list[CellCountingDocumentItem]
     data_system_document: DataSystemDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     cell_counting_aggregate_document: CellCountingAggregateDocument
     manifest: str = "http://purl.allotrope.org/manifests/cell-counting/BENCHLING/2023/09/cell-counting.manifest"
@@ -19,6 +19,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TClass,
     TDatacube,
     TDateTimeStampValue,
@@ -27,25 +28,25 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
@@ -240,29 +241,29 @@ class StatisticalFeature(Enum):
     stirring_rate = "stirring rate"
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: StatisticalFeature
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ErrorDocumentItem(CustomInformationDocumentHolder):
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ErrorAggregateDocument(CustomInformationDocumentHolder):
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     description: Any | None = None
     batch_identifier: TStringValue | None = None
@@ -270,8 +271,8 @@ class SampleDocument:
     written_name: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class Manifest:
+@dataclass(kw_only=True, slots=True)
+class Manifest(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -279,8 +280,8 @@ class Manifest:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -291,8 +292,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue | None = None
     description: Any | None = None
     brand_name: TStringValue | None = None
@@ -304,8 +305,8 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -315,21 +316,21 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataProcessingDocument:
+@dataclass(kw_only=True, slots=True)
+class DataProcessingDocument(CustomInformationDocumentHolder):
     cell_type_processing_method: TStringValue | None = None
     cell_density_dilution_factor: TQuantityValueUnitless | None = None
     minimum_cell_diameter_setting: TQuantityValueMicrometer | None = None
     maximum_cell_diameter_setting: TQuantityValueMicrometer | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -338,13 +339,13 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -361,17 +362,19 @@ class DeviceControlDocumentItem:
     detector_wavelength_setting: TQuantityValueNanometer | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class DeviceControlDocumentItemModel(DeviceControlDocumentItem):
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CellCountingDetectorDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CellCountingDetectorDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: list[DeviceControlDocumentItemModel]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FluorescenceCellCountingDeviceControlDocumentItem(DeviceControlDocumentItem):
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
     wavelength_filter_cutoff_setting: TQuantityValueNanometer | None = None
@@ -385,13 +388,15 @@ FluorescenceCellCountingDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class FluorescenceCellCountingDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class FluorescenceCellCountingDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: FluorescenceCellCountingDeviceControlDocument | None = None
 
 
-@dataclass(kw_only=True)
-class FluorescenceCellCountingMeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class FluorescenceCellCountingMeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_time: TDateTimeStampValue
     measurement_identifier: TStringValue
     device_control_aggregate_document: FluorescenceCellCountingDeviceControlAggregateDocument
@@ -403,8 +408,8 @@ class FluorescenceCellCountingMeasurementDocumentItem:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     viability__cell_counter_: TQuantityValuePercent | None = None
     viable_cell_density__cell_counter_: TQuantityValueMillionCellsPerMilliliter | None = (
         None
@@ -435,8 +440,8 @@ class ProcessedDataDocumentItem:
     fluorescent_tag_positive_percentage: TQuantityValuePercent | None = None
 
 
-@dataclass(kw_only=True)
-class CellCountingDetectorMeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CellCountingDetectorMeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_time: TDateTimeStampValue
     measurement_identifier: TStringValue
     device_control_aggregate_document: CellCountingDetectorDeviceControlAggregateDocument
@@ -448,8 +453,8 @@ class CellCountingDetectorMeasurementDocumentItem:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[
         CellCountingDetectorMeasurementDocumentItem
         | FluorescenceCellCountingMeasurementDocumentItem
@@ -461,15 +466,15 @@ class MeasurementAggregateDocument:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class CellCountingDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CellCountingDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CellCountingAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CellCountingAggregateDocument(CustomInformationDocumentHolder):
     cell_counting_document: list[CellCountingDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
     data_system_document: DataSystemDocument | None = None
@@ -479,7 +484,7 @@ class CellCountingAggregateDocument:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: Manifest | str
     cell_counting_aggregate_document: CellCountingAggregateDocument | None = None
@@ -20,6 +20,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueSquareCentimetersPerMole,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TBooleanValue,
     TClass,
     TDateTimeStampValue,
@@ -32,8 +33,8 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class AdmCoreREC202409ManifestSchema:
+@dataclass(kw_only=True, slots=True)
+class AdmCoreREC202409ManifestSchema(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -41,8 +42,8 @@ class AdmCoreREC202409ManifestSchema:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class CustomInformationDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CustomInformationDocumentItem(CustomInformationDocumentHolder):
     scalar_double_datum: TDoubleValue | None = None
     unit: TUnit | None = None
     scalar_string_datum: TStringValue | None = None
@@ -51,72 +52,72 @@ class CustomInformationDocumentItem:
     datum_label: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ElectronicProjectRecord:
+@dataclass(kw_only=True, slots=True)
+class ElectronicProjectRecord(CustomInformationDocumentHolder):
     written_name: TStringValue
     description: Any | None = None
     start_time: TDateTimeValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ErrorDocumentItem(CustomInformationDocumentHolder):
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ErrorAggregateDocument(CustomInformationDocumentHolder):
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class ImageDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ImageDocumentItem(CustomInformationDocumentHolder):
     experimental_data_identifier: TStringValue | None = None
     index: TIntegerValue | None = None
 
 
-@dataclass(kw_only=True)
-class ImageAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ImageAggregateDocument(CustomInformationDocumentHolder):
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: TClass
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class OrderedItem:
+@dataclass(kw_only=True, slots=True)
+class OrderedItem(CustomInformationDocumentHolder):
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class TQuantityValueModel:
+@dataclass(kw_only=True, slots=True)
+class TQuantityValueModel(CustomInformationDocumentHolder):
     value: float
     unit: TUnit
     has_statistic_datum_role: TStatisticDatumRole | None = None
     field_type: TClass | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue | None = None
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(kw_only=True)
-class AnalysisSequenceDocument:
+@dataclass(kw_only=True, slots=True)
+class AnalysisSequenceDocument(CustomInformationDocumentHolder):
     written_name: TStringValue
     end_time: TDateTimeValue | None = None
     file_name: TStringValue | None = None
@@ -128,8 +129,8 @@ class AnalysisSequenceDocument:
     version_number: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValueModel
     calculated_data_identifier: TStringValue | None = None
@@ -139,18 +140,18 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class CustomInformationAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CustomInformationAggregateDocument(CustomInformationDocumentHolder):
     custom_information_document: list[CustomInformationDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ElectronicSignatureDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ElectronicSignatureDocumentItem(CustomInformationDocumentHolder):
     account_identifier: TStringValue
     personal_name: TStringValue
     signature_role_type: TStringValue
@@ -162,12 +163,12 @@ class ElectronicSignatureDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class ElectronicSignatureAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ElectronicSignatureAggregateDocument(CustomInformationDocumentHolder):
     electronic_signature_document: list[ElectronicSignatureDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProcessedDataDocumentItem(OrderedItem):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -178,8 +179,8 @@ class ProcessedDataDocumentItem(OrderedItem):
     processed_data_identifier: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -187,8 +188,8 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     ASM_file_identifier: TStringValue
     data_system_instance_identifier: TStringValue
     file_name: TStringValue | None = None
@@ -203,8 +204,8 @@ class DataSystemDocument:
     )
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     brand_name: TStringValue | None = None
     device_identifier: TStringValue | None = None
@@ -219,8 +220,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     device_identifier: TStringValue
     model_number: TStringValue
     asset_management_identifier: TStringValue | None = None
@@ -235,24 +236,24 @@ class DeviceSystemDocument:
     )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     brand_name: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -289,16 +290,16 @@ class DeviceControlDocumentItem:
     excitation_wavelength_setting: TQuantityValueNanometer | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
     description: Any | None = None
@@ -314,8 +315,8 @@ class SampleDocument:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocument(CustomInformationDocumentHolder):
     device_control_aggregate_document: DeviceControlAggregateDocument
     measurement_identifier: TStringValue
     sample_document: SampleDocument
@@ -338,8 +339,8 @@ class MeasurementDocument:
     )
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocument]
     measurement_time: TDateTimeStampValue
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -356,16 +357,16 @@ class MeasurementAggregateDocument:
     container_type: TClass | None = None
 
 
-@dataclass(kw_only=True)
-class ElectronicSpectrometryDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ElectronicSpectrometryDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     electronic_project_record: ElectronicProjectRecord | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ElectronicSpectrometryAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ElectronicSpectrometryAggregateDocument(CustomInformationDocumentHolder):
     electronic_spectrometry_document: list[ElectronicSpectrometryDocumentItem]
     analysis_sequence_document: AnalysisSequenceDocument | None = None
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -382,8 +383,8 @@ class ElectronicSpectrometryAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: AdmCoreREC202409ManifestSchema | str
     electronic_spectrometry_aggregate_document: ElectronicSpectrometryAggregateDocument | None = (
         None
@@ -19,6 +19,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TClass,
     TDatacube,
     TDateTimeStampValue,
@@ -29,18 +30,18 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class AdmCoreREC202403ManifestSchema:
+@dataclass(kw_only=True, slots=True)
+class AdmCoreREC202403ManifestSchema(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -48,48 +49,48 @@ class AdmCoreREC202403ManifestSchema:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ErrorDocumentItem(CustomInformationDocumentHolder):
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ErrorAggregateDocument(CustomInformationDocumentHolder):
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class ImageDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ImageDocumentItem(CustomInformationDocumentHolder):
     index: TIntegerValue | None = None
     experimental_data_identifier: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ImageAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ImageAggregateDocument(CustomInformationDocumentHolder):
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: TClass
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class TQuantityValueModel:
+@dataclass(kw_only=True, slots=True)
+class TQuantityValueModel(CustomInformationDocumentHolder):
     value: float
     unit: TUnit
     has_statistic_datum_role: TStatisticDatumRole | None = None
     field_type: TClass | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -100,8 +101,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue | None = None
     description: Any | None = None
     brand_name: TStringValue | None = None
@@ -113,8 +114,8 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -124,8 +125,8 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -141,13 +142,13 @@ class DeviceControlDocumentItem:
     excitation_bandwidth_setting: TQuantityValueNanometer | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     description: Any | None = None
     batch_identifier: TStringValue | None = None
@@ -156,8 +157,8 @@ class SampleDocument:
     location_identifier: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class PeakItem:
+@dataclass(kw_only=True, slots=True)
+class PeakItem(CustomInformationDocumentHolder):
     peak_identifier: TStringValue
     peak_name: TStringValue | None = None
     written_name: TStringValue | None = None
@@ -183,13 +184,13 @@ class PeakItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class PeakList:
+@dataclass(kw_only=True, slots=True)
+class PeakList(CustomInformationDocumentHolder):
     peak: list[PeakItem]
 
 
-@dataclass(kw_only=True)
-class DataRegionDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataRegionDocumentItem(CustomInformationDocumentHolder):
     region_identifier: TStringValue
     region_name: TStringValue | None = None
     written_name: TStringValue | None = None
@@ -204,30 +205,30 @@ class DataRegionDocumentItem:
     comment: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataRegionAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataRegionAggregateDocument(CustomInformationDocumentHolder):
     data_region_document: list[DataRegionDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValueModel
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -236,13 +237,13 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     peak_list: PeakList | None = None
     data_processing_document: dict[str, Any] | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -252,8 +253,8 @@ class ProcessedDataDocumentItem:
     data_region_aggregate_document: DataRegionAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_time: TDateTimeStampValue
     measurement_identifier: TStringValue
     device_control_aggregate_document: DeviceControlAggregateDocument
@@ -268,8 +269,8 @@ class MeasurementDocumentItem:
     electropherogram_data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocumentItem]
     diagnostic_trace_aggregate_document: DiagnosticTraceAggregateDocument | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
@@ -279,8 +280,8 @@ class MeasurementAggregateDocument:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class ElectrophoresisDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ElectrophoresisDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
@@ -290,8 +291,8 @@ class ElectrophoresisDocumentItem:
     experiment_type: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ElectrophoresisAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ElectrophoresisAggregateDocument(CustomInformationDocumentHolder):
     data_system_document: DataSystemDocument
     electrophoresis_document: list[ElectrophoresisDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
@@ -300,7 +301,7 @@ class ElectrophoresisAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     electrophoresis_aggregate_document: ElectrophoresisAggregateDocument
     field_asm_manifest: AdmCoreREC202403ManifestSchema | str
@@ -22,6 +22,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TBooleanValue,
     TClass,
     TDatacube,
@@ -37,8 +38,8 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class AdmCoreREC202409ManifestSchema:
+@dataclass(kw_only=True, slots=True)
+class AdmCoreREC202409ManifestSchema(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -46,8 +47,8 @@ class AdmCoreREC202409ManifestSchema:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class CustomInformationDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CustomInformationDocumentItem(CustomInformationDocumentHolder):
     scalar_double_datum: TDoubleValue | None = None
     unit: TUnit | None = None
     scalar_string_datum: TStringValue | None = None
@@ -56,47 +57,47 @@ class CustomInformationDocumentItem:
     datum_label: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ElectronicProjectRecord:
+@dataclass(kw_only=True, slots=True)
+class ElectronicProjectRecord(CustomInformationDocumentHolder):
     written_name: TStringValue
     description: Any | None = None
     start_time: TDateTimeValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ErrorDocumentItem(CustomInformationDocumentHolder):
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ErrorAggregateDocument(CustomInformationDocumentHolder):
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class ImageDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ImageDocumentItem(CustomInformationDocumentHolder):
     experimental_data_identifier: TStringValue | None = None
     index: TIntegerValue | None = None
 
 
-@dataclass(kw_only=True)
-class ImageAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ImageAggregateDocument(CustomInformationDocumentHolder):
     image_document: list[ImageDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: TClass
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class AnalysisSequenceDocument:
+@dataclass(kw_only=True, slots=True)
+class AnalysisSequenceDocument(CustomInformationDocumentHolder):
     written_name: TStringValue
     end_time: TDateTimeValue | None = None
     file_name: TStringValue | None = None
@@ -108,25 +109,25 @@ class AnalysisSequenceDocument:
     version_number: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CustomInformationAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CustomInformationAggregateDocument(CustomInformationDocumentHolder):
     custom_information_document: list[CustomInformationDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue | None = None
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ElectronicSignatureDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ElectronicSignatureDocumentItem(CustomInformationDocumentHolder):
     account_identifier: TStringValue
     personal_name: TStringValue
     signature_role_type: TStringValue
@@ -138,13 +139,13 @@ class ElectronicSignatureDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class ElectronicSignatureAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ElectronicSignatureAggregateDocument(CustomInformationDocumentHolder):
     electronic_signature_document: list[ElectronicSignatureDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -152,8 +153,8 @@ class ProcessedDataAggregateDocument:
     electronic_project_record: ElectronicProjectRecord | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     ASM_file_identifier: TStringValue
     data_system_instance_identifier: TStringValue
     file_name: TStringValue | None = None
@@ -168,8 +169,8 @@ class DataSystemDocument:
     )
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     brand_name: TStringValue | None = None
     device_identifier: TStringValue | None = None
@@ -184,8 +185,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue | None = None
     brand_name: TStringValue | None = None
     description: Any | None = None
@@ -200,24 +201,24 @@ class DeviceSystemDocument:
     )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     brand_name: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -247,8 +248,8 @@ class DeviceControlDocumentItem:
     excitation_bandwidth_setting: TQuantityValueNanometer | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
@@ -257,8 +258,8 @@ class DeviceControlAggregateDocument:
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Peak:
+@dataclass(kw_only=True, slots=True)
+class Peak(CustomInformationDocumentHolder):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
@@ -345,16 +346,16 @@ class Peak:
     number_of_theoretical_plates_by_tangent_method: TQuantityValueUnitless | None = None
 
 
-@dataclass(kw_only=True)
-class PeakList:
+@dataclass(kw_only=True, slots=True)
+class PeakList(CustomInformationDocumentHolder):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
     peak: list[Peak] | None = None
 
 
-@dataclass(kw_only=True)
-class DataRegionDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataRegionDocumentItem(CustomInformationDocumentHolder):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
@@ -372,16 +373,16 @@ class DataRegionDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataRegionAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataRegionAggregateDocument(CustomInformationDocumentHolder):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
     data_region_document: list[DataRegionDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
     description: Any | None = None
@@ -393,8 +394,8 @@ class SampleDocument:
     )
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
     calculated_data_identifier: TStringValue | None = None
@@ -404,20 +405,20 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ElectropherogramDataCube:
+@dataclass(kw_only=True, slots=True)
+class ElectropherogramDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
         None
     )
@@ -431,8 +432,8 @@ class ProcessedDataDocumentItem:
     derived_electropherogram_data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocument(CustomInformationDocumentHolder):
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
     electropherogram_data_cube: ElectropherogramDataCube | TDatacube | None = None
@@ -455,8 +456,8 @@ class MeasurementDocument:
     fluorescence_emission_profile_data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocument]
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
     custom_information_aggregate_document: CustomInformationAggregateDocument | None = (
@@ -472,16 +473,16 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class ElectrophoresisDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ElectrophoresisDocumentItem(CustomInformationDocumentHolder):
     analyst: TStringValue
     measurement_aggregate_document: MeasurementAggregateDocument
     electronic_project_record: ElectronicProjectRecord | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ElectrophoresisAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ElectrophoresisAggregateDocument(CustomInformationDocumentHolder):
     electrophoresis_document: list[ElectrophoresisDocumentItem]
     analysis_sequence_document: AnalysisSequenceDocument | None = None
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
@@ -498,7 +499,7 @@ class ElectrophoresisAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: AdmCoreREC202409ManifestSchema | str
     electrophoresis_aggregate_document: ElectrophoresisAggregateDocument | None = None
@@ -14,6 +14,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TBooleanValue,
     TDateTimeStampValue,
     TIntValue,
@@ -21,24 +22,24 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
 
 
-@dataclass(kw_only=True)
-class TDataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class TDataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
 
 
-@dataclass(kw_only=True)
-class Manifest:
+@dataclass(kw_only=True, slots=True)
+class Manifest(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -46,8 +47,8 @@ class Manifest:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -57,15 +58,15 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     detector_identifier: TStringValue
     detector_model_number: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue | None = None
     description: Any | None = None
     brand_name: TStringValue | None = None
@@ -77,8 +78,8 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     flush_volume_setting: TQuantityValueMilliliter
     detector_view_volume: TQuantityValueMilliliter
     repetition_setting: TIntValue
@@ -86,13 +87,13 @@ class DeviceControlDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValueCountsPerMilliliter | TQuantityValueMicrometer | TQuantityValueUnitless
     data_source_aggregate_document: TDataSourceAggregateDocument | None = None
@@ -100,19 +101,19 @@ class CalculatedDataDocumentItem:
     calculation_description: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class TCalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class TCalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DataProcessingDocument:
+@dataclass(kw_only=True, slots=True)
+class DataProcessingDocument(CustomInformationDocumentHolder):
     dilution_factor_setting: TQuantityValueUnitless | None = None
     data_processing_omission_setting: TBooleanValue | None = None
 
 
-@dataclass(kw_only=True)
-class DistributionItem:
+@dataclass(kw_only=True, slots=True)
+class DistributionItem(CustomInformationDocumentHolder):
     particle_size: TQuantityValueMicrometer
     cumulative_count: TQuantityValueUnitless
     cumulative_particle_density: TQuantityValueCountsPerMilliliter
@@ -121,31 +122,31 @@ class DistributionItem:
     differential_count: TQuantityValueUnitless | None = None
 
 
-@dataclass(kw_only=True)
-class DistributionDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DistributionDocumentItem(CustomInformationDocumentHolder):
     distribution: list[DistributionItem]
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DistributionAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DistributionAggregateDocument(CustomInformationDocumentHolder):
     distribution_document: list[DistributionDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     data_processing_document: DataProcessingDocument | None = None
     distribution_aggregate_document: DistributionAggregateDocument | None = None
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class MeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_identifier: TStringValue
     measurement_time: TDateTimeStampValue
     device_control_aggregate_document: DeviceControlAggregateDocument | None = None
@@ -153,28 +154,28 @@ class MeasurementDocumentItem:
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     analyst: TStringValue
     submitter: TStringValue | None = None
     measurement_document: list[MeasurementDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class LightObscurationDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class LightObscurationDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
 
 
-@dataclass(kw_only=True)
-class LightObscurationAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class LightObscurationAggregateDocument(CustomInformationDocumentHolder):
     light_obscuration_document: list[LightObscurationDocumentItem]
     data_system_document: DataSystemDocument | None = None
     device_system_document: DeviceSystemDocument | None = None
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: Manifest | str
     light_obscuration_aggregate_document: LightObscurationAggregateDocument | None = (
         None
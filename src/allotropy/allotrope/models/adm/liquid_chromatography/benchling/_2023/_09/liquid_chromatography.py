@@ -32,6 +32,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TClass,
     TDatacube,
     TDatacubeData,
@@ -43,18 +44,18 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class AdmCoreREC202309ManifestSchema:
+@dataclass(kw_only=True, slots=True)
+class AdmCoreREC202309ManifestSchema(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -62,18 +63,18 @@ class AdmCoreREC202309ManifestSchema:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: TClass
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     ASM_converter_name: TStringValue | None = None
     ASM_converter_version: TStringValue | None = None
     data_system_instance_identifier: TStringValue | None = None
@@ -83,8 +84,8 @@ class DataSystemDocument:
     UNC_path: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -95,8 +96,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue
     description: Any | None = None
     brand_name: TStringValue | None = None
@@ -110,8 +111,8 @@ class DeviceSystemDocument:
     detector_model_number: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -148,13 +149,13 @@ class DeviceControlDocumentItem:
     temperature_profile_data_cube: TemperatureProfileDataCube | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     description: Any | None = None
     batch_identifier: TStringValue | None = None
@@ -162,8 +163,8 @@ class SampleDocument:
     written_name: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class Peak:
+@dataclass(kw_only=True, slots=True)
+class Peak(CustomInformationDocumentHolder):
     peak_end: TQuantityValueMilliliter | TQuantityValueSecondTime | None = None
     identifier: TStringValue | None = None
     relative_peak_height: TQuantityValuePercent | None = None
@@ -236,13 +237,13 @@ class Peak:
     chromatogram_data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class PeakList:
+@dataclass(kw_only=True, slots=True)
+class PeakList(CustomInformationDocumentHolder):
     peak: list[Peak] | None = None
 
 
-@dataclass(kw_only=True)
-class ChromatographyColumnDocument:
+@dataclass(kw_only=True, slots=True)
+class ChromatographyColumnDocument(CustomInformationDocumentHolder):
     chromatography_column_part_number: TStringValue | None = None
     chromatography_column_serial_number: TStringValue | None = None
     chromatography_column_length: TQuantityValueCentimeter | None = None
@@ -252,32 +253,32 @@ class ChromatographyColumnDocument:
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class InjectionDocument:
+@dataclass(kw_only=True, slots=True)
+class InjectionDocument(CustomInformationDocumentHolder):
     autosampler_injection_volume_setting__chromatography_: TQuantityValueCubicMillimeter
     injection_identifier: TStringValue
     injection_time: TDateTimeValue
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     data_processing_document: dict[str, Any] | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     processed_data_identifier: TStringValue | None = None
@@ -287,8 +288,8 @@ class ProcessedDataDocumentItem:
     chromatogram_data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -297,83 +298,83 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ChromatogramDataCube:
+@dataclass(kw_only=True, slots=True)
+class ChromatogramDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class SystemFlowRateDataCube:
+@dataclass(kw_only=True, slots=True)
+class SystemFlowRateDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class SampleFlowRateDataCube:
+@dataclass(kw_only=True, slots=True)
+class SampleFlowRateDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class TemperatureProfileDataCube:
+@dataclass(kw_only=True, slots=True)
+class TemperatureProfileDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class SolventConcentrationDataCube:
+@dataclass(kw_only=True, slots=True)
+class SolventConcentrationDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class PreColumnPressureDataCube:
+@dataclass(kw_only=True, slots=True)
+class PreColumnPressureDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class PostColumnPressureDataCube:
+@dataclass(kw_only=True, slots=True)
+class PostColumnPressureDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class SamplePressureDataCube:
+@dataclass(kw_only=True, slots=True)
+class SamplePressureDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class SystemPressureDataCube:
+@dataclass(kw_only=True, slots=True)
+class SystemPressureDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class DerivedColumnPressureDataCube:
+@dataclass(kw_only=True, slots=True)
+class DerivedColumnPressureDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocument(CustomInformationDocumentHolder):
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
     chromatography_column_document: ChromatographyColumnDocument
@@ -391,8 +392,8 @@ class MeasurementDocument:
     mass_chromatogram_data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocument]
     diagnostic_trace_aggregate_document: DiagnosticTraceAggregateDocument | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
@@ -400,15 +401,15 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class LiquidChromatographyDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class LiquidChromatographyDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class LiquidChromatographyAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class LiquidChromatographyAggregateDocument(CustomInformationDocumentHolder):
     liquid_chromatography_document: list[LiquidChromatographyDocumentItem]
     data_system_document: DataSystemDocument | None = None
     device_system_document: DeviceSystemDocument | None = None
@@ -417,8 +418,8 @@ class LiquidChromatographyAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: AdmCoreREC202309ManifestSchema | str
     liquid_chromatography_aggregate_document: LiquidChromatographyAggregateDocument | None = (
         None
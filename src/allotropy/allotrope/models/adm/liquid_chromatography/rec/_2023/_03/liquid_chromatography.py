@@ -19,6 +19,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TDatacube,
     TDateTimeValue,
     TQuantityValue,
@@ -26,16 +27,16 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue
     description: Any | None = None
     brand_name: TStringValue | None = None
@@ -45,8 +46,8 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class ChromatographyColumnDocument:
+@dataclass(kw_only=True, slots=True)
+class ChromatographyColumnDocument(CustomInformationDocumentHolder):
     chromatography_column_particle_size: TQuantityValueMicrometer | None = None
     chromatography_column_chemistry_type: TStringValue | None = None
     chromatography_column_serial_number: TStringValue | None = None
@@ -56,8 +57,8 @@ class ChromatographyColumnDocument:
     chromatography_column_part_number: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     product_manufacturer: TStringValue | None = None
@@ -79,27 +80,27 @@ class DeviceControlDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     description: Any | None = None
     written_name: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class InjectionDocument:
+@dataclass(kw_only=True, slots=True)
+class InjectionDocument(CustomInformationDocumentHolder):
     autosampler_injection_volume_setting__chromatography_: TQuantityValueCubicMillimeter
     injection_identifier: TStringValue
     injection_time: TDateTimeValue
 
 
-@dataclass(kw_only=True)
-class Peak:
+@dataclass(kw_only=True, slots=True)
+class Peak(CustomInformationDocumentHolder):
     retention_time: TQuantityValueSecondTime
     peak_end: TQuantityValueSecondTime | None = None
     identifier: TStringValue | None = None
@@ -166,29 +167,29 @@ class Peak:
     peak_width: TQuantityValueSecondTime | None = None
 
 
-@dataclass(kw_only=True)
-class PeakList:
+@dataclass(kw_only=True, slots=True)
+class PeakList(CustomInformationDocumentHolder):
     peak: list[Peak] | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocument(CustomInformationDocumentHolder):
     peak_list: PeakList | None = None
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
     data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocumentItem(CustomInformationDocumentHolder):
     chromatography_column_document: ChromatographyColumnDocument
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -201,26 +202,26 @@ class MeasurementDocumentItem:
     diagnostic_trace_aggregate_document: DiagnosticTraceAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocumentItem]
 
 
-@dataclass(kw_only=True)
-class LiquidChromatographyDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class LiquidChromatographyDocumentItem(CustomInformationDocumentHolder):
     analyst: TStringValue
     measurement_aggregate_document: MeasurementAggregateDocument
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class LiquidChromatographyAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class LiquidChromatographyAggregateDocument(CustomInformationDocumentHolder):
     device_system_document: DeviceSystemDocument
     liquid_chromatography_document: list[LiquidChromatographyDocumentItem]
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     manifest: str = "http://purl.allotrope.org/manifests/liquid-chromatography/REC/2023/03/liquid-chromatography.manifest"
     liquid_chromatography_aggregate_document: LiquidChromatographyAggregateDocument | None = (
         None
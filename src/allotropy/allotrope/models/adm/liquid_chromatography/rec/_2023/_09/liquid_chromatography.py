@@ -31,6 +31,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TClass,
     TDatacube,
     TDateTimeStampValue,
@@ -40,18 +41,18 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
 )
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class AdmCoreREC202309ManifestSchema:
+@dataclass(kw_only=True, slots=True)
+class AdmCoreREC202309ManifestSchema(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -59,40 +60,40 @@ class AdmCoreREC202309ManifestSchema:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class OrderedItem:
+@dataclass(kw_only=True, slots=True)
+class OrderedItem(CustomInformationDocumentHolder):
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: TClass
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -103,8 +104,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue
     description: Any | None = None
     brand_name: TStringValue | None = None
@@ -118,8 +119,8 @@ class DeviceSystemDocument:
     detector_model_number: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -143,13 +144,13 @@ class DeviceControlDocumentItem:
     )
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     description: Any | None = None
     batch_identifier: TStringValue | None = None
@@ -157,8 +158,8 @@ class SampleDocument:
     written_name: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class Peak:
+@dataclass(kw_only=True, slots=True)
+class Peak(CustomInformationDocumentHolder):
     peak_end: TQuantityValueMilliliter | TQuantityValueSecondTime | None = None
     identifier: TStringValue | None = None
     relative_peak_height: TQuantityValuePercent | None = None
@@ -230,13 +231,13 @@ class Peak:
     number_of_theoretical_plates_by_tangent_method: TQuantityValueUnitless | None = None
 
 
-@dataclass(kw_only=True)
-class PeakList:
+@dataclass(kw_only=True, slots=True)
+class PeakList(CustomInformationDocumentHolder):
     peak: list[PeakItem] | list[Peak] | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     data_processing_document: dict[str, Any] | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     processed_data_identifier: TStringValue | None = None
@@ -244,8 +245,8 @@ class ProcessedDataDocumentItem:
     peak_list: PeakList | None = None
 
 
-@dataclass(kw_only=True)
-class ChromatographyColumnDocument:
+@dataclass(kw_only=True, slots=True)
+class ChromatographyColumnDocument(CustomInformationDocumentHolder):
     chromatography_column_part_number: TStringValue | None = None
     chromatography_column_serial_number: TStringValue | None = None
     chromatography_column_length: TQuantityValueCentimeter | None = None
@@ -255,14 +256,14 @@ class ChromatographyColumnDocument:
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class InjectionDocument:
+@dataclass(kw_only=True, slots=True)
+class InjectionDocument(CustomInformationDocumentHolder):
     autosampler_injection_volume_setting__chromatography_: TQuantityValueCubicMillimeter
     injection_identifier: TStringValue
     injection_time: TDateTimeValue
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class PeakItem(OrderedItem):
     peak_height: TQuantityValue | TQuantityValueMilliAbsorbanceUnit | None = None
     peak_area: TQuantityValue | TQuantityValueMilliAbsorbanceUnitTimesMilliliter | TQuantityValueMilliAbsorbanceUnitTimesSecond | None = (
@@ -270,13 +271,13 @@ class PeakItem(OrderedItem):
     )
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocument(CustomInformationDocumentHolder):
     peak_list: PeakList | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -285,13 +286,13 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class MeasurementDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocument(CustomInformationDocumentHolder):
     device_control_aggregate_document: DeviceControlAggregateDocument
     sample_document: SampleDocument
     chromatography_column_document: ChromatographyColumnDocument
@@ -308,8 +309,8 @@ class MeasurementDocument:
     mass_chromatogram_data_cube: TDatacube | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocument]
     diagnostic_trace_aggregate_document: DiagnosticTraceAggregateDocument | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
@@ -317,15 +318,15 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class LiquidChromatographyDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class LiquidChromatographyDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class LiquidChromatographyAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class LiquidChromatographyAggregateDocument(CustomInformationDocumentHolder):
     liquid_chromatography_document: list[LiquidChromatographyDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
     processed_data_aggregate_document: ProcessedDataAggregateDocument | None = None
@@ -333,8 +334,8 @@ class LiquidChromatographyAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: AdmCoreREC202309ManifestSchema | str
     liquid_chromatography_aggregate_document: LiquidChromatographyAggregateDocument | None = (
         None
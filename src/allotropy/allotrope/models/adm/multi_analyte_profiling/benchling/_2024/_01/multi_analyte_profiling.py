@@ -17,26 +17,27 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TDateTimeStampValue,
     TQuantityValue,
     TStringValue,
 )
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
-@dataclass(kw_only=True)
-class Manifest:
+@dataclass(kw_only=True, slots=True)
+class Manifest(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -44,8 +45,8 @@ class Manifest:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_identifier: TStringValue | None = None
     device_type: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -56,26 +57,26 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class ReferenceMaterialDocument:
+@dataclass(kw_only=True, slots=True)
+class ReferenceMaterialDocument(CustomInformationDocumentHolder):
     reference_material_identifier: TStringValue | None = None
     batch_identifier: TStringValue | None = None
     expiry_time_prescription: TDateTimeStampValue | None = None
 
 
-@dataclass(kw_only=True)
-class CalibrationResultDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalibrationResultDocumentItem(CustomInformationDocumentHolder):
     calibration_result_name: TStringValue | None = None
     calibration_result: TQuantityValueUnitless | None = None
 
 
-@dataclass(kw_only=True)
-class CalibrationResultAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalibrationResultAggregateDocument(CustomInformationDocumentHolder):
     calibration_result_document: list[CalibrationResultDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class CalibrationDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalibrationDocumentItem(CustomInformationDocumentHolder):
     calibration_name: TStringValue | None = None
     calibration_description: TStringValue | None = None
     calibration_time: TDateTimeStampValue | None = None
@@ -87,13 +88,13 @@ class CalibrationDocumentItem:
     )
 
 
-@dataclass(kw_only=True)
-class CalibrationAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalibrationAggregateDocument(CustomInformationDocumentHolder):
     calibration_document: list[CalibrationDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     asset_management_identifier: TStringValue | None = None
     description: Any | None = None
     brand_name: TStringValue | None = None
@@ -106,8 +107,8 @@ class DeviceSystemDocument:
     calibration_aggregate_document: CalibrationAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -117,8 +118,8 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     description: Any | None = None
     batch_identifier: TStringValue | None = None
@@ -129,8 +130,8 @@ class SampleDocument:
     well_plate_identifier: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -144,13 +145,13 @@ class DeviceControlDocumentItem:
     minimum_assay_bead_count_setting: TQuantityValueNumber | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class AnalyteDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class AnalyteDocumentItem(CustomInformationDocumentHolder):
     analyte_identifier: TStringValue
     analyte_name: TStringValue
     assay_bead_identifier: TStringValue
@@ -158,24 +159,24 @@ class AnalyteDocumentItem:
     fluorescence: TQuantityValueRelativeFluorescenceUnit
 
 
-@dataclass(kw_only=True)
-class AnalyteAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class AnalyteAggregateDocument(CustomInformationDocumentHolder):
     analyte_document: list[AnalyteDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ErrorDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ErrorDocumentItem(CustomInformationDocumentHolder):
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ErrorAggregateDocument(CustomInformationDocumentHolder):
     error_document: list[ErrorDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_identifier: TStringValue
     measurement_time: TDateTimeStampValue
     sample_document: SampleDocument
@@ -185,8 +186,8 @@ class MeasurementDocumentItem:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_document: list[MeasurementDocumentItem]
     analytical_method_identifier: TStringValue | None = None
     method_version: TStringValue | None = None
@@ -196,15 +197,15 @@ class MeasurementAggregateDocument:
     plate_well_count: TQuantityValueNumber | None = None
 
 
-@dataclass(kw_only=True)
-class MultiAnalyteProfilingDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MultiAnalyteProfilingDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -213,21 +214,21 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class MultiAnalyteProfilingAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MultiAnalyteProfilingAggregateDocument(CustomInformationDocumentHolder):
     device_system_document: DeviceSystemDocument
     multi_analyte_profiling_document: list[MultiAnalyteProfilingDocumentItem]
     data_system_document: DataSystemDocument | None = None
     calculated_data_aggregate_document: CalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: Manifest | str
     multi_analyte_profiling_aggregate_document: MultiAnalyteProfilingAggregateDocument | None = (
         None
@@ -16,6 +16,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TDatacubeData,
     TDatacubeStructure,
     TDateTimeValue,
@@ -48,19 +49,19 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue | None = None
     data_source_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     device_identifier: TStringValue
     asset_management_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -71,8 +72,8 @@ class DeviceSystemDocument:
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -82,19 +83,19 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ErrorDocumentItem(CustomInformationDocumentHolder):
     error: TStringValue
     error_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ErrorAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ErrorAggregateDocument(CustomInformationDocumentHolder):
     error_document: list[ErrorDocumentItem]
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
     sample_role_type: TStringValue | None = None
@@ -102,8 +103,8 @@ class SampleDocument:
     well_plate_identifier: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -121,20 +122,20 @@ class DeviceControlDocumentItem:
     passive_reference_dye_setting: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DataProcessingDocument:
+@dataclass(kw_only=True, slots=True)
+class DataProcessingDocument(CustomInformationDocumentHolder):
     flourescence_intensity_threshold_setting: TQuantityValueUnitless | None = None
     reference_DNA_description: TStringValue | None = None
     reference_DNA_copy_number_setting: TQuantityValueNumber | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     number_concentration: TQuantityValueNumberPerMicroliter
     positive_partition_count: TQuantityValueNumber
     data_processing_document: DataProcessingDocument | None = None
@@ -142,13 +143,13 @@ class ProcessedDataDocumentItem:
     confidence_interval__95__: TQuantityValueNumber | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_identifier: TStringValue | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     data_processing_document: DataProcessingDocument | None = None
@@ -157,27 +158,27 @@ class CalculatedDataDocumentItem:
     calculated_datum: TQuantityValue | None = None
 
 
-@dataclass(kw_only=True)
-class TCalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class TCalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class ReporterDyeDataCube:
+@dataclass(kw_only=True, slots=True)
+class ReporterDyeDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class PassiveReferenceDyeDataCube:
+@dataclass(kw_only=True, slots=True)
+class PassiveReferenceDyeDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_identifier: TStringValue
     measurement_time: TDateTimeValue
     target_DNA_description: TStringValue
@@ -190,8 +191,8 @@ class MeasurementDocumentItem:
     passive_reference_dye_data_cube: PassiveReferenceDyeDataCube | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     plate_well_count: TQuantityValueNumber
     measurement_document: list[MeasurementDocumentItem]
     analytical_method_identifier: TStringValue | None = None
@@ -202,24 +203,24 @@ class MeasurementAggregateDocument:
     error_aggregate_document: ErrorAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class DPCRDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DPCRDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class DPCRAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DPCRAggregateDocument(CustomInformationDocumentHolder):
     device_system_document: DeviceSystemDocument
     dPCR_document: list[DPCRDocumentItem]
     data_system_document: DataSystemDocument | None = None
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     manifest: str = (
         "http://purl.allotrope.org/manifests/pcr/BENCHLING/2023/09/dpcr.manifest"
     )
@@ -17,6 +17,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TBooleanValue,
     TDatacubeData,
     TDatacubeStructure,
@@ -56,19 +57,19 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue | None = None
     data_source_feature: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     device_identifier: TStringValue
     model_number: TStringValue
     device_serial_number: TStringValue
@@ -79,8 +80,8 @@ class DeviceSystemDocument:
     product_manufacturer: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -90,8 +91,8 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     batch_identifier: TStringValue | None = None
     sample_role_type: TStringValue | None = None
@@ -100,8 +101,8 @@ class SampleDocument:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     measurement_method_identifier: TStringValue
     device_identifier: TStringValue | None = None
@@ -119,13 +120,13 @@ class DeviceControlDocumentItem:
     passive_reference_dye_setting: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: list[DeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DataProcessingDocument:
+@dataclass(kw_only=True, slots=True)
+class DataProcessingDocument(CustomInformationDocumentHolder):
     cycle_threshold_value_setting: TQuantityValueUnitless | None = None
     automatic_cycle_threshold_enabled_setting: TBooleanValue | None = None
     automatic_baseline_determination_enabled_setting: TBooleanValue | None = None
@@ -137,8 +138,8 @@ class DataProcessingDocument:
     reference_sample_description: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_identifier: TStringValue | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     data_processing_document: DataProcessingDocument | None = None
@@ -147,27 +148,27 @@ class CalculatedDataDocumentItem:
     calculated_datum: TQuantityValueUnitless | None = None
 
 
-@dataclass(kw_only=True)
-class TCalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class TCalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class NormalizedReporterDataCube:
+@dataclass(kw_only=True, slots=True)
+class NormalizedReporterDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class BaselineCorrectedReporterDataCube:
+@dataclass(kw_only=True, slots=True)
+class BaselineCorrectedReporterDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     data_processing_document: DataProcessingDocument
     cycle_threshold_result: TNullableQuantityValueUnitless
     normalized_reporter_result: TQuantityValueUnitless | None = None
@@ -179,34 +180,34 @@ class ProcessedDataDocumentItem:
     genotyping_determination_result: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ReporterDyeDataCube:
+@dataclass(kw_only=True, slots=True)
+class ReporterDyeDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class PassiveReferenceDyeDataCube:
+@dataclass(kw_only=True, slots=True)
+class PassiveReferenceDyeDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class MeltingCurveDataCube:
+@dataclass(kw_only=True, slots=True)
+class MeltingCurveDataCube(CustomInformationDocumentHolder):
     label: str | None = None
     cube_structure: TDatacubeStructure | None = None
     data: TDatacubeData | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocumentItem(CustomInformationDocumentHolder):
     measurement_identifier: TStringValue
     measurement_time: TDateTimeValue
     target_DNA_description: TStringValue
@@ -218,8 +219,8 @@ class MeasurementDocumentItem:
     melting_curve_data_cube: MeltingCurveDataCube | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     plate_well_count: TQuantityValueNumber
     measurement_document: list[MeasurementDocumentItem]
     analytical_method_identifier: TStringValue | None = None
@@ -229,24 +230,24 @@ class MeasurementAggregateDocument:
     well_volume: TQuantityValueMicroliter | None = None
 
 
-@dataclass(kw_only=True)
-class QPCRDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class QPCRDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class QPCRAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class QPCRAggregateDocument(CustomInformationDocumentHolder):
     device_system_document: DeviceSystemDocument
     qPCR_document: list[QPCRDocumentItem]
     data_system_document: DataSystemDocument | None = None
     calculated_data_aggregate_document: TCalculatedDataAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     manifest: str = (
         "http://purl.allotrope.org/manifests/pcr/BENCHLING/2023/09/qpcr.manifest"
     )
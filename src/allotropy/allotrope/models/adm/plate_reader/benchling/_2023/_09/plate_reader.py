@@ -24,6 +24,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueUnitless,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TBooleanValue,
     TClass,
     TDatacube,
@@ -56,18 +57,18 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class CustomInformationDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CustomInformationDocumentItem(CustomInformationDocumentHolder):
     scalar_double_datum: TDoubleValue | None = None
     unit: TUnit | None = None
     scalar_string_datum: TStringValue | None = None
@@ -77,15 +78,15 @@ class CustomInformationDocumentItem:
     datum_label: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
@@ -280,13 +281,13 @@ class StatisticalFeature(Enum):
     stirring_rate = "stirring rate"
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: StatisticalFeature
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
@@ -298,14 +299,14 @@ class ScanPositionSettingPlateReader(Enum):
     top_scan_position__plate_reader_ = "top scan position (plate reader)"
 
 
-@dataclass(kw_only=True)
-class ImageDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ImageDocumentItem(CustomInformationDocumentHolder):
     experimental_data_identifier: TStringValue | None = None
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class OpticalImagingAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class OpticalImagingAggregateDocument(CustomInformationDocumentHolder):
     image_document: list[ImageDocumentItem]
 
 
@@ -315,8 +316,8 @@ class TransmittedLightSetting(Enum):
     phase_contrast = "phase contrast"
 
 
-@dataclass(kw_only=True)
-class Manifest:
+@dataclass(kw_only=True, slots=True)
+class Manifest(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -324,8 +325,8 @@ class Manifest:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -336,8 +337,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     device_identifier: TStringValue
     model_number: TStringValue
     asset_management_identifier: TStringValue | None = None
@@ -349,8 +350,8 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -360,8 +361,8 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -370,26 +371,26 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ImageFeatureDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ImageFeatureDocumentItem(CustomInformationDocumentHolder):
     image_feature_identifier: TStringValue
     image_feature_name: TStringValue | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     image_feature_result: TQuantityValueUnitless | None = None
 
 
-@dataclass(kw_only=True)
-class ImageFeatureAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ImageFeatureAggregateDocument(CustomInformationDocumentHolder):
     image_feature_document: list[ImageFeatureDocumentItem]
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     data_processing_document: dict[str, Any] | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     processed_data_identifier: TStringValue | None = None
@@ -397,18 +398,18 @@ class ProcessedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocumentModel:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocumentModel(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     location_identifier: TStringValue
     description: Any | None = None
@@ -421,8 +422,8 @@ class SampleDocument:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocument(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -440,7 +441,7 @@ class DeviceControlDocument:
     detector_carriage_speed_setting: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OpticalImagingDeviceControlDocumentItem(DeviceControlDocument):
     excitation_wavelength_setting: TQuantityValueNanometer | None = None
     detector_wavelength_setting: TQuantityValueNanometer | None = None
@@ -457,12 +458,12 @@ class OpticalImagingDeviceControlDocumentItem(DeviceControlDocument):
 OpticalImagingDeviceControlDocument = list[OpticalImagingDeviceControlDocumentItem]
 
 
-@dataclass(kw_only=True)
-class OpticalImagingDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class OpticalImagingDeviceControlAggregateDocument(CustomInformationDocumentHolder):
     device_control_document: OpticalImagingDeviceControlDocument | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
@@ -484,12 +485,14 @@ UltravioletAbsorbancePointDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: UltravioletAbsorbancePointDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FluorescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -504,12 +507,14 @@ FluorescencePointDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class FluorescencePointDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class FluorescencePointDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: FluorescencePointDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LuminescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -521,18 +526,20 @@ LuminescencePointDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class LuminescencePointDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class LuminescencePointDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: LuminescencePointDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
-class CustomInformationAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CustomInformationAggregateDocument(CustomInformationDocumentHolder):
     custom_information_document: list[CustomInformationDocumentItem]
 
 
-@dataclass(kw_only=True)
-class MeasurementDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementDocument(CustomInformationDocumentHolder):
     measurement_identifier: TStringValue
     device_control_aggregate_document: FluorescencePointDetectionDeviceControlAggregateDocument | LuminescencePointDetectionDeviceControlAggregateDocument | OpticalImagingDeviceControlAggregateDocument | UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -554,8 +561,8 @@ class MeasurementDocument:
     luminescence: TQuantityValueRelativeLightUnit | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_time: TDateTimeStampValue
     plate_well_count: TQuantityValueNumber
     measurement_document: list[MeasurementDocument]
@@ -573,15 +580,15 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class PlateReaderDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class PlateReaderDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class PlateReaderAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class PlateReaderAggregateDocument(CustomInformationDocumentHolder):
     plate_reader_document: list[PlateReaderDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
     data_system_document: DataSystemDocument | None = None
@@ -590,7 +597,7 @@ class PlateReaderAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: Manifest | str
     plate_reader_aggregate_document: PlateReaderAggregateDocument | None = None
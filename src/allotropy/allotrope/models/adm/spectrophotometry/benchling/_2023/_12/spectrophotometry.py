@@ -30,6 +30,7 @@ from allotropy.allotrope.models.shared.definitions.custom import (
     TQuantityValueSquareCentimetersPerGram,
 )
 from allotropy.allotrope.models.shared.definitions.definitions import (
+    CustomInformationDocumentHolder,
     TClass,
     TDatacube,
     TDateTimeStampValue,
@@ -58,25 +59,25 @@ class ContainerType(Enum):
     cell_holder = "cell holder"
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceDocumentItem(CustomInformationDocumentHolder):
     description: Any
 
 
-@dataclass(kw_only=True)
-class DiagnosticTraceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DiagnosticTraceAggregateDocument(CustomInformationDocumentHolder):
     diagnostic_trace_document: list[DiagnosticTraceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DataSourceDocumentItem(CustomInformationDocumentHolder):
     data_source_identifier: TStringValue
     data_source_feature: TStringValue
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DataSourceAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSourceAggregateDocument(CustomInformationDocumentHolder):
     data_source_document: list[DataSourceDocumentItem]
 
 
@@ -271,18 +272,18 @@ class StatisticalFeature(Enum):
     stirring_rate = "stirring rate"
 
 
-@dataclass(kw_only=True)
-class StatisticsDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class StatisticsDocumentItem(CustomInformationDocumentHolder):
     statistical_feature: StatisticalFeature
 
 
-@dataclass(kw_only=True)
-class StatisticsAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class StatisticsAggregateDocument(CustomInformationDocumentHolder):
     statistics_document: list[StatisticsDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class SampleDocument:
+@dataclass(kw_only=True, slots=True)
+class SampleDocument(CustomInformationDocumentHolder):
     sample_identifier: TStringValue
     description: Any | None = None
     batch_identifier: TStringValue | None = None
@@ -292,8 +293,8 @@ class SampleDocument:
     well_plate_identifier: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class Manifest:
+@dataclass(kw_only=True, slots=True)
+class Manifest(CustomInformationDocumentHolder):
     vocabulary: list[str]
     json_schemas: list[str]
     field_id: str | None = None
@@ -301,8 +302,8 @@ class Manifest:
     shapes: list[str] | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class DeviceDocumentItem(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     model_number: TStringValue | None = None
@@ -313,8 +314,8 @@ class DeviceDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class DeviceSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceSystemDocument(CustomInformationDocumentHolder):
     device_identifier: TStringValue
     model_number: TStringValue
     asset_management_identifier: TStringValue | None = None
@@ -326,8 +327,8 @@ class DeviceSystemDocument:
     device_document: list[DeviceDocumentItem] | None = None
 
 
-@dataclass(kw_only=True)
-class DataSystemDocument:
+@dataclass(kw_only=True, slots=True)
+class DataSystemDocument(CustomInformationDocumentHolder):
     data_system_instance_identifier: TStringValue | None = None
     file_name: TStringValue | None = None
     UNC_path: TStringValue | None = None
@@ -337,8 +338,8 @@ class DataSystemDocument:
     ASM_converter_version: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataDocumentItem(CustomInformationDocumentHolder):
     calculated_data_name: TStringValue
     calculated_result: TQuantityValue
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
@@ -347,19 +348,19 @@ class CalculatedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class CalculatedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class CalculatedDataAggregateDocument(CustomInformationDocumentHolder):
     calculated_data_document: list[CalculatedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DataProcessingDocument:
+@dataclass(kw_only=True, slots=True)
+class DataProcessingDocument(CustomInformationDocumentHolder):
     cell_path_length: TQuantityValueCentimeter | TQuantityValueMillimeter | None = None
     attenuation_coefficient: TQuantityValueSquareCentimetersPerGram | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataDocumentItem(CustomInformationDocumentHolder):
     data_processing_document: DataProcessingDocument | None = None
     data_source_aggregate_document: DataSourceAggregateDocument | None = None
     processed_data_identifier: TStringValue | None = None
@@ -369,13 +370,13 @@ class ProcessedDataDocumentItem:
     field_index: int | None = None
 
 
-@dataclass(kw_only=True)
-class ProcessedDataAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class ProcessedDataAggregateDocument(CustomInformationDocumentHolder):
     processed_data_document: list[ProcessedDataDocumentItem]
 
 
-@dataclass(kw_only=True)
-class DeviceControlDocument:
+@dataclass(kw_only=True, slots=True)
+class DeviceControlDocument(CustomInformationDocumentHolder):
     device_type: TStringValue
     device_identifier: TStringValue | None = None
     detection_type: TStringValue | None = None
@@ -387,7 +388,7 @@ class DeviceControlDocument:
     exposure_duration_setting: TQuantityValueSecondTime | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UltravioletAbsorbancePointDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
@@ -409,13 +410,17 @@ UltravioletAbsorbancePointDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: UltravioletAbsorbancePointDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
-class UltravioletAbsorbancePointDetectionMeasurementDocumentItems:
+@dataclass(kw_only=True, slots=True)
+class UltravioletAbsorbancePointDetectionMeasurementDocumentItems(
+    CustomInformationDocumentHolder
+):
     measurement_identifier: TStringValue
     device_control_aggregate_document: UltravioletAbsorbancePointDetectionDeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -428,7 +433,7 @@ class UltravioletAbsorbancePointDetectionMeasurementDocumentItems:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FluorescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -443,7 +448,7 @@ FluorescencePointDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class LuminescencePointDetectionDeviceControlDocumentItem(DeviceControlDocument):
     detector_wavelength_setting: TQuantityValueNanometer | None = None
     detector_bandwidth_setting: TQuantityValueNanometer | None = None
@@ -455,13 +460,17 @@ LuminescencePointDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class LuminescencePointDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class LuminescencePointDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: LuminescencePointDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
-class LuminescencePointDetectionMeasurementDocumentItems:
+@dataclass(kw_only=True, slots=True)
+class LuminescencePointDetectionMeasurementDocumentItems(
+    CustomInformationDocumentHolder
+):
     measurement_identifier: TStringValue
     device_control_aggregate_document: LuminescencePointDetectionDeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -475,7 +484,7 @@ class LuminescencePointDetectionMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UltravioletAbsorbanceSpectrumDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
@@ -487,12 +496,14 @@ UltravioletAbsorbanceSpectrumDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class UltravioletAbsorbanceSpectrumDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class UltravioletAbsorbanceSpectrumDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: UltravioletAbsorbanceSpectrumDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FluorescenceEmissionSpectrumDetectionDeviceControlDocumentItem(
     DeviceControlDocument
 ):
@@ -507,18 +518,24 @@ FluorescenceEmissionSpectrumDetectionDeviceControlDocument = list[
 ]
 
 
-@dataclass(kw_only=True)
-class FluorescenceEmissionSpectrumDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class FluorescenceEmissionSpectrumDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: FluorescenceEmissionSpectrumDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
-class FluorescencePointDetectionDeviceControlAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class FluorescencePointDetectionDeviceControlAggregateDocument(
+    CustomInformationDocumentHolder
+):
     device_control_document: FluorescencePointDetectionDeviceControlDocument
 
 
-@dataclass(kw_only=True)
-class FluorescencePointDetectionMeasurementDocumentItems:
+@dataclass(kw_only=True, slots=True)
+class FluorescencePointDetectionMeasurementDocumentItems(
+    CustomInformationDocumentHolder
+):
     measurement_identifier: TStringValue
     device_control_aggregate_document: FluorescencePointDetectionDeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -532,8 +549,10 @@ class FluorescencePointDetectionMeasurementDocumentItems:
     mass_concentration: TQuantityValuePicogramPerMilliliter | None = None
 
 
-@dataclass(kw_only=True)
-class UltravioletAbsorbanceSpectrumDetectionMeasurementDocumentItems:
+@dataclass(kw_only=True, slots=True)
+class UltravioletAbsorbanceSpectrumDetectionMeasurementDocumentItems(
+    CustomInformationDocumentHolder
+):
     measurement_identifier: TStringValue
     device_control_aggregate_document: UltravioletAbsorbanceSpectrumDetectionDeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -546,8 +565,10 @@ class UltravioletAbsorbanceSpectrumDetectionMeasurementDocumentItems:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(kw_only=True)
-class FluorescenceEmissionSpectrumDetectionMeasurementDocumentItems:
+@dataclass(kw_only=True, slots=True)
+class FluorescenceEmissionSpectrumDetectionMeasurementDocumentItems(
+    CustomInformationDocumentHolder
+):
     measurement_identifier: TStringValue
     device_control_aggregate_document: FluorescenceEmissionSpectrumDetectionDeviceControlAggregateDocument
     sample_document: SampleDocument
@@ -560,8 +581,8 @@ class FluorescenceEmissionSpectrumDetectionMeasurementDocumentItems:
     compartment_temperature: TQuantityValueDegreeCelsius | None = None
 
 
-@dataclass(kw_only=True)
-class MeasurementAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class MeasurementAggregateDocument(CustomInformationDocumentHolder):
     measurement_time: TDateTimeStampValue
     measurement_document: list[
         FluorescenceEmissionSpectrumDetectionMeasurementDocumentItems
@@ -577,15 +598,15 @@ class MeasurementAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class SpectrophotometryDocumentItem:
+@dataclass(kw_only=True, slots=True)
+class SpectrophotometryDocumentItem(CustomInformationDocumentHolder):
     measurement_aggregate_document: MeasurementAggregateDocument
     analyst: TStringValue | None = None
     submitter: TStringValue | None = None
 
 
-@dataclass(kw_only=True)
-class SpectrophotometryAggregateDocument:
+@dataclass(kw_only=True, slots=True)
+class SpectrophotometryAggregateDocument(CustomInformationDocumentHolder):
     spectrophotometry_document: list[SpectrophotometryDocumentItem]
     device_system_document: DeviceSystemDocument | None = None
     data_system_document: DataSystemDocument | None = None
@@ -594,8 +615,8 @@ class SpectrophotometryAggregateDocument:
     statistics_aggregate_document: StatisticsAggregateDocument | None = None
 
 
-@dataclass(kw_only=True)
-class Model:
+@dataclass(kw_only=True, slots=True)
+class Model(CustomInformationDocumentHolder):
     field_asm_manifest: Manifest | str
     spectrophotometry_aggregate_document: SpectrophotometryAggregateDocument | None = (
         None
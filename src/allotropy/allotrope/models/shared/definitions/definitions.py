@@ -4,9 +4,20 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 from allotropy.exceptions import AllotropeConversionError
 
 
+class CustomInformationDocumentHolder:
+    """Base of the generated models, which are slotted dataclasses.
+
+    Provides a slot for the custom information document that the converter attaches to models as an attribute.
+    """
+
+    __slots__ = ("custom_information_document",)
+
+
 @dataclass(kw_only=True)
 class TBooleanValueItem:
     field_type: TClass
@@ -204,6 +215,27 @@ class TDatacubeData:
             msg = "Exactly one of measures or points must be set on a datacube."
             raise AllotropeConversionError(msg)
 
+    def __eq__(self, other: object) -> bool:
+        # Dimensions and measures can be numpy arrays (see DataCube), which == compares value by value.
+        if not isinstance(other, TDatacubeData):
+            return NotImplemented
+        return (
+            _arrays_equal(self.dimensions, other.dimensions)
+            and _arrays_equal(self.measures, other.measures)
+            and self.points == other.points
+        )
+
+
+def _arrays_equal(left: list[Any] | None, right: list[Any] | None) -> bool:
+    if left is None or right is None:
+        return left is right
+    return len(left) == len(right) and all(
+        bool(np.array_equal(left_array, right_array))
+        if isinstance(left_array, np.ndarray) or isinstance(right_array, np.ndarray)
+        else left_array == right_array
+        for left_array, right_array in zip(left, right, strict=True)
+    )
+
 
 @dataclass(kw_only=True)
 class TDatacube:
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import Any
 
 from allotropy.allotrope.converter import add_custom_information_document
 from allotropy.allotrope.models.adm.cell_counting.rec._2024._09.cell_counting import (
@@ -121,8 +122,8 @@ class Data:
     measurement_groups: list[MeasurementGroup]
 
 
-def has_value(model: object) -> bool:
-    return any(value is not None for value in model.__dict__.values())
+def has_value(model: Any) -> bool:
+    return any(getattr(model, field.name) is not None for field in fields(model))
 
 
 class Mapper(SchemaMapper[Data, Model]):
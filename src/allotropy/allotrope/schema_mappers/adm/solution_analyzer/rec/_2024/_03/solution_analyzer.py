@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any
 
 from allotropy.allotrope.models.adm.solution_analyzer.rec._2024._03.solution_analyzer import (
@@ -301,7 +301,10 @@ class Mapper(SchemaMapper[Data, Model]):
             else None,
         )
 
-        if all(value is None for value in processed_data_document.__dict__.values()):
+        if all(
+            getattr(processed_data_document, field.name) is None
+            for field in fields(processed_data_document)
+        ):
             return None
 
         return ProcessedDataAggregateDocument(
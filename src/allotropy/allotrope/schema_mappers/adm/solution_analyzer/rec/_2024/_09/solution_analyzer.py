@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any
 
 from allotropy.allotrope.converter import add_custom_information_document
@@ -430,7 +430,10 @@ class Mapper(SchemaMapper[Data, Model]):
             None,
         )
 
-        if all(value is None for value in processed_data_document.__dict__.values()):
+        if all(
+            getattr(processed_data_document, field.name) is None
+            for field in fields(processed_data_document)
+        ) and not hasattr(processed_data_document, "custom_information_document"):
             return None
 
         return ProcessedDataAggregateDocument(
@@ -1,6 +1,11 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Protocol, TypeVar
+from typing import Any, Protocol, TypeVar
+
+import numpy as np
+import numpy.typing as npt
 
 from allotropy.allotrope.models.shared.definitions.definitions import (
     FieldComponentDatatype,
@@ -10,9 +15,18 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
     TDimensionArray,
     TFunction,
     TMeasureArray,
+    Type,
 )
 from allotropy.exceptions import AllotropeConversionError
 
+# Default relative tolerance (of the largest absolute value) for evenly spaced dimension values.
+DEFAULT_LINEAR_TOLERANCE = 1e-9
+# Minimum number of values in a dimension to encode it as a linear function.
+MIN_LINEAR_LENGTH = 10
+_LINEAR_TOLERANCE: ContextVar[float | None] = ContextVar(
+    "linear_tolerance", default=None
+)
+
 
 @dataclass(frozen=True)
 class DataCubeComponent:
@@ -21,14 +35,25 @@ class DataCubeComponent:
     unit: str
 
 
+# Dimensions and measures can be numpy arrays. Arrays with a numeric, bool or str dtype are passed to the
+# model as is (cast to float, unless str) and only converted to lists when the model is unstructured. Other
+# arrays (e.g. of objects) are checked value by value, like lists.
+DataCubeArray = npt.NDArray[Any]
+
+
 @dataclass(frozen=True)
 class DataCube:
     label: str
     structure_dimensions: list[DataCubeComponent]
     structure_measures: list[DataCubeComponent]
-    dimensions: Sequence[Sequence[float] | Sequence[str] | Sequence[bool]]
+    dimensions: Sequence[
+        Sequence[float] | Sequence[str] | Sequence[bool] | DataCubeArray
+    ]
     measures: Sequence[
-        Sequence[float | None] | Sequence[str | None] | Sequence[bool | None]
+        Sequence[float | None]
+        | Sequence[str | None]
+        | Sequence[bool | None]
+        | DataCubeArray
     ]
 
 
@@ -52,6 +77,15 @@ def _is_type(type_: type[T], value: float | str | int) -> bool:
     return isinstance(value, type_) or type_ is float and isinstance(value, int)
 
 
+def _get_typed_array(values: DataCubeArray) -> Any | None:
+    # Ints and bools are converted to floats, as they are for lists (see _is_type).
+    if values.dtype.kind in "biuf":
+        return values.astype(np.float64, copy=False)
+    if values.dtype.kind == "U":
+        return values
+    return None
+
+
 def _get_typed_dimension(
     type_: type[T], values: Sequence[float | str | bool]
 ) -> list[T] | None:
@@ -66,21 +100,80 @@ def _get_typed_dimension(
     return result if len(result) == len(values) else None
 
 
+def _get_dimension(values: Sequence[float | str | bool]) -> TDimensionArray:
+    # Only probe the next type if the values are not all of the previous one.
+    float_list = _get_typed_dimension(float, values)
+    if float_list is not None:
+        return float_list
+    str_list = _get_typed_dimension(str, values)
+    if str_list is not None:
+        return str_list
+    bool_list = _get_typed_dimension(bool, values)
+    # NOTE: given the input types, this should be impossible, however, typing does not believe this, so we
+    # add this check.
+    if bool_list is None:
+        msg = f"Unable to extract a TDimensionArray from datacube dimension: {values}"
+        raise AllotropeConversionError(msg)
+    return bool_list
+
+
+@contextmanager
+def encode_linear_dimensions(
+    tolerance: float = DEFAULT_LINEAR_TOLERANCE,
+) -> Iterator[None]:
+    """Encode evenly spaced numeric dimensions of data cubes created in this context as linear functions."""
+    token = _LINEAR_TOLERANCE.set(tolerance)
+    try:
+        yield
+    finally:
+        _LINEAR_TOLERANCE.reset(token)
+
+
+def _get_linear_function(
+    dimension: TDimensionArray | DataCubeArray, tolerance: float
+) -> TFunction | None:
+    # The function is only shorter than the values it replaces for longer dimensions.
+    if len(dimension) < MIN_LINEAR_LENGTH:
+        return None
+    if isinstance(dimension, np.ndarray):
+        if dimension.dtype.kind != "f":
+            return None
+        values = dimension
+    elif all(isinstance(value, float) for value in dimension):
+        values = np.array(dimension, dtype=np.float64)
+    else:
+        return None
+
+    start = float(values[0])
+    incr = float(values[-1] - values[0]) / (len(values) - 1)
+    if not incr:
+        return None
+    error = np.abs(values - (start + incr * np.arange(len(values)))).max()
+    if not error <= tolerance * np.abs(values).max():
+        return None
+    return TFunction(type=Type.linear, start=start, length=len(values), incr=incr)
+
+
 def _get_dimensions(
-    dimensions: Sequence[Sequence[float] | Sequence[str] | Sequence[bool]],
+    dimensions: Sequence[
+        Sequence[float] | Sequence[str] | Sequence[bool] | DataCubeArray
+    ],
+    linear_tolerance: float | None = None,
 ) -> list[TDimensionArray | TFunction]:
     result: list[TDimensionArray | TFunction] = []
     for dimension in dimensions:
-        float_list = _get_typed_dimension(float, dimension)
-        str_list = _get_typed_dimension(str, dimension)
-        bool_list = _get_typed_dimension(bool, dimension)
-        # NOTE: given the input types, this should be impossible, however, typing does not believe this, so we
-        # add this check. This allows us to safely put "or []" at the end of result.append, confident that all
-        # 3 lists are only falsy if the input is empty.
-        if float_list is None and str_list is None and bool_list is None:
-            msg = f"Unable to extract a TDimensionArray from datacube dimension: {dimension}"
-            raise AllotropeConversionError(msg)
-        result.append(float_list or str_list or bool_list or [])
+        values: TDimensionArray | DataCubeArray
+        if isinstance(dimension, np.ndarray):
+            array = _get_typed_array(dimension)
+            values = _get_dimension(dimension.tolist()) if array is None else array
+        else:
+            values = _get_dimension(dimension)
+        function = (
+            None
+            if linear_tolerance is None
+            else _get_linear_function(values, linear_tolerance)
+        )
+        result.append(values if function is None else function)
     return result
 
 
@@ -97,32 +190,57 @@ def _get_typed_measure(
     return result if len(result) == len(values) else None
 
 
+def _get_measure(values: Sequence[float | str | bool | None]) -> TMeasureArray:
+    # Only probe the next type if the values are not all of the previous one.
+    float_list = _get_typed_measure(float, values)
+    if float_list is not None:
+        return float_list
+    str_list = _get_typed_measure(str, values)
+    if str_list is not None:
+        return str_list
+    bool_list = _get_typed_measure(bool, values)
+    # NOTE: given the input types, this should be impossible, however, typing does not believe us, so we
+    # add this check.
+    if bool_list is None:
+        msg = f"Unable to extract a TMeasureArray from datacube measure: {values}"
+        raise AllotropeConversionError(msg)
+    return bool_list
+
+
 def _get_measures(
     measures: Sequence[
-        Sequence[float | None] | Sequence[str | None] | Sequence[bool | None]
+        Sequence[float | None]
+        | Sequence[str | None]
+        | Sequence[bool | None]
+        | DataCubeArray
     ],
 ) -> list[TMeasureArray]:
     result: list[TMeasureArray] = []
     for measure in measures:
-        float_list = _get_typed_measure(float, measure)
-        str_list = _get_typed_measure(str, measure)
-        bool_list = _get_typed_measure(bool, measure)
-        # NOTE: given the input types, this should be impossible, however, typing does not believe us, so we
-        # add
-        # this check. This allows us to safely put "or []" at the end of result.append, confident that all
-        # 3 lists are only falsy if the input is empty.
-        if float_list is None and str_list is None and bool_list is None:
-            msg = f"Unable to extract a TMeasureArray from datacube measure: {measure}"
-            raise AllotropeConversionError(msg)
-        result.append(float_list or str_list or bool_list or [])
+        if isinstance(measure, np.ndarray):
+            array = _get_typed_array(measure)
+            result.append(_get_measure(measure.tolist()) if array is None else array)
+        else:
+            result.append(_get_measure(measure))
     return result
 
 
 def get_data_cube(
-    data_cube: DataCube | None, data_cube_class: type[DataCubeType]
+    data_cube: DataCube | None,
+    data_cube_class: type[DataCubeType],
+    *,
+    linear_tolerance: float | None = None,
 ) -> DataCubeType | None:
+    """
+    Creates the data cube model for a data cube
+    :param linear_tolerance: if set, numeric dimensions whose values are evenly spaced within this tolerance
+        (relative to the largest absolute value) are encoded as linear functions rather than arrays. Defaults
+        to the tolerance set by encode_linear_dimensions, if any.
+    """
     if data_cube is None:
         return None
+    if linear_tolerance is None:
+        linear_tolerance = _LINEAR_TOLERANCE.get()
     return data_cube_class(
         label=data_cube.label,
         cube_structure=TDatacubeStructure(
@@ -144,7 +262,7 @@ def get_data_cube(
             ],
         ),
         data=TDatacubeData(
-            dimensions=_get_dimensions(data_cube.dimensions),
+            dimensions=_get_dimensions(data_cube.dimensions, linear_tolerance),
             measures=_get_measures(data_cube.measures),
         ),
     )
@@ -28,9 +28,10 @@ from allotropy.allotrope.schema_parser.path_util import (
     MODEL_DIR_PATH,
     SCHEMA_DIR_PATH,
 )
+from allotropy.allotrope.schema_parser.schema_bundler import write_schema_bundle
 from allotropy.allotrope.schema_parser.schema_cleaner import SchemaCleaner
 from allotropy.allotrope.schema_parser.update_units import update_unit_files
-from allotropy.allotrope.schemas import get_schema
+from allotropy.allotrope.schemas import get_schema, get_schema_source_hash
 
 
 def lint_file(model_path: Path) -> None:
@@ -144,8 +145,8 @@ def generate_schemas(
     dry_run: bool | None = False,
     schema_regex: str | None = None,
 ) -> list[str]:
-    """Generate schemas from JSON schema files.
-    :dry_run: If true, does not save changes to any models, but still returns the list of models that would change.
+    """Generate schemas from JSON schema files, and rebuild their schema bundles.
+    :dry_run: If true, does not save changes to any models or bundles, but still returns the list of models that would change.
     :schema_regex: If set, filters schemas to generate using regex.
     :return: A list of model files that were changed.
     """
@@ -179,4 +180,29 @@ def generate_schemas(
             if path.suffix == ".py":
                 lint_file(path)
 
+    # Bundles are built from the schemas and the shared definitions (including the units updated above), so
+    # rebuild them to match.
+    if not dry_run:
+        generate_schema_bundles(schema_regex=schema_regex)
+
     return models_changed
+
+
+def generate_schema_bundles(schema_regex: str | None = None) -> list[Path]:
+    """Write a $ref-free bundle for each schema, to be loaded at runtime for validation.
+    :schema_regex: If set, filters schemas to bundle using regex.
+    :return: A list of bundle files that were written.
+    """
+    bundle_paths = []
+    for schema_path in Path(SCHEMA_DIR_PATH, "adm").rglob("*.schema.json"):
+        if not _should_generate_schema(schema_path, schema_regex):
+            continue
+        print(f"Bundling schema: {get_rel_schema_path(schema_path)}...")  # noqa: T201
+        bundle_paths.append(
+            write_schema_bundle(
+                schema_path,
+                get_schema(schema_path),
+                get_schema_source_hash(schema_path),
+            )
+        )
+    return bundle_paths
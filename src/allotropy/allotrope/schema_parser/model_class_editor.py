@@ -21,6 +21,10 @@ from allotropy.parsers.utils.values import assert_not_none
 
 SCHEMA_DIR_PATH = "src/allotropy/allotrope/schemas"
 SHARED_FOLDER_MODULE = "allotropy.allotrope.models.shared"
+# Generated dataclasses are slotted, so classes that do not inherit from another generated class inherit from this
+# base, which has a slot for the custom information document the converter can attach to any model.
+MODEL_BASE_CLASS_MODULE = "definitions.definitions"
+MODEL_BASE_CLASS = "CustomInformationDocumentHolder"
 
 
 def _values_equal(value1: Any, value2: Any) -> bool:
@@ -322,7 +326,10 @@ class DataClassLines(ClassLines):
         is_frozen: bool | None = False,  # noqa: FBT002
     ) -> DataClassLines:
         # Recreate lines with no whitespace from parsed values
-        kwargs = ({"frozen": True} if is_frozen else {}) | {"kw_only": True}
+        kwargs = ({"frozen": True} if is_frozen else {}) | {
+            "kw_only": True,
+            "slots": True,
+        }
         kwargs_string = ",".join(f"{key}={value}" for key, value in kwargs.items())
         lines = [f"@dataclass({kwargs_string})"]
 
@@ -731,8 +738,19 @@ class ModelClassEditor:
         return new
 
 
+def add_model_base_class(file_contents: str) -> str:
+    # Add the base class to dataclasses without parent classes.
+    return re.sub(
+        r"^(@dataclass\(.*\)\nclass \w+):$",
+        rf"\g<1>({MODEL_BASE_CLASS}):",
+        file_contents,
+        flags=re.MULTILINE,
+    )
+
+
 def modify_file(model_path: Path, schema: dict[str, Any]) -> None:
     classes_to_skip, imports_to_add = get_shared_schema_info(schema)
+    imports_to_add.setdefault(MODEL_BASE_CLASS_MODULE, set()).add(MODEL_BASE_CLASS)
     schema_path = get_schema_path_from_model_path(get_original_path(model_path))
     manifest = get_manifest_from_schema_path(schema_path)
     editor = ModelClassEditor(
@@ -743,4 +761,4 @@ def modify_file(model_path: Path, schema: dict[str, Any]) -> None:
         contents = f.read()
 
     with open(model_path, "w") as f:
-        f.write(editor.modify_file(contents))
+        f.write(add_model_base_class(editor.modify_file(contents)))
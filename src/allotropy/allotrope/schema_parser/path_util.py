@@ -8,6 +8,7 @@ ALLOTROPE_DIR: Path = Path(__file__).parent.parent
 ALLOTROPY_DIR: Path = ALLOTROPE_DIR.parent
 ROOT_DIR: Path = ALLOTROPE_DIR.parent.parent.parent
 SCHEMA_DIR_PATH: Path = Path(ALLOTROPE_DIR, "schemas")
+SCHEMA_BUNDLE_DIR_PATH: Path = Path(ALLOTROPE_DIR, "schema_bundles")
 SHARED_SCHEMAS_PATH: Path = Path(SCHEMA_DIR_PATH, "shared")
 SHARED_SCHEMAS_DEFINITIONS_PATH: Path = Path(SHARED_SCHEMAS_PATH, "definitions")
 MODEL_DIR_PATH: Path = Path(ALLOTROPE_DIR, "models")
@@ -69,6 +70,10 @@ def get_schema_path_from_manifest(manifest: str) -> Path:
     return Path(f"adm/{match.groups()[0]}.schema.json")
 
 
+def get_schema_bundle_path_from_manifest(manifest: str) -> Path:
+    return Path(SCHEMA_BUNDLE_DIR_PATH, get_schema_path_from_manifest(manifest))
+
+
 def get_schema_path_from_reference(reference: str) -> Path:
     ref_match = re.match(r"http://purl.allotrope.org/json-schemas/(.*)", reference)
     if not ref_match:
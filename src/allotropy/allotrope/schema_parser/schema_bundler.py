@@ -0,0 +1,169 @@
+import json
+from pathlib import Path
+from typing import Any
+import urllib.parse
+
+from allotropy.allotrope.schema_parser.path_util import (
+    get_manifest_from_schema_path,
+    get_schema_bundle_path_from_manifest,
+)
+from allotropy.constants import DEFAULT_ENCODING
+
+# Keys whose values are data, not subschemas, and so must never be searched for $id or $ref.
+_LITERAL_KEYS = ("const", "default", "enum", "examples")
+# Keys that only exist to hold referenced definitions, which are inlined in the bundle.
+_DEFINITION_KEYS = ("$defs", "$custom")
+# Keys of a bundle file: the hash of the files the bundle was built from, and the bundle itself.
+SOURCE_HASH_KEY = "source hash"
+BUNDLE_KEY = "bundle"
+
+
+def _unescape_pointer_part(part: str) -> str:
+    return urllib.parse.unquote(part).replace("~1", "/").replace("~0", "~")
+
+
+def _resolve_pointer(document: Any, pointer: str) -> Any:
+    for part in pointer.lstrip("/").split("/") if pointer else []:
+        key = _unescape_pointer_part(part)
+        document = document[int(key)] if isinstance(document, list) else document[key]
+    return document
+
+
+def _get_resources(schema: dict[str, Any]) -> dict[str, Any]:
+    """Get all schema resources (subschemas with an $id) embedded in schema, keyed by absolute URI."""
+    resources: dict[str, Any] = {"": schema}
+
+    def _add_resources(node: Any, base_uri: str) -> None:
+        if isinstance(node, dict):
+            if "$id" in node:
+                base_uri = urllib.parse.urljoin(base_uri, node["$id"])
+                resources[base_uri] = node
+            for key, value in node.items():
+                if key not in _LITERAL_KEYS:
+                    _add_resources(value, base_uri)
+        elif isinstance(node, list):
+            for value in node:
+                _add_resources(value, base_uri)
+
+    _add_resources(schema, "")
+    return resources
+
+
+def _get_shared_definition_pointers(schema: dict[str, Any]) -> dict[str, str]:
+    """Get the pointers to the shared definitions added to schema (see add_definitions), by definition name.
+
+    Units can also be looked up by their symbol, as schemas refer to units by symbol (e.g. units.schema#/$defs/µm)
+    while the shared units are named after their IRI (e.g. Micrometer).
+    """
+    pointers: dict[str, str] = {}
+    for section in reversed(_DEFINITION_KEYS):
+        for name, definition in schema.get(section, {}).items():
+            pointers[name] = f"/{section}/{name}"
+            unit = definition.get("properties", {}).get("unit", {})
+            if isinstance(unit, dict) and "const" in unit:
+                pointers.setdefault(unit["const"], f"/{section}/{name}")
+    return pointers
+
+
+def bundle_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of schema with every resolvable $ref replaced by the schema it references.
+
+    Each reference target is dereferenced once and the result is shared by all references to it, so the
+    bundle does not grow with the number of times a definition is used. A $ref with sibling keywords is
+    rewritten as an allOf, which is how draft 2020-12 evaluates it.
+
+    A reference to a schema that is not embedded (e.g. another version of the units schema), or to a definition
+    missing from the embedded one, is resolved by its definition name against the shared definitions, units and
+    custom definitions, as the schema cleaner does for the models. This includes the TODO placeholders in working
+    draft schemas, for which there is a TODO unit. Only references that are not found there either are left as
+    is (see get_unresolved_references).
+    """
+    resources = _get_resources(schema)
+    shared_pointers = _get_shared_definition_pointers(schema)
+    root_uri = schema.get("$id", "")
+    dereferenced: dict[str, Any] = {}
+
+    def _dereference(node: Any, base_uri: str, visiting: frozenset[str]) -> Any:
+        if isinstance(node, list):
+            return [_dereference(value, base_uri, visiting) for value in node]
+        if not isinstance(node, dict):
+            return node
+        if "$id" in node:
+            base_uri = urllib.parse.urljoin(base_uri, node["$id"])
+
+        bundled = {
+            key: value
+            if key in _LITERAL_KEYS
+            else _dereference(value, base_uri, visiting)
+            for key, value in node.items()
+            if key not in (*_DEFINITION_KEYS, "$id", "$ref")
+        }
+        if "$ref" not in node:
+            return bundled
+
+        reference = urllib.parse.urljoin(base_uri, node["$ref"])
+        if reference in visiting:
+            msg = f"Unable to bundle schema with recursive reference: {reference}"
+            raise AssertionError(msg)
+        if reference not in dereferenced:
+            uri, _, pointer = reference.partition("#")
+            try:
+                target = _resolve_pointer(resources[uri], pointer)
+            except (KeyError, IndexError, ValueError):
+                name = _unescape_pointer_part(reference.rsplit("/", 1)[-1])
+                if name not in shared_pointers:
+                    return {**bundled, "$ref": reference}
+                uri = root_uri
+                target = _resolve_pointer(schema, shared_pointers[name])
+            dereferenced[reference] = _dereference(target, uri, visiting | {reference})
+
+        if not bundled:
+            return dereferenced[reference]
+        return {
+            **bundled,
+            "allOf": [*bundled.get("allOf", []), dereferenced[reference]],
+        }
+
+    bundle: dict[str, Any] = _dereference(schema, "", frozenset())
+    if "$id" in schema:
+        bundle["$id"] = schema["$id"]
+    return bundle
+
+
+def get_unresolved_references(bundle: Any) -> set[str]:
+    """Get all references left in a bundle, i.e. references that could not be resolved within the schema."""
+    if isinstance(bundle, list):
+        return set().union(*(get_unresolved_references(value) for value in bundle))
+    if not isinstance(bundle, dict):
+        return set()
+    references = {bundle["$ref"]} if "$ref" in bundle else set()
+    return references.union(
+        *(
+            get_unresolved_references(value)
+            for key, value in bundle.items()
+            if key not in _LITERAL_KEYS
+        )
+    )
+
+
+def write_schema_bundle(
+    schema_path: Path, schema: dict[str, Any], source_hash: str
+) -> Path:
+    """Write the bundle of schema, along with the hash of its source files so that it is not used once stale."""
+    bundle = bundle_schema(schema)
+    # Validating against a bundle must never need to fetch a referenced schema.
+    unresolved_references = get_unresolved_references(bundle)
+    if unresolved_references:
+        msg = f"Unable to bundle schema {schema_path} with unresolved references: {sorted(unresolved_references)}"
+        raise AssertionError(msg)
+    bundle_path = get_schema_bundle_path_from_manifest(
+        get_manifest_from_schema_path(schema_path)
+    )
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(bundle_path, "w", encoding=DEFAULT_ENCODING) as f:
+        json.dump(
+            {SOURCE_HASH_KEY: source_hash, BUNDLE_KEY: bundle},
+            f,
+            ensure_ascii=False,
+        )
+    return bundle_path
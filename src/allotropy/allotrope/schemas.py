@@ -1,14 +1,32 @@
+from collections.abc import Iterable
+from functools import cache
+import hashlib
 import json
 from pathlib import Path
 from typing import Any
 
+import jsonschema
+
 from allotropy.allotrope.schema_parser.path_util import (
     get_full_schema_path,
+    get_schema_bundle_path_from_manifest,
     get_schema_path_from_manifest,
     SHARED_SCHEMAS_DEFINITIONS_PATH,
 )
+from allotropy.allotrope.schema_parser.schema_bundler import (
+    BUNDLE_KEY,
+    bundle_schema,
+    SOURCE_HASH_KEY,
+)
 from allotropy.constants import DEFAULT_ENCODING
 
+# Shared definition files added to every schema, and the section of the schema they are added to.
+_SHARED_DEFINITIONS = (
+    ("definitions", "defs"),
+    ("units", "defs"),
+    ("custom", "custom"),
+)
+
 
 def get_shared_definitions() -> dict[str, Any]:
     with open(
@@ -26,11 +44,7 @@ def get_shared_unit_definitions() -> dict[str, Any]:
 
 
 def add_definitions(schema: dict[str, Any]) -> dict[str, Any]:
-    for file, section in [
-        ("definitions", "defs"),
-        ("units", "defs"),
-        ("custom", "custom"),
-    ]:
+    for file, section in _SHARED_DEFINITIONS:
         existing = schema.get(f"${section}", {})
         with open(
             Path(SHARED_SCHEMAS_DEFINITIONS_PATH, f"{file}.json"),
@@ -51,9 +65,69 @@ def get_schema_from_manifest(manifest: str) -> dict[str, Any]:
     return get_schema(get_schema_path_from_manifest(manifest))
 
 
-def get_schema_from_model(model: Any) -> dict[str, Any]:
+def get_schema_source_hash(schema_path: Path) -> str:
+    """Return a hash of the files the bundle of schema_path is built from: the schema and the shared definitions."""
+    digest = hashlib.sha256()
+    for path in [
+        get_full_schema_path(schema_path),
+        *(
+            Path(SHARED_SCHEMAS_DEFINITIONS_PATH, f"{file}.json")
+            for file, _ in _SHARED_DEFINITIONS
+        ),
+    ]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_schema_bundle_from_manifest(manifest: str) -> dict[str, Any]:
+    """Return the $ref-free schema bundle for manifest.
+
+    Uses the pre-built bundle if one was generated (see scripts/bundle_schemas.py) from the current schema and
+    shared definitions, otherwise bundles the schema in memory.
+    """
+    bundle_path = get_schema_bundle_path_from_manifest(manifest)
+    if bundle_path.exists():
+        with open(bundle_path, encoding=DEFAULT_ENCODING) as f:
+            bundle_file = json.load(f)
+        source_hash = get_schema_source_hash(get_schema_path_from_manifest(manifest))
+        if (
+            isinstance(bundle_file, dict)
+            and bundle_file.get(SOURCE_HASH_KEY) == source_hash
+        ):
+            return bundle_file[BUNDLE_KEY]  # type: ignore[no-any-return]
+    return bundle_schema(get_schema_from_manifest(manifest))
+
+
+def _get_manifest_from_model(model: Any) -> str:
     manifest = getattr(model, "manifest", getattr(model, "field_asm_manifest", None))
     if not manifest:
         msg = f"No 'manifest' or 'field_asm_manifest' found in model: {type(model)}"
         raise ValueError(msg)
-    return get_schema_from_manifest(manifest)
+    return str(manifest)
+
+
+def get_schema_from_model(model: Any) -> dict[str, Any]:
+    return get_schema_from_manifest(_get_manifest_from_model(model))
+
+
+@cache
+def get_schema_validator(manifest: str) -> jsonschema.protocols.Validator:
+    """Return a compiled validator for the schema of manifest.
+
+    The schema bundle is loaded, checked and compiled once per process, and the validator is reused for every
+    subsequent validation against the same manifest. The bundles of the schemas in this package have every
+    reference resolved (which is tested for each of them), so the validator never has to resolve or fetch one.
+    """
+    schema = get_schema_bundle_from_manifest(manifest)
+    validator_cls = jsonschema.validators.Draft202012Validator
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def get_schema_validator_from_model(model: Any) -> jsonschema.protocols.Validator:
+    return get_schema_validator(_get_manifest_from_model(model))
+
+
+def warm_schema_validators(manifests: Iterable[str]) -> None:
+    for manifest in manifests:
+        get_schema_validator(manifest)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import tzinfo
+import glob
+import os
+from pathlib import Path, PureWindowsPath
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from allotropy.constants import DEFAULT_ENCODING
+from allotropy.exceptions import AllotropeConversionError
+from allotropy.parser_factory import Vendor, warm_vendor_schema_validators
+from allotropy.to_allotrope import (
+    allotrope_from_file,
+    allotrope_to_stream,
+    VendorType,
+)
+
+DEFAULT_CHUNK_SIZE = 8
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The result of converting one file in a batch.
+
+    Exactly one of error and (allotrope_dict or output_path) is set. allotrope_dict is only set when the batch is
+    not written to an output directory.
+    """
+
+    filepath: str
+    vendor: Vendor | None = None
+    allotrope_dict: dict[str, Any] | None = None
+    output_path: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _expand_paths(paths: Iterable[str | Path]) -> list[str]:
+    filepaths = []
+    for path in paths:
+        if glob.has_magic(str(path)):
+            filepaths.extend(sorted(glob.glob(str(path), recursive=True)))
+        else:
+            filepaths.append(str(path))
+    return [filepath for filepath in filepaths if not Path(filepath).is_dir()]
+
+
+def _get_vendor(filepath: str, vendor_type: VendorType | None) -> Vendor:
+    if vendor_type is not None:
+        return Vendor(vendor_type)
+    extension = PureWindowsPath(filepath).suffix.lower()
+    vendors = [
+        vendor
+        for vendor in Vendor
+        if vendor != Vendor.EXAMPLE_WEYLAND_YUTANI
+        and extension[1:] in (ext.lower() for ext in vendor.supported_extensions)
+    ]
+    if not vendors:
+        msg = f"No parser supports the '{extension}' file extension."
+        raise AllotropeConversionError(msg)
+    if len(vendors) > 1:
+        msg = f"Several parsers support the '{extension}' file extension, set the vendor to one of: {', '.join(vendor.name for vendor in vendors)}."
+        raise AllotropeConversionError(msg)
+    return vendors[0]
+
+
+def _get_output_path(filepath: str, input_root: str, output_dir: str) -> Path:
+    relative_dir = Path(filepath).parent.resolve().relative_to(input_root)
+    # Keep the extension of the input, so that inputs with the same name but different extensions (e.g. run.txt
+    # and run.csv) are written to different files.
+    return Path(output_dir, relative_dir, f"{Path(filepath).name}.json")
+
+
+def _convert_file(
+    filepath: str,
+    vendor: Vendor,
+    output_path: Path | None,
+    default_timezone: tzinfo | None,
+    encoding: str | None,
+) -> BatchResult:
+    if output_path is None:
+        return BatchResult(
+            filepath,
+            vendor,
+            allotrope_dict=allotrope_from_file(
+                filepath, vendor, default_timezone, encoding
+            ),
+        )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(filepath, "rb") as f, open(
+            output_path, "w", encoding=DEFAULT_ENCODING
+        ) as out:
+            allotrope_to_stream(f, filepath, vendor, out, default_timezone, encoding)
+    except FileNotFoundError as e:
+        # Do not leave a partial document behind.
+        output_path.unlink(missing_ok=True)
+        msg = f"File not found: {filepath}."
+        raise AllotropeConversionError(msg) from e
+    except Exception:
+        output_path.unlink(missing_ok=True)
+        raise
+    return BatchResult(filepath, vendor, output_path=str(output_path))
+
+
+def _convert_files(
+    filepaths: list[str],
+    vendor_type: VendorType | None,
+    input_root: str | None,
+    output_dir: str | None,
+    default_timezone: tzinfo | None,
+    encoding: str | None,
+) -> list[BatchResult]:
+    results = []
+    for filepath in filepaths:
+        output_path = (
+            None
+            if output_dir is None or input_root is None
+            else _get_output_path(filepath, input_root, output_dir)
+        )
+        try:
+            vendor = _get_vendor(filepath, vendor_type)
+            results.append(
+                _convert_file(filepath, vendor, output_path, default_timezone, encoding)
+            )
+        except Exception as e:
+            results.append(BatchResult(filepath, error=str(e)))
+    return results
+
+
+def _init_worker(vendor_type: VendorType | None) -> None:
+    # Compile the schema validator before the first file arrives. When the vendor is detected per file, validators
+    # are compiled as they are needed instead of compiling every schema in every worker. Either way, validators
+    # and converter hooks are cached in the worker process between chunks.
+    if vendor_type is not None:
+        warm_vendor_schema_validators([Vendor(vendor_type)])
+
+
+def allotrope_from_files(
+    paths: Iterable[str | Path],
+    vendor_type: VendorType | None = None,
+    *,
+    output_dir: str | Path | None = None,
+    max_workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    default_timezone: tzinfo | None = None,
+    encoding: str | None = None,
+) -> Iterator[BatchResult]:
+    """Convert many files to ASM in parallel, yielding a BatchResult for each file as it completes.
+
+    paths can contain glob patterns (** is supported). If vendor_type is None, each file is converted with the
+    parser for its file extension, which fails for extensions that several parsers support. Files are sent to a
+    pool of max_workers processes in chunks of chunk_size files, and each worker keeps its schema validators and
+    converter hooks between chunks.
+
+    If output_dir is set, each ASM document is streamed to a file in it named after the input file with .json
+    appended (e.g. run.csv.json), mirroring the directory layout of the input files, and results only hold the
+    output path. Otherwise, results hold the ASM dicts, which have to be sent back from the workers.
+
+    A file that fails to convert does not stop the batch: the error is reported in its result instead. The same
+    goes for a chunk that fails as a whole (e.g. when its worker process dies): each of its files gets an error
+    result.
+    """
+    filepaths = _expand_paths(paths)
+    if not filepaths:
+        return
+    if vendor_type is not None:
+        # Fail early rather than once per file.
+        try:
+            Vendor(vendor_type)
+        except ValueError as e:
+            msg = f"Failed to create parser, unregistered vendor: {vendor_type}."
+            raise AllotropeConversionError(msg) from e
+    input_root = (
+        os.path.commonpath([str(Path(path).parent.resolve()) for path in filepaths])
+        if output_dir is not None
+        else None
+    )
+    chunk_size = max(chunk_size, 1)
+    chunks = [
+        filepaths[index : index + chunk_size]
+        for index in range(0, len(filepaths), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(vendor_type,)
+    ) as executor:
+        futures = {
+            executor.submit(
+                _convert_files,
+                chunk,
+                vendor_type,
+                input_root,
+                None if output_dir is None else str(output_dir),
+                default_timezone,
+                encoding,
+            ): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                error = f"Failed to convert chunk: {type(e).__name__}: {e}"
+                results = [
+                    BatchResult(filepath, error=error) for filepath in futures[future]
+                ]
+            yield from results
+
+
+def _get_timezone(key: str) -> ZoneInfo:
+    try:
+        return ZoneInfo(key)
+    except (ValueError, ZoneInfoNotFoundError) as e:
+        msg = f"unknown timezone: '{key}'"
+        raise argparse.ArgumentTypeError(msg) from e
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="allotropy-batch",
+        description="Convert instrument files to ASM JSON files in parallel.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Files or glob patterns (** is supported)."
+    )
+    parser.add_argument(
+        "-o", "--output-dir", required=True, help="Directory to write ASM files to."
+    )
+    parser.add_argument(
+        "-v",
+        "--vendor",
+        choices=[vendor.value for vendor in Vendor],
+        help="Parser to use. If not set, it is detected from each file's extension, which must be supported by a single parser.",
+    )
+    parser.add_argument("-w", "--workers", type=int, help="Number of worker processes.")
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Number of files sent to a worker at a time.",
+    )
+    parser.add_argument(
+        "--timezone",
+        type=_get_timezone,
+        help="Timezone to use for timestamps without one, e.g. UTC.",
+    )
+    parser.add_argument("--encoding", help="Encoding of the input files.")
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for result in allotrope_from_files(
+        args.paths,
+        args.vendor,
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+        chunk_size=args.chunk_size,
+        default_timezone=args.timezone,
+        encoding=args.encoding,
+    ):
+        if result.ok:
+            print(f"{result.filepath} -> {result.output_path}")  # noqa: T201
+        else:
+            failed += 1
+            print(f"{result.filepath} FAILED: {result.error}")  # noqa: T201
+    return 1 if failed else 0
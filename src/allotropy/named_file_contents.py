@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from functools import cached_property
-from io import BytesIO
+from io import BufferedIOBase, BytesIO, RawIOBase
 from pathlib import PureWindowsPath
+from typing import IO
 
 from allotropy.types import IOType
 
@@ -29,6 +30,15 @@ class NamedFileContents:
     def extension(self) -> str:
         return PureWindowsPath(self.original_file_path).suffix[1:]
 
+    def get_seekable_bytes_stream(self) -> IO[bytes]:
+        # Use the contents stream itself if possible, rather than copying the whole file into memory.
+        if (
+            isinstance(self.contents, BufferedIOBase | RawIOBase)
+            and self.contents.seekable()
+        ):
+            return self.contents
+        return self.get_bytes_stream()
+
     def get_bytes_stream(self, encoding: str = "utf-8") -> BytesIO:
         raw_content = self.contents.read()
         return BytesIO(
@@ -1,111 +1,21 @@
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import tzinfo
 from enum import Enum
+from functools import cache
+import importlib
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from allotropy.allotrope.schema_parser.path_util import ROOT_DIR
-from allotropy.parsers.agilent_gen5.agilent_gen5_parser import AgilentGen5Parser
-from allotropy.parsers.agilent_gen5_image.agilent_gen5_image_parser import (
-    AgilentGen5ImageParser,
-)
-from allotropy.parsers.agilent_tapestation_analysis.agilent_tapestation_analysis_parser import (
-    AgilentTapestationAnalysisParser,
-)
-from allotropy.parsers.appbio_absolute_q.appbio_absolute_q_parser import (
-    AppbioAbsoluteQParser,
-)
-from allotropy.parsers.appbio_quantstudio.appbio_quantstudio_parser import (
-    AppBioQuantStudioParser,
-)
-from allotropy.parsers.appbio_quantstudio_designandanalysis.appbio_quantstudio_designandanalysis_parser import (
-    AppBioQuantStudioDesignandanalysisParser,
-)
-from allotropy.parsers.beckman_coulter_biomek.beckman_coulter_biomek_parser import (
-    BeckmanCoulterBiomekParser,
-)
-from allotropy.parsers.beckman_pharmspec.beckman_pharmspec_parser import PharmSpecParser
-from allotropy.parsers.beckman_vi_cell_blu.vi_cell_blu_parser import ViCellBluParser
-from allotropy.parsers.beckman_vi_cell_xr.vi_cell_xr_parser import ViCellXRParser
-from allotropy.parsers.benchling_empower.benchling_empower_parser import (
-    BenchlingEmpowerParser,
-)
-from allotropy.parsers.biorad_bioplex_manager.biorad_bioplex_manager_parser import (
-    BioradBioplexParser,
-)
-from allotropy.parsers.bmg_mars.bmg_mars_parser import BmgMarsParser
-from allotropy.parsers.cfxmaestro.cfxmaestro_parser import CfxmaestroParser
-from allotropy.parsers.chemometec_nc_view.chemometec_nc_view_parser import (
-    ChemometecNcViewParser,
-)
-from allotropy.parsers.chemometec_nucleoview.nucleoview_parser import (
-    ChemometecNucleoviewParser,
-)
-from allotropy.parsers.ctl_immunospot.ctl_immunospot_parser import CtlImmunospotParser
-from allotropy.parsers.cytiva_biacore_t200_control.cytiva_biacore_t200_control_parser import (
-    CytivaBiacoreT200ControlParser,
-)
-from allotropy.parsers.cytiva_unicorn.cytiva_unicorn_parser import CytivaUnicornParser
-from allotropy.parsers.example_weyland_yutani.example_weyland_yutani_parser import (
-    ExampleWeylandYutaniParser,
-)
-from allotropy.parsers.luminex_xponent.luminex_xponent_parser import (
-    LuminexXponentParser,
-)
-from allotropy.parsers.mabtech_apex.mabtech_apex_parser import MabtechApexParser
-from allotropy.parsers.methodical_mind.methodical_mind_parser import (
-    MethodicalMindParser,
-)
-from allotropy.parsers.moldev_softmax_pro.softmax_pro_parser import SoftmaxproParser
-from allotropy.parsers.msd_workbench.msd_workbench_parser import MSDWorkbenchParser
-from allotropy.parsers.novabio_flex2.novabio_flex2_parser import NovaBioFlexParser
-from allotropy.parsers.perkin_elmer_envision.perkin_elmer_envision_parser import (
-    PerkinElmerEnvisionParser,
-)
-from allotropy.parsers.qiacuity_dpcr.qiacuity_dpcr_parser import QiacuitydPCRParser
+from allotropy.allotrope.schemas import warm_schema_validators
 from allotropy.parsers.release_state import ReleaseState
-from allotropy.parsers.revvity_kaleido.kaleido_parser import KaleidoParser
-from allotropy.parsers.revvity_matrix.revvity_matrix_parser import (
-    RevvityMatrixParser,
-)
-from allotropy.parsers.roche_cedex_bioht.roche_cedex_bioht_parser import (
-    RocheCedexBiohtParser,
-)
-from allotropy.parsers.roche_cedex_hires.roche_cedex_hires_parser import (
-    RocheCedexHiResParser,
-)
-from allotropy.parsers.tecan_magellan.tecan_magellan_parser import TecanMagellanParser
-from allotropy.parsers.thermo_fisher_genesys30.thermo_fisher_genesys30_parser import (
-    ThermoFisherGenesys30Parser,
-)
-from allotropy.parsers.thermo_fisher_genesys_on_board.thermo_fisher_genesys_on_board_parser import (
-    ThermoFisherGenesysOnBoardParser,
-)
-from allotropy.parsers.thermo_fisher_nanodrop_8000.nanodrop_8000_parser import (
-    Nanodrop8000Parser,
-)
-from allotropy.parsers.thermo_fisher_nanodrop_eight.nanodrop_eight_parser import (
-    NanodropEightParser,
-)
-from allotropy.parsers.thermo_fisher_nanodrop_one.thermo_fisher_nanodrop_one_parser import (
-    ThermoFisherNanodropOneParser,
-)
-from allotropy.parsers.thermo_fisher_qubit4.thermo_fisher_qubit4_parser import (
-    ThermoFisherQubit4Parser,
-)
-from allotropy.parsers.thermo_fisher_qubit_flex.thermo_fisher_qubit_flex_parser import (
-    ThermoFisherQubitFlexParser,
-)
-from allotropy.parsers.thermo_fisher_visionlite.thermo_fisher_visionlite_parser import (
-    ThermoFisherVisionliteParser,
-)
-from allotropy.parsers.thermo_skanit.thermo_skanit_parser import ThermoSkanItParser
-from allotropy.parsers.unchained_labs_lunatic.unchained_labs_lunatic_parser import (
-    UnchainedLabsLunaticParser,
-)
 from allotropy.parsers.utils.timestamp_parser import TimestampParser
 from allotropy.parsers.vendor_parser import VendorParser
 
+if TYPE_CHECKING:
+    from allotropy.parsers.utils.data_sink import DataSink
+
 
 class Vendor(Enum):
     AGILENT_GEN5 = "AGILENT_GEN5"
@@ -154,16 +64,16 @@ class Vendor(Enum):
 
     @property
     def display_name(self) -> str:
-        return self.get_parser().DISPLAY_NAME
+        return self.parser_class.DISPLAY_NAME
 
     @property
     def release_state(self) -> ReleaseState:
-        return self.get_parser().RELEASE_STATE
+        return self.parser_class.RELEASE_STATE
 
     @property
     def supported_extensions(self) -> list[str]:
         return [
-            ext.strip() for ext in self.get_parser().SUPPORTED_EXTENSIONS.split(",")
+            ext.strip() for ext in self.parser_class.SUPPORTED_EXTENSIONS.split(",")
         ]
 
     @property
@@ -189,58 +99,85 @@ class Vendor(Enum):
             "Qpcr": "qPCR",
         }.get(technique, technique)
 
+    @property
+    def parser_class(self) -> type[VendorParser[Any, Any]]:
+        return _get_parser_class(self)
+
     def get_parser(
-        self, default_timezone: tzinfo | None = None
+        self,
+        default_timezone: tzinfo | None = None,
+        data_sink: "DataSink | None" = None,
     ) -> VendorParser[Any, Any]:
         timestamp_parser = TimestampParser(default_timezone)
-        return _VENDOR_TO_PARSER[self](timestamp_parser)
+        return self.parser_class(timestamp_parser, data_sink)
+
+
+# Parser classes are referenced by import path and only imported when first used, so that importing this module
+# (e.g. to convert a single file) does not import every parser and ASM model.
+
+
+_VENDOR_TO_PARSER: dict[Vendor, str] = {
+    Vendor.AGILENT_GEN5: "allotropy.parsers.agilent_gen5.agilent_gen5_parser.AgilentGen5Parser",
+    Vendor.AGILENT_GEN5_IMAGE: "allotropy.parsers.agilent_gen5_image.agilent_gen5_image_parser.AgilentGen5ImageParser",
+    Vendor.AGILENT_TAPESTATION_ANALYSIS: "allotropy.parsers.agilent_tapestation_analysis.agilent_tapestation_analysis_parser.AgilentTapestationAnalysisParser",
+    Vendor.APPBIO_ABSOLUTE_Q: "allotropy.parsers.appbio_absolute_q.appbio_absolute_q_parser.AppbioAbsoluteQParser",
+    Vendor.APPBIO_QUANTSTUDIO: "allotropy.parsers.appbio_quantstudio.appbio_quantstudio_parser.AppBioQuantStudioParser",
+    Vendor.APPBIO_QUANTSTUDIO_DESIGNANDANALYSIS: "allotropy.parsers.appbio_quantstudio_designandanalysis.appbio_quantstudio_designandanalysis_parser.AppBioQuantStudioDesignandanalysisParser",
+    Vendor.BECKMAN_COULTER_BIOMEK: "allotropy.parsers.beckman_coulter_biomek.beckman_coulter_biomek_parser.BeckmanCoulterBiomekParser",
+    Vendor.BECKMAN_PHARMSPEC: "allotropy.parsers.beckman_pharmspec.beckman_pharmspec_parser.PharmSpecParser",
+    Vendor.BECKMAN_VI_CELL_BLU: "allotropy.parsers.beckman_vi_cell_blu.vi_cell_blu_parser.ViCellBluParser",
+    Vendor.BECKMAN_VI_CELL_XR: "allotropy.parsers.beckman_vi_cell_xr.vi_cell_xr_parser.ViCellXRParser",
+    Vendor.BENCHLING_EMPOWER: "allotropy.parsers.benchling_empower.benchling_empower_parser.BenchlingEmpowerParser",
+    Vendor.BIORAD_BIOPLEX: "allotropy.parsers.biorad_bioplex_manager.biorad_bioplex_manager_parser.BioradBioplexParser",
+    Vendor.BMG_MARS: "allotropy.parsers.bmg_mars.bmg_mars_parser.BmgMarsParser",
+    Vendor.CFXMAESTRO: "allotropy.parsers.cfxmaestro.cfxmaestro_parser.CfxmaestroParser",
+    Vendor.CHEMOMETEC_NC_VIEW: "allotropy.parsers.chemometec_nc_view.chemometec_nc_view_parser.ChemometecNcViewParser",
+    Vendor.CHEMOMETEC_NUCLEOVIEW: "allotropy.parsers.chemometec_nucleoview.nucleoview_parser.ChemometecNucleoviewParser",
+    Vendor.CTL_IMMUNOSPOT: "allotropy.parsers.ctl_immunospot.ctl_immunospot_parser.CtlImmunospotParser",
+    Vendor.CYTIVA_BIACORE_T200_CONTROL: "allotropy.parsers.cytiva_biacore_t200_control.cytiva_biacore_t200_control_parser.CytivaBiacoreT200ControlParser",
+    Vendor.CYTIVA_UNICORN: "allotropy.parsers.cytiva_unicorn.cytiva_unicorn_parser.CytivaUnicornParser",
+    Vendor.EXAMPLE_WEYLAND_YUTANI: "allotropy.parsers.example_weyland_yutani.example_weyland_yutani_parser.ExampleWeylandYutaniParser",
+    Vendor.LUMINEX_XPONENT: "allotropy.parsers.luminex_xponent.luminex_xponent_parser.LuminexXponentParser",
+    Vendor.MABTECH_APEX: "allotropy.parsers.mabtech_apex.mabtech_apex_parser.MabtechApexParser",
+    Vendor.METHODICAL_MIND: "allotropy.parsers.methodical_mind.methodical_mind_parser.MethodicalMindParser",
+    Vendor.MOLDEV_SOFTMAX_PRO: "allotropy.parsers.moldev_softmax_pro.softmax_pro_parser.SoftmaxproParser",
+    Vendor.MSD_WORKBENCH: "allotropy.parsers.msd_workbench.msd_workbench_parser.MSDWorkbenchParser",
+    Vendor.REVVITY_MATRIX: "allotropy.parsers.revvity_matrix.revvity_matrix_parser.RevvityMatrixParser",
+    Vendor.NOVABIO_FLEX2: "allotropy.parsers.novabio_flex2.novabio_flex2_parser.NovaBioFlexParser",
+    Vendor.PERKIN_ELMER_ENVISION: "allotropy.parsers.perkin_elmer_envision.perkin_elmer_envision_parser.PerkinElmerEnvisionParser",
+    Vendor.QIACUITY_DPCR: "allotropy.parsers.qiacuity_dpcr.qiacuity_dpcr_parser.QiacuitydPCRParser",
+    Vendor.REVVITY_KALEIDO: "allotropy.parsers.revvity_kaleido.kaleido_parser.KaleidoParser",
+    Vendor.ROCHE_CEDEX_BIOHT: "allotropy.parsers.roche_cedex_bioht.roche_cedex_bioht_parser.RocheCedexBiohtParser",
+    Vendor.ROCHE_CEDEX_HIRES: "allotropy.parsers.roche_cedex_hires.roche_cedex_hires_parser.RocheCedexHiResParser",
+    Vendor.TECAN_MAGELLAN: "allotropy.parsers.tecan_magellan.tecan_magellan_parser.TecanMagellanParser",
+    Vendor.THERMO_FISHER_GENESYS30: "allotropy.parsers.thermo_fisher_genesys30.thermo_fisher_genesys30_parser.ThermoFisherGenesys30Parser",
+    Vendor.THERMO_FISHER_GENESYS_ON_BOARD: "allotropy.parsers.thermo_fisher_genesys_on_board.thermo_fisher_genesys_on_board_parser.ThermoFisherGenesysOnBoardParser",
+    Vendor.THERMO_FISHER_NANODROP_8000: "allotropy.parsers.thermo_fisher_nanodrop_8000.nanodrop_8000_parser.Nanodrop8000Parser",
+    Vendor.THERMO_FISHER_NANODROP_EIGHT: "allotropy.parsers.thermo_fisher_nanodrop_eight.nanodrop_eight_parser.NanodropEightParser",
+    Vendor.THERMO_FISHER_NANODROP_ONE: "allotropy.parsers.thermo_fisher_nanodrop_one.thermo_fisher_nanodrop_one_parser.ThermoFisherNanodropOneParser",
+    Vendor.THERMO_FISHER_QUBIT4: "allotropy.parsers.thermo_fisher_qubit4.thermo_fisher_qubit4_parser.ThermoFisherQubit4Parser",
+    Vendor.THERMO_FISHER_QUBIT_FLEX: "allotropy.parsers.thermo_fisher_qubit_flex.thermo_fisher_qubit_flex_parser.ThermoFisherQubitFlexParser",
+    Vendor.THERMO_FISHER_VISIONLITE: "allotropy.parsers.thermo_fisher_visionlite.thermo_fisher_visionlite_parser.ThermoFisherVisionliteParser",
+    Vendor.THERMO_SKANIT: "allotropy.parsers.thermo_skanit.thermo_skanit_parser.ThermoSkanItParser",
+    Vendor.UNCHAINED_LABS_LUNATIC: "allotropy.parsers.unchained_labs_lunatic.unchained_labs_lunatic_parser.UnchainedLabsLunaticParser",
+}
 
 
-_VENDOR_TO_PARSER: dict[Vendor, type[VendorParser[Any, Any]]] = {
-    Vendor.AGILENT_GEN5: AgilentGen5Parser,
-    Vendor.AGILENT_GEN5_IMAGE: AgilentGen5ImageParser,
-    Vendor.AGILENT_TAPESTATION_ANALYSIS: AgilentTapestationAnalysisParser,
-    Vendor.APPBIO_ABSOLUTE_Q: AppbioAbsoluteQParser,
-    Vendor.APPBIO_QUANTSTUDIO: AppBioQuantStudioParser,
-    Vendor.APPBIO_QUANTSTUDIO_DESIGNANDANALYSIS: AppBioQuantStudioDesignandanalysisParser,
-    Vendor.BECKMAN_COULTER_BIOMEK: BeckmanCoulterBiomekParser,
-    Vendor.BECKMAN_PHARMSPEC: PharmSpecParser,
-    Vendor.BECKMAN_VI_CELL_BLU: ViCellBluParser,
-    Vendor.BECKMAN_VI_CELL_XR: ViCellXRParser,
-    Vendor.BENCHLING_EMPOWER: BenchlingEmpowerParser,
-    Vendor.BIORAD_BIOPLEX: BioradBioplexParser,
-    Vendor.BMG_MARS: BmgMarsParser,
-    Vendor.CFXMAESTRO: CfxmaestroParser,
-    Vendor.CHEMOMETEC_NC_VIEW: ChemometecNcViewParser,
-    Vendor.CHEMOMETEC_NUCLEOVIEW: ChemometecNucleoviewParser,
-    Vendor.CTL_IMMUNOSPOT: CtlImmunospotParser,
-    Vendor.CYTIVA_BIACORE_T200_CONTROL: CytivaBiacoreT200ControlParser,
-    Vendor.CYTIVA_UNICORN: CytivaUnicornParser,
-    Vendor.EXAMPLE_WEYLAND_YUTANI: ExampleWeylandYutaniParser,
-    Vendor.LUMINEX_XPONENT: LuminexXponentParser,
-    Vendor.MABTECH_APEX: MabtechApexParser,
-    Vendor.METHODICAL_MIND: MethodicalMindParser,
-    Vendor.MOLDEV_SOFTMAX_PRO: SoftmaxproParser,
-    Vendor.MSD_WORKBENCH: MSDWorkbenchParser,
-    Vendor.REVVITY_MATRIX: RevvityMatrixParser,
-    Vendor.NOVABIO_FLEX2: NovaBioFlexParser,
-    Vendor.PERKIN_ELMER_ENVISION: PerkinElmerEnvisionParser,
-    Vendor.QIACUITY_DPCR: QiacuitydPCRParser,
-    Vendor.REVVITY_KALEIDO: KaleidoParser,
-    Vendor.ROCHE_CEDEX_BIOHT: RocheCedexBiohtParser,
-    Vendor.ROCHE_CEDEX_HIRES: RocheCedexHiResParser,
-    Vendor.TECAN_MAGELLAN: TecanMagellanParser,
-    Vendor.THERMO_FISHER_GENESYS30: ThermoFisherGenesys30Parser,
-    Vendor.THERMO_FISHER_GENESYS_ON_BOARD: ThermoFisherGenesysOnBoardParser,
-    Vendor.THERMO_FISHER_NANODROP_8000: Nanodrop8000Parser,
-    Vendor.THERMO_FISHER_NANODROP_EIGHT: NanodropEightParser,
-    Vendor.THERMO_FISHER_NANODROP_ONE: ThermoFisherNanodropOneParser,
-    Vendor.THERMO_FISHER_QUBIT4: ThermoFisherQubit4Parser,
-    Vendor.THERMO_FISHER_QUBIT_FLEX: ThermoFisherQubitFlexParser,
-    Vendor.THERMO_FISHER_VISIONLITE: ThermoFisherVisionliteParser,
-    Vendor.THERMO_SKANIT: ThermoSkanItParser,
-    Vendor.UNCHAINED_LABS_LUNATIC: UnchainedLabsLunaticParser,
-}
+@cache
+def _get_parser_class(vendor: Vendor) -> type[VendorParser[Any, Any]]:
+    module_name, class_name = _VENDOR_TO_PARSER[vendor].rsplit(".", 1)
+    parser_class: type[VendorParser[Any, Any]] = getattr(
+        importlib.import_module(module_name), class_name
+    )
+    return parser_class
+
+
+def warm_vendor_schema_validators(vendors: Iterable[Vendor] | None = None) -> None:
+    # Compile schema validators ahead of time (e.g. in a worker initializer), so the first conversion for each
+    # vendor does not pay the schema load and compile cost.
+    warm_schema_validators(
+        {vendor.get_parser()._get_mapper().MANIFEST for vendor in vendors or Vendor}
+    )
 
 
 def get_table_contents() -> str:
@@ -1,14 +1,20 @@
 import datetime
 import os
 import re
-import struct
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import olefile as ole
 import pandas as pd
 import xmltodict
 
 from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.utils.data_sink import (
+    DataSink,
+    DirectorySink,
+    TableData,
+)
 
 # Patterns to extract cycle number, window number, and curve number
 cycle_pattern = re.compile(r"_Cycle (\d+)")
@@ -393,20 +399,98 @@ def get_r_point_data(r_point_data: str) -> list[dict[str, Any]]:
     return r_data_list
 
 
-def decode_data(named_file_contents: NamedFileContents) -> dict[str, Any]:
+def decode_floats(stream_content: bytes) -> npt.NDArray[np.float64]:
+    """
+    Decodes a stream of 4 byte floats
+    :param stream_content: bytes of the stream
+    :return: array of the floats, as float64
+    """
+    return np.frombuffer(
+        stream_content, dtype=np.float32, count=len(stream_content) // 4
+    ).astype(np.float64)
+
+
+def get_cumcount(flow_cells: npt.NDArray[Any]) -> npt.NDArray[np.int64]:
+    """
+    Numbers the rows of each flow cell from 0, in order
+    :param flow_cells: flow cell of each row
+    :return: array of row numbers within each flow cell
+    """
+    cumcount = np.empty(len(flow_cells), dtype=np.int64)
+    for flow_cell in set(flow_cells):
+        mask = flow_cells == flow_cell
+        cumcount[mask] = np.arange(np.count_nonzero(mask))
+    return cumcount
+
+
+def get_sensorgram_data(
+    curves: list[dict[str, Any]],
+    data_collection_rate: dict[str, Any] | None,
+    *,
+    has_time: bool,
+) -> TableData:
+    """
+    Builds the sensorgram columns of a cycle from its curves
+    :param curves: curves of the cycle, in stream order
+    :param data_collection_rate: data collection rate, used for the time if there is no time data
+    :param has_time: whether any curve in the file has time data
+    :return: dict of column name to array, in the order of the sensorgram columns
+    """
+    lengths = [len(curve["sensorgram"]) for curve in curves]
+
+    def _repeat(key: str, dtype: Any) -> npt.NDArray[Any]:
+        return np.repeat(
+            np.array([curve[key] for curve in curves], dtype=dtype), lengths
+        )
+
+    flow_cells = _repeat("flow_cell", object)
+    if has_time:
+        time = np.concatenate(
+            [
+                np.full(length, np.nan) if curve["time"] is None else curve["time"]
+                for curve, length in zip(curves, lengths, strict=True)
+            ]
+        )
+        # The time of the other flow cells is taken from the last flow cell, repeating it if they have more rows.
+        last_flow_cell = max(flow_cells)
+        last_time = time[flow_cells == last_flow_cell]
+        for flow_cell in set(flow_cells) - {last_flow_cell}:
+            mask = flow_cells == flow_cell
+            time[mask] = last_time[np.arange(np.count_nonzero(mask)) % len(last_time)]
+    elif data_collection_rate:
+        time = get_cumcount(flow_cells) * (1 / data_collection_rate["value"])
+    else:
+        time = get_cumcount(flow_cells) + 1
+
+    return {
+        "Flow Cell Number": flow_cells,
+        "Cycle Number": _repeat("cycle_number", np.int64),
+        "Curve Number": _repeat("curve_number", np.int64),
+        "Window Number": _repeat("window_number", np.int64),
+        "Time (s)": time,
+        "Sensorgram (RU)": np.concatenate([curve["sensorgram"] for curve in curves]),
+    }
+
+
+def decode_data(
+    named_file_contents: NamedFileContents, sink: DataSink | None = None
+) -> dict[str, Any]:
     """
     Decodes the proprietary file into a structured dict
     :param named_file_contents: The named file contents containing the input file details
+    :param sink: where to store the sensorgram and r-point tables of each cycle, by default parquet files in the
+        directory of the input file
     :return: structured dictionary of decoded data
     """
     file_path = named_file_contents.original_file_path
     base_name = os.path.basename(file_path).split(".blr")[0]
-    dir_name = os.path.dirname(file_path)
+    sink = sink or DirectorySink(os.path.dirname(file_path))
     intermediate_json: dict[str, Any] = {}
-    content = ole.OleFileIO(file_path)
+    content = ole.OleFileIO(named_file_contents.get_seekable_bytes_stream())
     streams = content.listdir()
     cycles: list[dict[str, Any]] = []
-    cycle_df_list = []
+    cycle_curves: dict[int, list[dict[str, Any]]] = {}
+    has_time = False
     cycle_details = []
     for stream in streams:
         stream_content = content.openstream(stream).read()
@@ -433,14 +517,13 @@ def decode_data(named_file_contents: NamedFileContents) -> dict[str, Any]:
             r_point_dataframe = pd.DataFrame(r_point_data)
             report_point_data = r_point_dataframe.groupby("Cycle")
             for _name, group in report_point_data:
-                cycle_data = {}
+                cycle_data: dict[str, Any] = {}
                 cycle_number = group["Cycle"].iloc[0]
                 cycle_name = f"_cycle_{cycle_number}"
-                rpoint_parquet_path = os.path.join(
-                    dir_name, base_name + cycle_name + "_rpoint.parquet"
+                cycle_data["r-point_path"] = sink.write(
+                    base_name + cycle_name + "_rpoint.parquet",
+                    {column: group[column].to_numpy() for column in group.columns},
                 )
-                group.to_parquet(rpoint_parquet_path, index=False)
-                cycle_data["r-point_path"] = rpoint_parquet_path
                 cycle_data["cycle_number"] = cycle_number
                 cycle_details.append(cycle_data)
         cycle_match = cycle_pattern.search(stream[0])
@@ -448,9 +531,6 @@ def decode_data(named_file_contents: NamedFileContents) -> dict[str, Any]:
             continue
         cycle_number = int(cycle_match.group(1))
 
-        for part in stream:
-            window_match = window_pattern.search(part)
-
         if any("_Window" in part for part in stream) and any(
             "_Curve" in part for part in stream
         ):
@@ -480,96 +560,49 @@ def decode_data(named_file_contents: NamedFileContents) -> dict[str, Any]:
                         if "Fc" in line:
                             flow_cell = label_list[0].split("=")[1]
 
-            # gets the xy data as data frame
+            # gets the xy data: 3 header values, then the times and the responses
             elif "XYData" in str(stream):
-                xy_data_list = list(
-                    struct.unpack("f" * (len(stream_content) // 4), stream_content)
-                )
-                indexed_xy_data_list = xy_data_list[3:]
-                length_of_xydata = len(xy_data_list[3:])
-                xy_result_list = indexed_xy_data_list[int(length_of_xydata / 2) :]
-                time = indexed_xy_data_list[: int(length_of_xydata / 2)]
-                length_of_xy = len(xy_result_list)
-
-                xy_data_frame = pd.DataFrame(
+                xy_data = decode_floats(stream_content)[3:]
+                half_length = int(len(xy_data) / 2)
+                has_time = True
+                cycle_curves.setdefault(cycle["cycle_number"], []).append(
                     {
-                        "Flow Cell Number": [flow_cell] * length_of_xy,
-                        "Cycle Number": [cycle["cycle_number"]] * length_of_xy,
-                        "Curve Number": [cycle["curve_number"]] * length_of_xy,
-                        "Window Number": [cycle["window_number"]] * length_of_xy,
-                        "Sensorgram (RU)": xy_result_list,
-                        "Time (s)": time,
+                        **cycle,
+                        "flow_cell": flow_cell,
+                        "sensorgram": xy_data[half_length:],
+                        "time": xy_data[:half_length],
                     }
                 )
 
-                cycle_df_list.append(xy_data_frame)
-
-            # gets the segment data
+            # gets the segment data: 11 header values, then the responses
             elif "Segment" in str(stream):
-                segment_data_list = list(
-                    struct.unpack("f" * (len(stream_content) // 4), stream_content)
-                )
-                length_of_segment = len(segment_data_list[11:])
-                segment_data_frame = pd.DataFrame(
+                cycle_curves.setdefault(cycle["cycle_number"], []).append(
                     {
-                        "Flow Cell Number": [flow_cell] * length_of_segment,
-                        "Cycle Number": [cycle["cycle_number"]] * length_of_segment,
-                        "Curve Number": [cycle["curve_number"]] * length_of_segment,
-                        "Window Number": [cycle["window_number"]] * length_of_segment,
-                        "Sensorgram (RU)": segment_data_list[11:],
+                        **cycle,
+                        "flow_cell": flow_cell,
+                        "sensorgram": decode_floats(stream_content)[11:],
+                        "time": None,
                     }
                 )
-                cycle_df_list.append(segment_data_frame)
-    combined_cycles_df = pd.concat(cycle_df_list, ignore_index=True)
 
-    sensorgram_data = combined_cycles_df.groupby("Cycle Number")
+    data_collection_rate = intermediate_json["application_template_details"].get(
+        "DataCollectionRate"
+    )
     cycles_data = []
-    for _name, group in sensorgram_data:
-        if "Time (s)" in group.columns:
-            max_new = group["Flow Cell Number"].max()
-            last_part = group[group["Flow Cell Number"] == max_new]
-            time_map = dict(zip(last_part.index, last_part["Time (s)"], strict=True))
-            for new_value in group["Flow Cell Number"].unique():
-                if new_value != max_new:
-                    indices = group[group["Flow Cell Number"] == new_value].index
-                    for i, idx in enumerate(indices):
-                        group.at[idx, "Time (s)"] = time_map[
-                            list(time_map.keys())[i % len(time_map)]
-                        ]
-        elif intermediate_json["application_template_details"].get(
-            "DataCollectionRate"
-        ):
-            group["Time (s)"] = group.groupby("Flow Cell Number").cumcount() * (
-                1
-                / intermediate_json["application_template_details"][
-                    "DataCollectionRate"
-                ]["value"]
-            )
-        else:
-            group["Time (s)"] = group.groupby("Flow Cell Number").cumcount() + 1
-        cycle_number = group["Cycle Number"].iloc[0]
+    for cycle_number in sorted(cycle_curves):
+        sensorgram_data = get_sensorgram_data(
+            cycle_curves[cycle_number], data_collection_rate, has_time=has_time
+        )
         cycle_name = f"_cycle_{cycle_number}"
-        group_data = group[
-            [
-                "Flow Cell Number",
-                "Cycle Number",
-                "Curve Number",
-                "Window Number",
-                "Time (s)",
-                "Sensorgram (RU)",
-            ]
-        ]
-        sensorgram_parquet_path = os.path.join(
-            dir_name, base_name + cycle_name + "_sensorgram.parquet"
+        cycles_data.append(
+            sink.write(base_name + cycle_name + "_sensorgram.parquet", sensorgram_data)
         )
-        group_data.to_parquet(sensorgram_parquet_path, index=False)
-        cycles_data.append(sensorgram_parquet_path)
 
     total_cycles = [
         {**d, "sensorgram_path": new_value}
         for d, new_value in zip(cycle_details, cycles_data, strict=True)
     ]
     intermediate_json["cycle_data"] = total_cycles
-    intermediate_json["total_cycles"] = cycle_number
+    intermediate_json["total_cycles"] = len(total_cycles)
 
     return intermediate_json
@@ -25,7 +25,8 @@ class CytivaBiacoreT200ControlParser(VendorParser[Data, Model]):
     SCHEMA_MAPPER = Mapper
 
     def create_data(self, named_file_contents: NamedFileContents) -> Data:
-        structured_data = decode_data(named_file_contents)
+        # Without a data sink, sensorgram and r-point tables are written to parquet files next to the input file.
+        structured_data = decode_data(named_file_contents, self.data_sink)
         return Data(
             metadata=create_metadata(structured_data, named_file_contents),
             measurement_groups=[create_measurement_groups(structured_data)],
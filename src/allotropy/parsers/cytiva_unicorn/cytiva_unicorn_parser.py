@@ -27,9 +27,13 @@ class CytivaUnicornParser(VendorParser[Data, Model]):
     SCHEMA_MAPPER = Mapper
 
     def create_data(self, named_file_contents: NamedFileContents) -> Data:
-        handler = UnicornZipHandler(named_file_contents.get_bytes_stream())
-        results = handler.get_results()
-        return Data(
-            create_metadata(handler, results, named_file_contents.original_file_path),
-            create_measurement_groups(handler, results),
-        )
+        with UnicornZipHandler(
+            named_file_contents.get_seekable_bytes_stream(), cache=True
+        ) as handler:
+            results = handler.get_results()
+            return Data(
+                create_metadata(
+                    handler, results, named_file_contents.original_file_path
+                ),
+                create_measurement_groups(handler, results),
+            )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from io import BytesIO
+from typing import IO
 
 from allotropy.parsers.cytiva_unicorn.reader.zip_handler import (
     ZipHandler,
@@ -11,17 +12,44 @@ from allotropy.parsers.utils.strict_xml_element import (
 
 
 class UnicornZipHandler(ZipHandler):
+    """Zip handler for UNICORN result files.
+
+    If cache is set, nested zips and parsed xml files are kept and reused (by the nested handlers as well), so each
+    of them is decompressed and parsed at most once for the lifetime of the handler, e.g. one conversion.
+    """
+
+    def __init__(self, data: IO[bytes] | str, *, cache: bool = False):
+        super().__init__(data)
+        self.cache = cache
+        self.zips: dict[str, UnicornZipHandler] = {}
+        self.xml_elements: dict[str, StrictXmlElement] = {}
+
     def get_zip(self, inner_path: str) -> UnicornZipHandler:
-        return UnicornZipHandler(self.get_file(inner_path))
+        if not self.cache:
+            return UnicornZipHandler(self.get_file(inner_path))
+        if inner_path not in self.zips:
+            self.zips[inner_path] = UnicornZipHandler(
+                self.get_file(inner_path), cache=True
+            )
+        return self.zips[inner_path]
 
     def get_zip_from_pattern(self, pattern: str) -> UnicornZipHandler:
         return self.get_zip(self.get_inner_path(pattern))
 
+    def close(self) -> None:
+        for handler in self.zips.values():
+            handler.close()
+        self.zips.clear()
+        self.xml_elements.clear()
+        super().close()
+
     @classmethod
-    def create_from_path(cls, path: str) -> UnicornZipHandler:
-        with open(path, "rb") as f:
-            data = f.read()
-        return UnicornZipHandler(data=BytesIO(data))
+    def create_from_path(cls, path: str, *, cache: bool = False) -> UnicornZipHandler:
+        """Create a handler for the file at path, which must be closed (or used as a context manager) after use.
+
+        The zip file reads members from disk as they are needed, rather than loading the whole file.
+        """
+        return UnicornZipHandler(path, cache=cache)
 
     def filter_xml_metadata(self, stream: BytesIO) -> BytesIO:
         data = stream.read()
@@ -41,36 +69,35 @@ class UnicornZipHandler(ZipHandler):
 
         return BytesIO(data[start:end])
 
+    def get_xml_from_pattern(self, pattern: str) -> StrictXmlElement:
+        inner_path = self.get_inner_path(pattern)
+        if inner_path in self.xml_elements:
+            return self.xml_elements[inner_path]
+        b_stream = self.get_file(inner_path)
+        raw_content = self.filter_xml_metadata(b_stream).read()
+        element = StrictXmlElement.create_from_bytes(raw_content)
+        if self.cache:
+            self.xml_elements[inner_path] = element
+        return element
+
     def get_system_data(self) -> StrictXmlElement:
         system_data = self.get_zip_from_pattern("SystemData(.zip)?$")
-        b_stream = system_data.get_file_from_pattern("^Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return system_data.get_xml_from_pattern("^Xml$")
 
     def get_results(self) -> StrictXmlElement:
-        b_stream = self.get_file_from_pattern("Result.xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return self.get_xml_from_pattern("Result.xml$")
 
     def get_instrument_config_data(self) -> StrictXmlElement:
         instrument_regex = "InstrumentConfigurationData(.zip)?$"
         instrument_config_data = self.get_zip_from_pattern(instrument_regex)
-        b_stream = instrument_config_data.get_file_from_pattern("^Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return instrument_config_data.get_xml_from_pattern("^Xml$")
 
     def get_evaluation_log(self) -> StrictXmlElement:
-        b_stream = self.get_file_from_pattern("EvaluationLog.xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return self.get_xml_from_pattern("EvaluationLog.xml$")
 
     def get_chrom_1(self) -> StrictXmlElement:
-        b_stream = self.get_file_from_pattern("Chrom.1.Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return self.get_xml_from_pattern("Chrom.1.Xml$")
 
     def get_column_type_data(self) -> StrictXmlElement:
         column_type_data = self.get_zip_from_pattern("ColumnTypeData(.zip)?$")
-        b_stream = column_type_data.get_file_from_pattern("^Xml$")
-        raw_content = self.filter_xml_metadata(b_stream).read()
-        return StrictXmlElement.create_from_bytes(raw_content)
+        return column_type_data.get_xml_from_pattern("^Xml$")
@@ -2,21 +2,43 @@ from __future__ import annotations
 
 from io import BytesIO
 from re import search
+from types import TracebackType
+from typing import IO, TypeVar
 from zipfile import ZipFile
 
 from allotropy.parsers.utils.values import assert_not_none
 
+_ZipHandlerT = TypeVar("_ZipHandlerT", bound="ZipHandler")
+
 
 class ZipHandler:
-    def __init__(self, data: BytesIO):
+    def __init__(self, data: IO[bytes] | str):
         self.zip_file = ZipFile(data)
         self.name_list = self.zip_file.namelist()
+        # The names are fixed, so each pattern is only searched for once.
+        self.inner_paths: dict[str, str | None] = {}
+
+    def close(self) -> None:
+        # Closes the file the zip file opened, when created from a path.
+        self.zip_file.close()
+
+    def __enter__(self: _ZipHandlerT) -> _ZipHandlerT:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def get_inner_path_or_none(self, pattern: str) -> str | None:
-        for file_name in self.name_list:
-            if search(pattern, file_name):
-                return file_name
-        return None
+        if pattern not in self.inner_paths:
+            self.inner_paths[pattern] = next(
+                (name for name in self.name_list if search(pattern, name)), None
+            )
+        return self.inner_paths[pattern]
 
     def get_inner_path(self, pattern: str) -> str:
         return assert_not_none(
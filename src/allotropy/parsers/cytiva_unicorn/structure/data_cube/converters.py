@@ -1,6 +1,7 @@
 from abc import abstractmethod
-from collections.abc import Iterator
-import struct
+
+import numpy as np
+import numpy.typing as npt
 
 
 class Converter:
@@ -9,21 +10,24 @@ class Converter:
         pass
 
     @abstractmethod
-    def iter_data(self, data: bytes) -> Iterator[bytes]:
+    def get_offset_and_count(self, data: bytes) -> tuple[int, int]:
         pass
 
-    def convert(self, data: bytes) -> tuple[float, ...]:
-        binary_format = self.get_format()
-        return tuple(
-            struct.unpack(binary_format, binary_data)[0]
-            for binary_data in self.iter_data(data)
+    def convert(self, data: bytes) -> npt.NDArray[np.float64]:
+        offset, count = self.get_offset_and_count(data)
+        if count <= 0:
+            return np.empty(0, dtype=np.float64)
+        # Decode the payload in place, then widen to float64 like struct.unpack does (keeping NaNs silently).
+        values = np.frombuffer(
+            data, dtype=self.get_format(), count=count, offset=offset
         )
+        with np.errstate(invalid="ignore"):
+            return values.astype(np.float64)
 
 
 class FloatConverter(Converter):
     def get_format(self) -> str:
-        return "<f"  # little endian float (4 bytes)
+        return "<f4"  # little endian float (4 bytes)
 
-    def iter_data(self, data: bytes) -> Iterator[bytes]:
-        for i in range(47, len(data) - 48, 4):
-            yield data[i : i + 4]
+    def get_offset_and_count(self, data: bytes) -> tuple[int, int]:
+        return 47, len(range(47, len(data) - 48, 4))
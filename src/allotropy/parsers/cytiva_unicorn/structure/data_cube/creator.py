@@ -31,21 +31,17 @@ def create_data_cube(
         ],
         structure_measures=[data_cube_component],
         dimensions=[
-            list(
-                DataCubeReader(
-                    handler=handler,
-                    name="Volumes",
-                    transformation=Min2Sec(),
-                ).get_data()
-            )
+            DataCubeReader(
+                handler=handler,
+                name="Volumes",
+                transformation=Min2Sec(),
+            ).get_data()
         ],
         measures=[
-            list(
-                DataCubeReader(
-                    handler=handler,
-                    name="Amplitudes",
-                    transformation=transformation,
-                ).get_data()
-            )
+            DataCubeReader(
+                handler=handler,
+                name="Amplitudes",
+                transformation=transformation,
+            ).get_data()
         ],
     )
@@ -1,3 +1,6 @@
+import numpy as np
+import numpy.typing as npt
+
 from allotropy.exceptions import AllotropeConversionError
 from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
     UnicornZipHandler,
@@ -35,6 +38,6 @@ class DataCubeReader:
         msg = f"Unable to parse data cube with binary data in format {self.type}"
         raise AllotropeConversionError(msg)
 
-    def get_data(self) -> tuple[float, ...]:
+    def get_data(self) -> npt.NDArray[np.float64]:
         data = self.get_converter().convert(self.data)
         return self.transformation.transform(data) if self.transformation else data
@@ -1,17 +1,20 @@
 from abc import abstractmethod
 
+import numpy as np
+import numpy.typing as npt
+
 
 class Transformation:
     @abstractmethod
-    def transform(self, data: tuple[float, ...]) -> tuple[float, ...]:
+    def transform(self, data: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
         pass
 
 
 class Min2Sec(Transformation):
-    def transform(self, data: tuple[float, ...]) -> tuple[float, ...]:
-        return tuple(element * 60 for element in data)
+    def transform(self, data: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return data * 60
 
 
 class MScm2Sm(Transformation):
-    def transform(self, data: tuple[float, ...]) -> tuple[float, ...]:
-        return tuple(element / 10 for element in data)
+    def transform(self, data: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        return data / 10
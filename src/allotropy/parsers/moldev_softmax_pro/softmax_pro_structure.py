@@ -7,6 +7,8 @@ from datetime import datetime
 from enum import Enum
 import re
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from allotropy.allotrope.schema_mappers.adm.plate_reader.rec._2024._06.plate_reader import (
@@ -389,6 +391,19 @@ class PlateWavelengthData:
             self.data_elements[position].elapsed_time.append(elapsed_time)
             self.data_elements[position].kinetic_measures.append(value)
 
+    def extend_kinetic_data_elements(
+        self,
+        elapsed_times: list[float],
+        values: npt.NDArray[np.float64],
+        columns: list[str],
+    ) -> None:
+        # values is (time x row x column), columns are the plate column labels.
+        for row_idx, row_values in enumerate(values.transpose(1, 2, 0).tolist()):
+            for col, measures in zip(columns, row_values, strict=True):
+                data_element = self.data_elements[f"{num_to_chars(row_idx)}{col}"]
+                data_element.elapsed_time.extend(elapsed_times)
+                data_element.kinetic_measures.extend(measures)
+
 
 @dataclass(frozen=True)
 class RawData:
@@ -451,6 +466,12 @@ class PlateRawData(RawData):
         )
 
         if elapsed_time is not None and header.kinetic_points > 1:
+            if kinetic_data := PlateRawData._read_kinetic_data(
+                reader, header, columns, rows
+            ):
+                plate_raw_data._extend_kinetic_data(header, columns, *kinetic_data)
+                return plate_raw_data
+
             for _ in range(header.kinetic_points - 1):
                 data = RawData.get_measurement_section(reader, columns, rows)
 
@@ -483,6 +504,70 @@ class PlateRawData(RawData):
             )
         return wavelength_data
 
+    @staticmethod
+    def _read_kinetic_data(
+        reader: CsvReader, header: PlateHeader, columns: pd.Series[str], rows: int
+    ) -> tuple[list[float], npt.NDArray[np.float64]] | None:
+        """
+        Read the remaining time points of a kinetic plate block in one pass.
+
+        Returns the elapsed time of each time point and a (time x row x wavelength x column) array of
+        measurements. If the block is not a complete table of numbers, returns None without consuming any
+        lines, so it can be read section by section, reporting the problem.
+        """
+        start_line = reader.current_line
+        n_points = header.kinetic_points - 1
+        lines = []
+        for _ in range(n_points):
+            section = [reader.pop() for _ in range(rows)]
+            reader.drop_empty()
+            lines.extend(section)
+
+        value_columns = [
+            2 + idx * (header.num_columns + 1) + col
+            for idx in range(header.num_wavelengths)
+            for col in range(header.num_columns)
+        ]
+        try:
+            split_lines = [
+                line.split("\t") for line in lines if line and '"' not in line
+            ]
+            if len(split_lines) != len(lines) or any(
+                len(values) != len(columns) for values in split_lines
+            ):
+                raise ValueError
+            values = np.array(
+                [[line[idx] for idx in value_columns] for line in split_lines],
+                dtype=np.float64,
+            )
+            if np.isnan(values).any():
+                raise ValueError
+        except (ValueError, IndexError):
+            reader.current_line = start_line
+            return None
+
+        elapsed_times = [
+            time_to_seconds(split_lines[point * rows][0]) for point in range(n_points)
+        ]
+        return elapsed_times, values.reshape(
+            n_points, rows, header.num_wavelengths, header.num_columns
+        )
+
+    def _extend_kinetic_data(
+        self,
+        header: PlateHeader,
+        columns: pd.Series[str],
+        elapsed_times: list[float],
+        values: npt.NDArray[np.float64],
+    ) -> None:
+        for idx, plate_wavelength_data in enumerate(self.wavelength_data):
+            start = 2 + idx * (header.num_columns + 1)
+            plate_wavelength_data.extend_kinetic_data_elements(
+                elapsed_times,
+                values[:, :, idx, :],
+                columns.iloc[start : start + header.num_columns].tolist(),
+            )
+
     def _update_kinetic_data(
         self, elapsed_time: float, header: PlateHeader, w_data: pd.DataFrame
     ) -> None:
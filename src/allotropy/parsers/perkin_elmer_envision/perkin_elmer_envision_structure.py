@@ -18,10 +18,11 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from re import search
+from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -201,6 +202,14 @@ def create_background_infos(reader: CsvReader) -> list[BackgroundInfo]:
     return map_rows(data_frame, BackgroundInfo.create)
 
 
+def _get_well_values(series: pd.DataFrame) -> Iterator[tuple[str, str, Any]]:
+    # Values are read by integer position from each column, rather than with a .loc lookup per well.
+    positions = {col: i for i, col in enumerate(series.index)}
+    values = {row: series[row].to_numpy() for row in series.columns}
+    for col, row in series.stack().index:
+        yield col, row, values[row][positions[col]]
+
+
 @dataclass
 class CalculatedResult:
     uuid: str
@@ -231,9 +240,9 @@ def create_calculated_results(reader: CsvReader) -> list[CalculatedResult]:
             uuid=random_uuid_str(),
             col=col,
             row=row,
-            value=series.loc[col, row],
+            value=value,
         )
-        for col, row in series.stack().index
+        for col, row, value in _get_well_values(series)
     ]
 
 
@@ -267,9 +276,9 @@ def create_results(reader: CsvReader) -> list[Result]:
             uuid=random_uuid_str(),
             col=col,
             row=row,
-            value=int(series.loc[col, row]),
+            value=int(value),
         )
-        for col, row in series.stack().index
+        for col, row, value in _get_well_values(series)
     ]
 
 
@@ -335,6 +344,17 @@ def create_plate(reader: CsvReader) -> ResultPlate | CalculatedPlate:
 class PlateList:
     results: list[ResultPlate]
     calculated: list[CalculatedPlate]
+    # Result plates by plate number and measinfo, so background information is matched without scanning every plate.
+    result_plate_index: dict[tuple[str, str], list[ResultPlate]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.result_plate_index = defaultdict(list)
+        for plate in self.results:
+            self.result_plate_index[
+                (plate.plate_info.number, plate.plate_info.measinfo)
+            ].append(plate)
 
     @staticmethod
     def create(reader: CsvReader) -> PlateList:
@@ -350,7 +370,10 @@ class PlateList:
         return PlateList(results, calculated)
 
     def get_result_plate(self, background_info: BackgroundInfo) -> ResultPlate | None:
-        for plate in self.results:
+        plates = self.result_plate_index.get(
+            (background_info.plate_num, background_info.measinfo), []
+        )
+        for plate in plates:
             if plate.plate_info.match(background_info):
                 return plate
         return None
@@ -761,8 +784,9 @@ def create_measurement_groups(data: Data) -> list[MeasurementGroup]:
                 data.labels,
                 read_type,
             )
+            # Keyed so that sorting orders wells by plate, row (A-Z, then AA-AF) and column number.
             well_loc_measurements[
-                (plate.plate_info.number, measurement.location_identifier)
+                (plate.plate_info.number, len(result.col), result.col, int(result.row))
             ].append(measurement)
 
     measurement_time = data.plate_list.get_measurement_time()
@@ -774,10 +798,7 @@ def create_measurement_groups(data: Data) -> list[MeasurementGroup]:
             experimental_data_identifier=data.basic_assay_info.assay_id,
             measurements=well_loc_measurements[well_location],
         )
-        for well_location in sorted(
-            well_loc_measurements.keys(),
-            key=lambda key: (key[0], key[1][0], int(key[1][1:])),
-        )
+        for well_location in sorted(well_loc_measurements)
     ]
 
 
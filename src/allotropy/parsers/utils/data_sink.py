@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+import os
+from typing import Any
+
+import numpy.typing as npt
+import pandas as pd
+
+# Columns of a table, by column name.
+TableData = dict[str, npt.NDArray[Any]]
+
+
+class DataSink(ABC):
+    """Destination for tables of data written alongside the ASM, e.g. Biacore sensorgrams or data cubes."""
+
+    @abstractmethod
+    def write(self, name: str, data: TableData) -> str:
+        """
+        Stores a table
+        :param name: file name of the table, e.g. <file>_cycle_1_sensorgram.parquet
+        :param data: the table columns
+        :return: the path the ASM refers to the table by
+        """
+
+
+class DirectorySink(DataSink):
+    """Writes each table to a parquet file in a directory."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def write(self, name: str, data: TableData) -> str:
+        path = os.path.join(self.directory, name)
+        pd.DataFrame(data).to_parquet(path, index=False)
+        return path
+
+
+class MemorySink(DataSink):
+    """Keeps each table in memory, by name."""
+
+    def __init__(self) -> None:
+        self.tables: dict[str, TableData] = {}
+
+    def write(self, name: str, data: TableData) -> str:
+        self.tables[name] = data
+        return name
+
+
+class CallbackSink(DataSink):
+    """Passes each table to a callback, which returns the path to refer to it by (or None to use its name)."""
+
+    def __init__(self, callback: Callable[[str, TableData], str | None]):
+        self.callback = callback
+
+    def write(self, name: str, data: TableData) -> str:
+        return self.callback(name, data) or name
+
+
+def read_parquet_table(path: str) -> TableData:
+    """Reads a table written by DirectorySink."""
+    data = pd.read_parquet(path)
+    return {str(column): data[column].to_numpy() for column in data.columns}
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable
 from enum import Enum
+from functools import cached_property
+import math
 import os
 import re
 from typing import Any, Literal, overload, TypeVar
@@ -33,11 +35,16 @@ MapType = TypeVar("MapType")
 def map_rows(
     data_frame: pd.DataFrame, func: Callable[[SeriesData], MapType]
 ) -> list[MapType]:
-    def run_with_data(series: pd.Series[str]) -> MapType:
-        return func(SeriesData(series))
+    if not data_frame.columns.is_unique:
+        # Looking up a duplicated column returns all of them, which only a row series can represent.
+        key_matcher = KeyMatcher(data_frame.columns)
 
-    # pandas can't find a matching overload for this, but it works and returns the correct type...
-    return list(data_frame.apply(run_with_data, axis="columns"))  # type: ignore[call-overload]
+        def run_with_data(series: pd.Series[str]) -> MapType:
+            return func(SeriesData(series, key_matcher))
+
+        # pandas can't find a matching overload for this, but it works and returns the correct type...
+        return list(data_frame.apply(run_with_data, axis="columns"))  # type: ignore[call-overload]
+    return [func(row) for row in ColumnData(data_frame).rows()]
 
 
 def rm_df_columns(data: pd.DataFrame, pattern: str) -> pd.DataFrame:
@@ -214,6 +221,45 @@ TypeAndKeyAndMsg = tuple[Type_[T], KeyOrKeys, str]
 ValidateRaw = Callable[[Any], bool] | None
 
 
+def _convert(type_: Type_[T], raw_value: Any) -> T | None:
+    try:
+        # bool needs special handling to convert
+        if type_ is bool:
+            raw_value = (
+                None
+                if raw_value is None
+                else ("true" if str_to_bool(str(raw_value)) else "")
+            )
+        if type_ is float and isinstance(raw_value, str) and "%" in raw_value:
+            raw_value = raw_value.strip("%")
+        convert = try_float_or_none if type_ is float else type_
+        # mypy can't figure out that try_float_or_none will only be used when type_ is float.
+        return None if raw_value is None else convert(raw_value)  # type: ignore[operator]
+    except ValueError:
+        return None
+
+
+class KeyMatcher:
+    """
+    Matches regex patterns against the keys of an index, caching the matched keys for each pattern.
+
+    SeriesData for rows of the same DataFrame share one, so each pattern is only matched once per file.
+    """
+
+    def __init__(self, index: pd.Index[Any]) -> None:
+        self.index = index
+        self.keys: frozenset[str] = frozenset(index.to_list())
+        self.matches: dict[str, frozenset[str]] = {}
+
+    def match(self, pattern: str) -> frozenset[str]:
+        if pattern not in self.matches:
+            regex = re.compile(pattern)
+            self.matches[pattern] = frozenset(
+                key for key in self.index if regex.fullmatch(key)
+            )
+        return self.matches[pattern]
+
+
 class SeriesData:
     class ValidateRawMode(Enum):
         # Return None for key is raw value is None or np.isna
@@ -227,16 +273,38 @@ class SeriesData:
             return None if (v is None or pd.isna(v)) else v
         return v
 
-    def __init__(self, series: pd.Series[Any]) -> None:
-        self.series = series
+    def __init__(
+        self, series: pd.Series[Any], key_matcher: KeyMatcher | None = None
+    ) -> None:
+        self._series = series
+        self._key_matcher = key_matcher
         self.read_keys: set[str] = set()
         self.errored = False
 
+    @property
+    def series(self) -> pd.Series[Any]:
+        return self._series
+
+    @property
+    def index(self) -> pd.Index[Any]:
+        return self.series.index
+
+    @property
+    def key_matcher(self) -> KeyMatcher:
+        if self._key_matcher is None:
+            self._key_matcher = KeyMatcher(self.index)
+        return self._key_matcher
+
+    def _get_value(
+        self, type_: Type_[T], key: str, validate: ValidateRawMode | None
+    ) -> T | None:
+        return _convert(type_, self._validate_raw(self.series.get(key), validate))
+
     def __del__(self) -> None:
         if self.errored:
             return
         # NOTE: this will be turned on by default when all callers have been updated to pass the warning.
-        if unread_keys := set(self.series.index.to_list()) - self.read_keys:
+        if unread_keys := self.key_matcher.keys - self.read_keys:
             if os.getenv("WARN_UNUSED_KEYS"):
                 warnings.warn(
                     f"SeriesData went out of scope without reading all keys, unread: {sorted(unread_keys)}.",
@@ -249,13 +317,9 @@ class SeriesData:
         return self.get(str, key)
 
     def _get_matching_keys(self, key_or_keys: str | set[str]) -> set[str]:
-        return {
-            matched
-            for regex_key in (
-                key_or_keys if isinstance(key_or_keys, set) else {key_or_keys}
-            )
-            for matched in [k for k in self.series.index if re.fullmatch(regex_key, k)]
-        }
+        if isinstance(key_or_keys, str):
+            return set(self.key_matcher.match(key_or_keys))
+        return set().union(*(self.key_matcher.match(key) for key in key_or_keys))
 
     def get_custom_keys(
         self, key_or_keys: str | set[str]
@@ -276,14 +340,12 @@ class SeriesData:
         # them from the destructor warning.
         self.read_keys |= skip
         matching_keys = (
-            self._get_matching_keys(regex)
-            if regex
-            else set(self.series.index.to_list())
+            self._get_matching_keys(regex) if regex else set(self.key_matcher.keys)
         )
         return self.get_custom_keys(matching_keys - self.read_keys)
 
     def has_key(self, key: str) -> bool:
-        return key in self.series
+        return key in self.index
 
     def __getitem__(self, type_and_key: TypeAndKey[T] | TypeAndKeyAndMsg[T]) -> T:
         """
@@ -376,20 +438,117 @@ class SeriesData:
                 lambda k: self.get(type_, k, validate=validate), key
             )
         self.read_keys.add(key)
-        raw_value = self._validate_raw(self.series.get(key), validate)
-        try:
-            # bool needs special handling to convert
-            if type_ is bool:
-                raw_value = (
-                    None
-                    if raw_value is None
-                    else ("true" if str_to_bool(str(raw_value)) else "")
-                )
-            if type_ is float and isinstance(raw_value, str) and "%" in raw_value:
-                raw_value = raw_value.strip("%")
-            convert = try_float_or_none if type_ is float else type_
-            # mypy can't figure out that try_float_or_none will only be used when type_ is float.
-            value = None if raw_value is None else convert(raw_value)  # type: ignore[operator]
-        except ValueError:
-            value = None
+        value = self._get_value(type_, key, validate)
         return default if value is None else value
+
+
+class ColumnData:
+    """
+    Column oriented access to the rows of a DataFrame.
+
+    Each column is converted to a requested type once, for all rows, and cached. rows() returns lightweight
+    SeriesData views that read from the converted columns, so the same conversion and validation rules apply
+    as for a SeriesData built from each row, without constructing a Series per row.
+    """
+
+    def __init__(self, data_frame: pd.DataFrame) -> None:
+        if not data_frame.columns.is_unique:
+            msg = f"Unable to access columns by name, column names are not unique: {data_frame.columns.tolist()}."
+            raise AllotropeConversionError(msg)
+        self.data_frame = data_frame
+        # Same values (and dtype) as the row series DataFrame.apply passes, so conversions match SeriesData.
+        self.values = data_frame.to_numpy()
+        self.column_indices = {key: i for i, key in enumerate(data_frame.columns)}
+        self.key_matcher = KeyMatcher(data_frame.columns)
+        self.converted: dict[
+            tuple[Callable[..., Any], str, SeriesData.ValidateRawMode | None],
+            list[Any],
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def rows(self) -> list[SeriesData]:
+        return [_RowData(self, row) for row in range(len(self))]
+
+    def get_row_series(self, row: int) -> pd.Series[Any]:
+        series: pd.Series[Any] = pd.Series(
+            self.values[row],
+            index=self.data_frame.columns,
+            name=self.data_frame.index[row],
+        )
+        return series
+
+    def get_column(
+        self,
+        type_: Type_[T],
+        key: str,
+        validate: SeriesData.ValidateRawMode | None = None,
+    ) -> list[T | None]:
+        """
+        Get all values of a column converted to the specified type, as SeriesData.get would for each row.
+        A missing column is all None. Conversion errors other than ValueError are raised when the row is read.
+        """
+        cache_key = (type_, key, validate)
+        if cache_key not in self.converted:
+            self.converted[cache_key] = self._convert_column(type_, key, validate)
+        return self.converted[cache_key]
+
+    def _convert_column(
+        self,
+        type_: Type_[T],
+        key: str,
+        validate: SeriesData.ValidateRawMode | None,
+    ) -> list[Any]:
+        if key not in self.column_indices:
+            return [None] * len(self)
+        column_index = self.column_indices[key]
+        column = self.values[:, column_index]
+        if type_ is float and self.data_frame.dtypes.iloc[column_index] == "float64":
+            # Each value is already a float, so conversion is a copy into python floats. Other float dtypes are
+            # converted via str as below, e.g. so float32 0.1 stays 0.1 rather than 0.10000000149011612.
+            values: list[Any] = [float(value) for value in column]
+            if validate is SeriesData.NOT_NAN:
+                return [None if math.isnan(value) else value for value in values]
+            return values
+
+        converted: list[Any] = []
+        for raw_value in column:
+            try:
+                converted.append(
+                    _convert(type_, SeriesData._validate_raw(raw_value, validate))
+                )
+            except Exception as e:
+                converted.append(_ConversionError(e))
+        return converted
+
+
+class _ConversionError:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+class _RowData(SeriesData):
+    def __init__(self, columns: ColumnData, row: int) -> None:
+        self.columns = columns
+        self.row = row
+        self._key_matcher = columns.key_matcher
+        self.read_keys = set()
+        self.errored = False
+
+    @cached_property
+    def series(self) -> pd.Series[Any]:
+        # Only built if a parser reads the row as a series, then kept for the row like SeriesData's.
+        return self.columns.get_row_series(self.row)
+
+    @property
+    def index(self) -> pd.Index[Any]:
+        return self.columns.data_frame.columns
+
+    def _get_value(
+        self, type_: Type_[T], key: str, validate: SeriesData.ValidateRawMode | None
+    ) -> T | None:
+        value = self.columns.get_column(type_, key, validate)[self.row]
+        if isinstance(value, _ConversionError):
+            raise value.error
+        return value
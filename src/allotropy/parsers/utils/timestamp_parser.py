@@ -1,28 +1,148 @@
-from datetime import timedelta, timezone, tzinfo
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from dateutil import parser, tz, zoneinfo
 
 from allotropy.exceptions import AllotropeConversionError
 
-TIMEZONE_CODES_MAP = {
-    **{code: tz.gettz(code) for code in zoneinfo.get_zonefile_instance().zones.keys()},
-    # Add daylight savings time codes for USA
-    **{
-        "EDT": timezone(timedelta(hours=-4), "EDT"),
-        "CDT": timezone(timedelta(hours=-5), "CDT"),
-        "MDT": timezone(timedelta(hours=-6), "MDT"),
-        "PDT": timezone(timedelta(hours=-7), "PDT"),
-    },
+# Daylight savings time codes for USA
+DST_TIMEZONE_CODES: dict[str, tzinfo] = {
+    "EDT": timezone(timedelta(hours=-4), "EDT"),
+    "CDT": timezone(timedelta(hours=-5), "CDT"),
+    "MDT": timezone(timedelta(hours=-6), "MDT"),
+    "PDT": timezone(timedelta(hours=-7), "PDT"),
 }
 
 
+class TimezoneCodes(Mapping[str, tzinfo | None]):
+    """The timezones for the timezone codes dateutil finds in timestamps.
+
+    The codes are the names of the timezones in dateutil's zoneinfo, and USA daylight savings time codes. The zoneinfo
+    names are only read, and a timezone only loaded, when a timestamp contains a code, rather than on import.
+    """
+
+    def __init__(self) -> None:
+        self._zone_names: frozenset[str] | None = None
+        self._timezones: dict[str, tzinfo | None] = {}
+
+    @property
+    def zone_names(self) -> frozenset[str]:
+        if self._zone_names is None:
+            self._zone_names = frozenset(zoneinfo.get_zonefile_instance().zones)
+        return self._zone_names
+
+    def __getitem__(self, code: str) -> tzinfo | None:
+        if code in DST_TIMEZONE_CODES:
+            return DST_TIMEZONE_CODES[code]
+        if code not in self.zone_names:
+            raise KeyError(code)
+        if code not in self._timezones:
+            self._timezones[code] = tz.gettz(code)
+        return self._timezones[code]
+
+    def __contains__(self, code: object) -> bool:
+        # dateutil checks whether every timestamp's code (None if there is none) is in the mapping.
+        return isinstance(code, str) and (
+            code in DST_TIMEZONE_CODES or code in self.zone_names
+        )
+
+    def __bool__(self) -> bool:
+        # dateutil checks that tzinfos is truthy for every timestamp, which would otherwise read the zone names.
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.zone_names | DST_TIMEZONE_CODES.keys())
+
+    def __len__(self) -> int:
+        return len(self.zone_names | DST_TIMEZONE_CODES.keys())
+
+
+TIMEZONE_CODES_MAP = TimezoneCodes()
+
+
+# Formats a file's timestamps can be learned as, to parse them with strptime rather than dateutil. strptime accepts
+# a string in one of these formats only where dateutil would read it the same way, so e.g. two digit years (which
+# the two resolve to different centuries) and %H with %p (where strptime ignores the AM/PM) are left out.
+LEARNABLE_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%d %I:%M:%S %p",
+    "%Y-%m-%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+    "%d-%b-%Y %H:%M:%S",
+    "%d %b %Y %H:%M:%S",
+)
+
+
+@dataclass
+class TimestampParserStats:
+    # Timestamps returned from the LRU cache of parsed strings.
+    cache_hits: int = 0
+    # Timestamps parsed with the learned format.
+    format_hits: int = 0
+    # Timestamps parsed with dateutil.
+    fallbacks: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.cache_hits + self.format_hits + self.fallbacks
+
+    @property
+    def cache_hit_rate(self) -> float:
+        return self.cache_hits / self.total if self.total else 0.0
+
+    @property
+    def format_hit_rate(self) -> float:
+        """The share of timestamps not served from the cache that the learned format parsed."""
+        parsed = self.format_hits + self.fallbacks
+        return self.format_hits / parsed if parsed else 0.0
+
+
 # TODO: TimestampParser should support localization -- e.g., passing "dayfirst=True" to dateutil.parser.parse.
 class TimestampParser:
+    """Parses timestamps to ISO 8601 strings.
+
+    Parsed strings are kept in an LRU cache, and the format of the file's timestamps is learned from the first one
+    dateutil parses, so later timestamps in the same format are parsed with strptime. Anything strptime can not parse
+    still goes through dateutil. Vendor.get_parser creates a timestamp parser for each vendor parser, so the cache and
+    learned format usually last for a single file.
+    """
+
     default_timezone: tzinfo
+    learned_format: str | None
 
-    def __init__(self, default_timezone: tzinfo | None = None):
+    def __init__(
+        self, default_timezone: tzinfo | None = None, *, cache_size: int = 4096
+    ):
         self.default_timezone = default_timezone or ZoneInfo("UTC")
+        self.learned_format = None
+        self._format_hits = 0
+        self._fallbacks = 0
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+
+    @property
+    def stats(self) -> TimestampParserStats:
+        return TimestampParserStats(
+            cache_hits=self._parse_cached.cache_info().hits,
+            format_hits=self._format_hits,
+            fallbacks=self._fallbacks,
+        )
 
     def parse(self, time: str) -> str:
         """Parse a string to a datetime, then format as an ISO 8601 string.
@@ -32,11 +152,38 @@ class TimestampParser:
         :param time: the string to parse
         :raises AllotropeConversionError if time cannot be parsed
         """
+        return self._parse_cached(time)
+
+    def _parse(self, time: str) -> str:
+        if self.learned_format:
+            try:
+                timestamp = datetime.strptime(time, self.learned_format)  # noqa: DTZ007
+            except ValueError:
+                pass
+            else:
+                self._format_hits += 1
+                return self._format(timestamp)
+
+        self._fallbacks += 1
         try:
             timestamp = parser.parse(time, tzinfos=TIMEZONE_CODES_MAP, fuzzy=True)
         except ValueError as e:
             msg = f"Could not parse time '{time}'."
             raise AllotropeConversionError(msg) from e
+        self.learned_format = self._learn_format(time, timestamp) or self.learned_format
+        return self._format(timestamp)
+
+    def _format(self, timestamp: datetime) -> str:
         if not timestamp.tzinfo:
             timestamp = timestamp.replace(tzinfo=self.default_timezone)
         return str(timestamp.isoformat())
+
+    def _learn_format(self, time: str, timestamp: datetime) -> str | None:
+        for format_ in LEARNABLE_FORMATS:
+            try:
+                learned = datetime.strptime(time, format_)  # noqa: DTZ007
+            except ValueError:
+                continue
+            if self._format(learned) == self._format(timestamp):
+                return format_
+        return None
@@ -1,24 +1,132 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from hashlib import sha1, sha256
+import os
+from threading import Lock
 import uuid
 
+from allotropy.exceptions import AllotropeConversionError
+from allotropy.named_file_contents import NamedFileContents
+
+# Number of UUIDs BlockRandomUuidGenerator draws the random bytes for at once.
+DEFAULT_BLOCK_SIZE = 1024
+# Size of the chunks ContentHashUuidGenerator reads file contents in to hash them.
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _format_uuid(hex_digits: str, version: int) -> str:
+    # The same as str(uuid.UUID(hex=hex_digits, version=version)), without creating a UUID object for every id.
+    variant = "89ab"[int(hex_digits[16], 16) & 3]
+    return f"{hex_digits[:8]}-{hex_digits[8:12]}-{version}{hex_digits[13:16]}-{variant}{hex_digits[17:20]}-{hex_digits[20:32]}"
+
 
 class IdGenerator(ABC):
     @abstractmethod
     def generate_id(self) -> str:
         raise NotImplementedError
 
+    def for_contents(
+        self, named_file_contents: NamedFileContents  # noqa: ARG002
+    ) -> IdGenerator:
+        """Return the generator to use for converting the given file (by default, this generator)."""
+        return self
+
 
 class _RandomUuidGenerator(IdGenerator):
     def generate_id(self) -> str:
         return str(uuid.uuid4())
 
 
-_ID_GENERATOR = _RandomUuidGenerator()
+class BlockRandomUuidGenerator(IdGenerator):
+    """Generates random (version 4) UUIDs from random bytes drawn for a block of UUIDs at a time.
+
+    uuid.uuid4 reads from os.urandom for every UUID. The block is discarded in a forked process, so parent and
+    child never hand out the same UUIDs.
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        self.block_size = block_size
+        self._ids: list[str] = []
+        self._pid = os.getpid()
+        self._lock = Lock()
+
+    def generate_id(self) -> str:
+        with self._lock:
+            if not self._ids or self._pid != os.getpid():
+                self._pid = os.getpid()
+                hex_digits = os.urandom(16 * self.block_size).hex()
+                self._ids = [
+                    _format_uuid(hex_digits[i : i + 32], 4)
+                    for i in range(0, len(hex_digits), 32)
+                ]
+            return self._ids.pop()
+
+
+class ContentHashUuidGenerator(IdGenerator):
+    """Generates name based (version 5) UUIDs from a hash of the converted file's contents and a counter.
+
+    Converting the same file contents again with the same seed gives the same UUIDs, so the output can be cached
+    and diffed. The file contents must be seekable, so that they can be read for the hash and again by the parser.
+    """
+
+    def __init__(self, seed: bytes = b""):
+        self.namespace = uuid.UUID(bytes=sha256(seed).digest()[:16])
+        self.next_id = 0
+
+    def generate_id(self) -> str:
+        # The same as str(uuid.uuid5(self.namespace, str(self.next_id))).
+        name = self.namespace.bytes + str(self.next_id).encode()
+        self.next_id += 1
+        return _format_uuid(sha1(name, usedforsecurity=False).hexdigest(), 5)
+
+    def for_contents(self, named_file_contents: NamedFileContents) -> IdGenerator:
+        contents = named_file_contents.contents
+        if not contents.seekable():
+            msg = f"Unable to hash the contents of {named_file_contents.original_file_path} for identifiers, the contents stream is not seekable."
+            raise AllotropeConversionError(msg)
+        # The same as ContentHashUuidGenerator(self.namespace.bytes + <contents>), without reading all the
+        # contents into memory at once.
+        hash_ = sha256(self.namespace.bytes)
+        position = contents.tell()
+        while chunk := contents.read(HASH_CHUNK_SIZE):
+            hash_.update(chunk.encode() if isinstance(chunk, str) else chunk)
+        contents.seek(position)
+        generator = ContentHashUuidGenerator()
+        generator.namespace = uuid.UUID(bytes=hash_.digest()[:16])
+        return generator
+
+
+_DEFAULT_ID_GENERATOR: IdGenerator = _RandomUuidGenerator()
+_ID_GENERATOR: ContextVar[IdGenerator | None] = ContextVar("id_generator", default=None)
+
+
+def get_default_id_generator() -> IdGenerator:
+    return _DEFAULT_ID_GENERATOR
+
+
+def set_default_id_generator(id_generator: IdGenerator) -> None:
+    """Set the generator used for conversions in this process that are not given one."""
+    global _DEFAULT_ID_GENERATOR  # noqa: PLW0603
+    _DEFAULT_ID_GENERATOR = id_generator
+
+
+@contextmanager
+def use_id_generator(id_generator: IdGenerator) -> Iterator[None]:
+    """Use the given generator for ids generated in this context (e.g. while converting one file)."""
+    token = _ID_GENERATOR.set(id_generator)
+    try:
+        yield
+    finally:
+        _ID_GENERATOR.reset(token)
 
 
 class _IdGeneratorFactory:
     def get_id_generator(self) -> IdGenerator:
-        return _ID_GENERATOR
+        return _ID_GENERATOR.get() or _DEFAULT_ID_GENERATOR
 
 
 __ID_GENERATOR_FACTORY = _IdGeneratorFactory()
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Generic, TypeVar
+from typing import Generic, TYPE_CHECKING, TypeVar
 
 from allotropy.allotrope.models.shared.definitions.definitions import TDateTimeValue
 from allotropy.allotrope.schema_mappers.schema_mapper import SchemaMapper
@@ -9,6 +9,10 @@ from allotropy.named_file_contents import NamedFileContents
 from allotropy.parsers.release_state import ReleaseState
 from allotropy.parsers.utils.timestamp_parser import TimestampParser
 
+# Only imported for typing, since data_sink imports pandas, which parser_factory is kept free of.
+if TYPE_CHECKING:
+    from allotropy.parsers.utils.data_sink import DataSink
+
 Data = TypeVar("Data")
 Model = TypeVar("Model")
 Mapper = TypeVar("Mapper")
@@ -27,9 +31,16 @@ class VendorParser(ABC, Generic[Data, Model]):
     SCHEMA_MAPPER: Callable[..., SchemaMapper[Data, Model]]
 
     timestamp_parser: TimestampParser
-
-    def __init__(self, timestamp_parser: TimestampParser | None = None):
+    # Where parsers that write tables of data alongside the ASM store them, if None each parser's own default.
+    data_sink: "DataSink | None"
+
+    def __init__(
+        self,
+        timestamp_parser: TimestampParser | None = None,
+        data_sink: "DataSink | None" = None,
+    ):
         self.timestamp_parser = timestamp_parser or TimestampParser()
+        self.data_sink = data_sink
 
     def _get_mapper(self) -> SchemaMapper[Data, Model]:
         return self.SCHEMA_MAPPER(self.asm_converter_name, self._get_date_time)
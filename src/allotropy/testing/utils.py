@@ -6,6 +6,8 @@ from contextlib import contextmanager
 import json
 from pathlib import Path, PurePosixPath, PureWindowsPath
 import shutil
+import subprocess
+import sys
 import tempfile
 from typing import Any
 from unittest import mock
@@ -23,6 +25,24 @@ from allotropy.to_allotrope import allotrope_from_file
 DictType = Mapping[str, Any]
 
 
+def get_imported_modules(module: str, check: str = "") -> set[str]:
+    """Import module in a new interpreter and return the names of all modules imported by it.
+
+    check is run in the interpreter after the import, e.g. an assert on the module's state, and fails the call if it
+    raises. Use this to check what importing a module does without the modules other tests imported.
+    """
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}\n{check}"]
+    result = subprocess.run(
+        command, capture_output=True, text=True, check=True  # noqa: S603
+    )
+    # Lines are "import time: <self us> | <cumulative us> | <module>", after a header line.
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()[1:]
+        if line.startswith("import time:")
+    }
+
+
 def _replace_asm_converter_version(allotrope_dict: DictType) -> DictType:
     new_dict = dict(allotrope_dict)
     for key, value in new_dict.items():
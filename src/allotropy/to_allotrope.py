@@ -1,10 +1,21 @@
 from datetime import tzinfo
-from typing import Any
+from pathlib import PureWindowsPath
+from typing import Any, IO
 
-from allotropy.allotrope.allotrope import serialize_and_validate_allotrope
+from allotropy.allotrope.allotrope import (
+    serialize_and_validate_allotrope,
+    write_allotrope,
+)
+from allotropy.allotrope.data_cube_tables import write_data_cube_tables
 from allotropy.exceptions import AllotropeConversionError
 from allotropy.named_file_contents import NamedFileContents
 from allotropy.parser_factory import Vendor
+from allotropy.parsers.utils.data_sink import DataSink
+from allotropy.parsers.utils.uuids import (
+    get_default_id_generator,
+    IdGenerator,
+    use_id_generator,
+)
 from allotropy.types import IOType
 
 VendorType = Vendor | str
@@ -16,19 +27,51 @@ def allotrope_from_io(
     vendor_type: VendorType,
     default_timezone: tzinfo | None = None,
     encoding: str | None = None,
+    id_generator: IdGenerator | None = None,
+    data_sink: DataSink | None = None,
 ) -> dict[str, Any]:
     model = allotrope_model_from_io(
-        contents, filepath, vendor_type, default_timezone, encoding
+        contents,
+        filepath,
+        vendor_type,
+        default_timezone,
+        encoding,
+        id_generator,
+        data_sink,
     )
     return serialize_and_validate_allotrope(model)
 
 
+def allotrope_to_stream(
+    contents: IOType,
+    filepath: str,
+    vendor_type: VendorType,
+    out: IO[str],
+    default_timezone: tzinfo | None = None,
+    encoding: str | None = None,
+    id_generator: IdGenerator | None = None,
+    data_sink: DataSink | None = None,
+) -> None:
+    model = allotrope_model_from_io(
+        contents,
+        filepath,
+        vendor_type,
+        default_timezone,
+        encoding,
+        id_generator,
+        data_sink,
+    )
+    write_allotrope(model, out)
+
+
 def allotrope_model_from_io(
     contents: IOType,
     filepath: str,
     vendor_type: VendorType,
     default_timezone: tzinfo | None = None,
     encoding: str | None = None,
+    id_generator: IdGenerator | None = None,
+    data_sink: DataSink | None = None,
 ) -> Any:
     try:
         vendor = Vendor(vendor_type)
@@ -39,8 +82,18 @@ def allotrope_model_from_io(
     if named_file_contents.extension not in vendor.supported_extensions:
         msg = f"Unsupported file extension '{named_file_contents.extension}' for parser '{vendor.display_name}', expected one of '{vendor.supported_extensions}'."
         raise AllotropeConversionError(msg)
-    parser = vendor.get_parser(default_timezone=default_timezone)
-    return parser.to_allotrope(named_file_contents)
+    parser = vendor.get_parser(default_timezone=default_timezone, data_sink=data_sink)
+    # Without a generator, the process default (see set_default_id_generator) is used.
+    id_generator = (id_generator or get_default_id_generator()).for_contents(
+        named_file_contents
+    )
+    with use_id_generator(id_generator):
+        model = parser.to_allotrope(named_file_contents)
+    # With a sink, data cube data is written to tables instead of the ASM (see read_data_cube_tables), next to
+    # the tables the parser itself wrote to the sink.
+    if data_sink:
+        write_data_cube_tables(model, data_sink, PureWindowsPath(filepath).stem)
+    return model
 
 
 def allotrope_from_file(
@@ -48,8 +101,12 @@ def allotrope_from_file(
     vendor_type: VendorType,
     default_timezone: tzinfo | None = None,
     encoding: str | None = None,
+    id_generator: IdGenerator | None = None,
+    data_sink: DataSink | None = None,
 ) -> dict[str, Any]:
-    model = allotrope_model_from_file(filepath, vendor_type, default_timezone, encoding)
+    model = allotrope_model_from_file(
+        filepath, vendor_type, default_timezone, encoding, id_generator, data_sink
+    )
     return serialize_and_validate_allotrope(model)
 
 
@@ -58,6 +115,8 @@ def allotrope_model_from_file(
     vendor_type: VendorType,
     default_timezone: tzinfo | None = None,
     encoding: str | None = None,
+    id_generator: IdGenerator | None = None,
+    data_sink: DataSink | None = None,
 ) -> Any:
     try:
         with open(filepath, "rb") as f:
@@ -67,6 +126,8 @@ def allotrope_model_from_file(
                 vendor_type,
                 default_timezone=default_timezone,
                 encoding=encoding,
+                id_generator=id_generator,
+                data_sink=data_sink,
             )
     except FileNotFoundError as e:
         msg = f"File not found: {filepath}."
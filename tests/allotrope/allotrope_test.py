@@ -0,0 +1,158 @@
+import io
+import json
+from typing import Any
+
+import numpy as np
+import pytest
+
+from allotropy.allotrope.allotrope import (
+    _get_size,
+    allotrope_to_json_bytes,
+    serialize_and_validate_allotrope,
+    write_allotrope,
+)
+from allotropy.allotrope.converter import structure
+from allotropy.allotrope.models.shared.definitions.definitions import (
+    FieldComponentDatatype,
+    InvalidJsonFloat,
+    TDatacube,
+)
+from allotropy.allotrope.schema_mappers.data_cube import (
+    DataCube,
+    DataCubeComponent,
+    get_data_cube,
+)
+from allotropy.exceptions import (
+    AllotropeSerializationError,
+    AllotropeValidationError,
+)
+
+TEST_FILE_PATH = (
+    "tests/parsers/beckman_vi_cell_blu/testdata/Beckman_Vi-Cell-BLU_example01.json"
+)
+
+
+def _get_model() -> object:
+    with open(TEST_FILE_PATH) as f:
+        return structure(json.load(f))
+
+
+@pytest.mark.parametrize("batch_size", [1, 100, 10000])
+def test_write_allotrope(monkeypatch: pytest.MonkeyPatch, batch_size: int) -> None:
+    monkeypatch.setattr("allotropy.allotrope.allotrope._BATCH_SIZE", batch_size)
+    model = _get_model()
+    out = io.StringIO()
+    write_allotrope(model, out)
+
+    assert out.getvalue() == json.dumps(
+        serialize_and_validate_allotrope(model), ensure_ascii=False
+    )
+
+
+def test_write_allotrope_validates_sub_documents(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("allotropy.allotrope.allotrope._BATCH_SIZE", 1)
+    model = _get_model()
+    cell_counting_documents = model.cell_counting_aggregate_document.cell_counting_document  # type: ignore[attr-defined]
+    measurement_document = cell_counting_documents[
+        -1
+    ].measurement_aggregate_document.measurement_document[0]
+    measurement_document.measurement_identifier = 1
+
+    out = io.StringIO()
+    with pytest.raises(
+        AllotropeValidationError,
+        match=r"1 is not valid under any of the given schemas(.|\n)*On instance\['cell counting aggregate document'\]\['cell counting document'\]\[0\]",
+    ):
+        write_allotrope(model, out)
+    # Documents before the invalid one have been written.
+    assert out.getvalue().count('"measurement identifier"') == (
+        len(cell_counting_documents) - 1
+    )
+
+    out = io.StringIO()
+    write_allotrope(model, out, validate=False)
+    assert json.loads(out.getvalue())
+
+
+def test_get_size_counts_array_values() -> None:
+    component = DataCubeComponent(FieldComponentDatatype.double, "value", "RFU")
+    data_cube = get_data_cube(
+        DataCube(
+            label="cube",
+            structure_dimensions=[component],
+            structure_measures=[component, component],
+            dimensions=[np.arange(1000.0)],
+            measures=[np.zeros(1000), [1.0, None, 3.0]],
+        ),
+        TDatacube,
+    )
+    assert data_cube
+    assert data_cube.data
+    sizes: dict[int, int] = {}
+
+    _get_size(data_cube, sizes)
+
+    # The dimension and measure values, and the unset points.
+    assert sizes[id(data_cube.data)] == 1000 + 1000 + 3 + 1
+
+
+def test_allotrope_to_json_bytes() -> None:
+    model = _get_model()
+    allotrope_dict = serialize_and_validate_allotrope(model)
+    out = io.StringIO()
+    write_allotrope(model, out)
+
+    data = allotrope_to_json_bytes(allotrope_dict)
+
+    assert data == json.dumps(allotrope_dict, ensure_ascii=False).encode()
+    assert data == out.getvalue().encode()
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("µL", '"µL"'),
+        (None, "null"),
+        ([1.5, None, 3], "[1.5, null, 3]"),
+        ({"a": [{}, []], "b": 1}, '{"a": [{}, []], "b": 1}'),
+        ("a, b: c", '"a, b: c"'),
+        ('say "a, b"', '"say \\"a, b\\""'),
+        ("a:\\", '"a:\\\\"'),
+        (1e-05, "1e-05"),
+        (-1.5e-10, "-1.5e-10"),
+        (1e16, "1e+16"),
+        (2**64, str(2**64)),
+        (float("nan"), "NaN"),
+        ([None, float("inf")], "[null, Infinity]"),
+        ("1e-05", '"1e-05"'),
+        (np.float64(0.1), "0.1"),
+        (np.int64(3), "3"),
+        (InvalidJsonFloat.NaN, '"NaN"'),
+    ],
+)
+def test_allotrope_to_json_bytes_values(value: Any, expected: str) -> None:
+    assert (
+        allotrope_to_json_bytes({"value": value}) == f'{{"value": {expected}}}'.encode()
+    )
+
+
+def test_allotrope_to_json_bytes_without_json_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Documents orjson writes the same way as json do not fall back to json.
+    monkeypatch.setattr("allotropy.allotrope.allotrope.json", None)
+
+    assert (
+        allotrope_to_json_bytes({"a": [1.5, "b, c: d", {"e": None}]})
+        == b'{"a": [1.5, "b, c: d", {"e": null}]}'
+    )
+
+
+def test_allotrope_to_json_bytes_invalid_value() -> None:
+    with pytest.raises(
+        AllotropeSerializationError,
+        match="Failed to serialize allotrope dict to JSON: Object of type object is not JSON serializable",
+    ):
+        allotrope_to_json_bytes({"value": object()})
@@ -1,7 +1,18 @@
 from dataclasses import dataclass, field, make_dataclass
+import json
+from pathlib import Path
+from typing import Any
+
+from cattrs import Converter
+import pytest
 
 from allotropy.allotrope.converter import (
+    _convert_dict_to_model_key,
+    _convert_model_key_to_dict_key,
+    _get_key_tables,
+    _make_union_discriminator,
     add_custom_information_document,
+    setup_converter,
     structure,
     unstructure,
 )
@@ -20,6 +31,8 @@ from allotropy.allotrope.models.shared.definitions.definitions import (
     TDatacubeData,
     TDatacubeStructure,
 )
+from allotropy.allotrope.models.shared.definitions.units import HasUnit
+from allotropy.allotrope.schema_parser.path_util import get_model_class_from_schema
 
 
 def test_data_cube() -> None:
@@ -138,6 +151,8 @@ def test_custom_information_document() -> None:
         {"extra key": "Value", "weird-key/(value)°": "Other value"},
     )
 
+    # Generated models are slotted, with a slot for the custom information document.
+    assert not hasattr(item, "__dict__")
     assert item.custom_information_document.extra_key == "Value"  # type: ignore
     assert item.custom_information_document.weird_DASH_key_SLASH__OPAREN_value_CPAREN__DEG_ == "Other value"  # type: ignore
     asm_dict = unstructure(item)
@@ -154,6 +169,34 @@ def test_custom_information_document() -> None:
     assert structure(asm_dict, ProcessedDataDocumentItem) == item
 
 
+def test_custom_information_documents_share_classes() -> None:
+    @dataclass
+    class Item:
+        name: str
+
+    items = [
+        add_custom_information_document(
+            Item(name=str(i)),
+            {"sample id": f"sample {i}", "volume": {"value": i, "unit": "mL"}},
+        )
+        for i in range(2)
+    ]
+    other = add_custom_information_document(Item(name="other"), {"sample id": 1})
+
+    docs = [item.custom_information_document for item in items]  # type: ignore
+    assert len({type(doc) for doc in docs}) == 1
+    assert len({type(doc.volume) for doc in docs}) == 1
+    assert not isinstance(other.custom_information_document, type(docs[0]))  # type: ignore
+    assert not hasattr(docs[0], "__dict__")
+    assert unstructure(items[1]) == {
+        "name": "1",
+        "custom information document": {
+            "sample id": "sample 1",
+            "volume": {"value": 1, "unit": "mL"},
+        },
+    }
+
+
 def test_union_of_lists() -> None:
     @dataclass
     class D1:
@@ -205,3 +248,168 @@ def test_union_of_lists() -> None:
     obj_dict = unstructure(obj)
     assert obj_dict == {}
     assert structure(obj_dict, HasUnionOfList) == obj
+
+
+def test_unstructure_keeps_field_order_and_renames_keys() -> None:
+    @dataclass
+    class Inner:
+        pco2: float | None = None
+        confidence_interval__95__: float | None = None
+
+    @dataclass
+    class Outer:
+        field_asm_manifest: str
+        inner: Inner
+        analyst_name: str | None = None
+        sample_count: int | None = None
+
+    obj = Outer(
+        field_asm_manifest="manifest",
+        inner=Inner(confidence_interval__95__=1.0),
+        sample_count=2,
+    )
+    asm_dict = unstructure(obj)
+    assert list(asm_dict) == ["$asm.manifest", "inner", "sample count"]
+    assert asm_dict["inner"] == {"confidence interval (95%)": 1.0}
+    assert structure(asm_dict, Outer) == obj
+
+
+def test_get_key_tables() -> None:
+    @dataclass
+    class Model:
+        field_asm_manifest: str
+        confidence_interval__95__: float
+        peak_width_at_4_4___of_height: float
+        sample_identifier: str
+
+    model_to_dict_keys, dict_to_model_keys = _get_key_tables(Model)
+    assert model_to_dict_keys == {
+        "field_asm_manifest": "$asm.manifest",
+        "confidence_interval__95__": "confidence interval (95%)",
+        "peak_width_at_4_4___of_height": "peak width at 4.4 % of height",
+        "sample_identifier": "sample identifier",
+    }
+    assert dict_to_model_keys == {
+        value: key for key, value in model_to_dict_keys.items()
+    }
+    for key, dict_key in model_to_dict_keys.items():
+        assert _convert_model_key_to_dict_key(key) == dict_key
+        assert _convert_dict_to_model_key(dict_key) == key
+
+
+def test_get_key_tables_keeps_model_classes_cached() -> None:
+    tables = _get_key_tables(TDatacube)
+
+    # Passing more classes than the bounded cache for other classes holds does not evict model classes.
+    for i in range(1100):
+        _get_key_tables(make_dataclass(f"Custom{i}", ["value"]))
+
+    assert _get_key_tables(TDatacube) is tables
+
+
+@pytest.fixture
+def trial_converter(monkeypatch: pytest.MonkeyPatch) -> Converter:
+    """A converter that structures unions by trying every member, without discriminators."""
+    monkeypatch.setattr(
+        "allotropy.allotrope.converter._make_union_discriminator",
+        lambda _: lambda _: None,
+    )
+    return setup_converter()
+
+
+@dataclass(frozen=True, kw_only=True)
+class Meter(HasUnit):
+    unit: str = "m"
+
+
+@dataclass(frozen=True, kw_only=True)
+class Second(HasUnit):
+    unit: str = "s"
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeterValue(Meter):
+    value: float
+
+
+@dataclass(frozen=True, kw_only=True)
+class SecondValue(Second):
+    value: float
+
+
+@dataclass(frozen=True, kw_only=True)
+class NamedValue:
+    value: float
+    name: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeterDocument:
+    length: MeterValue
+
+
+@dataclass(frozen=True, kw_only=True)
+class SecondDocument:
+    length: SecondValue
+
+
+def test_union_discriminator() -> None:
+    discriminate = _make_union_discriminator([MeterValue, SecondValue, NamedValue])
+
+    assert discriminate([{"value": 1, "unit": "s"}]) is SecondValue
+    assert discriminate([{"value": 1, "unit": "s"}, {"value": 2}]) is SecondValue
+    assert discriminate([{"value": 1, "name": "x"}]) is NamedValue
+    # Like trial structuring, the first matching class wins.
+    assert discriminate([{"value": 1}]) is MeterValue
+    # Unmatched values are left to the fallback.
+    assert discriminate([{"value": 1, "unit": "s"}, {"value": 1, "unit": "m"}]) is None
+    assert discriminate([{"unit": "s"}]) is None
+    assert discriminate([1.0]) is None
+    assert discriminate([]) is None
+
+    # Nested values are checked against the types of the nested fields.
+    discriminate = _make_union_discriminator([MeterDocument, SecondDocument])
+    assert discriminate([{"length": {"value": 1, "unit": "s"}}]) is SecondDocument
+
+
+def test_union_discriminator_matches_trial_structuring(
+    trial_converter: Converter,
+) -> None:
+    @dataclass
+    class HasUnion:
+        quantity: MeterValue | SecondValue | NamedValue | None = None
+        quantities: list[MeterValue] | list[SecondValue] | None = None
+        document: MeterDocument | SecondDocument | None = None
+
+    asm_dicts: list[dict[str, Any]] = [
+        {"quantity": {"value": 1, "unit": "s"}},
+        {"quantity": {"value": 1, "unit": "m"}},
+        {"quantity": {"value": 1, "name": "x"}},
+        {"quantity": {"value": 1}},
+        {"quantities": [{"value": 1, "unit": "s"}, {"value": 2, "unit": "s"}]},
+        {"quantities": [{"value": 1}]},
+        {"document": {"length": {"value": 1, "unit": "s"}}},
+        {"document": {"length": {"value": 1}}},
+    ]
+    for asm_dict in asm_dicts:
+        assert structure(asm_dict, HasUnion) == trial_converter.structure(
+            asm_dict, HasUnion
+        )
+
+
+@pytest.mark.parametrize(
+    "output_path",
+    [
+        "tests/parsers/beckman_vi_cell_blu/testdata/Beckman_Vi-Cell-BLU_example01.json",
+        "tests/parsers/roche_cedex_bioht/testdata/roche_cedex_bioht_example01.json",
+        "tests/parsers/agilent_gen5/testdata/absorbance/010307_114129_BNCH654563_stdcurve_singleplate01.json",
+    ],
+)
+def test_union_discriminator_matches_trial_structuring_for_asm(
+    trial_converter: Converter, output_path: str
+) -> None:
+    with open(Path(output_path)) as f:
+        asm = json.load(f)
+    model_class = get_model_class_from_schema(asm)
+
+    assert structure(asm, model_class) == trial_converter.structure(asm, model_class)
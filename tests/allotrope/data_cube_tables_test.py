@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from allotropy.allotrope.converter import unstructure
+from allotropy.allotrope.data_cube_tables import (
+    read_data_cube_tables,
+    write_data_cube_tables,
+)
+from allotropy.allotrope.models.shared.definitions.definitions import (
+    FieldComponentDatatype,
+    TDatacube,
+)
+from allotropy.allotrope.schema_mappers.data_cube import (
+    DataCube,
+    DataCubeComponent,
+    get_data_cube,
+)
+from allotropy.parsers.utils.data_sink import MemorySink
+
+TIME = DataCubeComponent(FieldComponentDatatype.double, "time", "s")
+VALUE = DataCubeComponent(FieldComponentDatatype.double, "value", "RFU")
+
+
+@dataclass
+class Document:
+    label: str
+    cubes: list[TDatacube]
+
+
+def _get_data_cube(
+    structure_dimensions: list[DataCubeComponent],
+    structure_measures: list[DataCubeComponent],
+    dimensions: list[list[float]],
+    measures: list[list[float | None]],
+) -> TDatacube:
+    data_cube = get_data_cube(
+        DataCube(
+            label="cube",
+            structure_dimensions=structure_dimensions,
+            structure_measures=structure_measures,
+            dimensions=dimensions,
+            measures=measures,
+        ),
+        TDatacube,
+    )
+    assert data_cube
+    return data_cube
+
+
+def test_write_and_read_data_cube_tables() -> None:
+    document = Document(
+        label="document",
+        cubes=[
+            _get_data_cube(
+                [TIME], [VALUE, VALUE], [[0, 1, 2]], [[1.5, None, 3], [4, 5, 6]]
+            ),
+            # Two dimensions, so the dimensions and measures have different lengths.
+            _get_data_cube([TIME, TIME], [VALUE], [[0, 1], [0, 1]], [[1, 2, 3, 4]]),
+        ],
+    )
+    expected = unstructure(document)
+    sink = MemorySink()
+
+    write_data_cube_tables(document, sink, "file")
+
+    assert list(sink.tables) == ["file_data_cube_0.parquet"]
+    table = sink.tables["file_data_cube_0.parquet"]
+    assert list(table) == ["time", "value (1)", "value (2)"]
+    np.testing.assert_array_equal(table["value (1)"], [1.5, np.nan, 3])
+    asm = unstructure(document)
+    assert asm["cubes"][0] == {
+        "label": "cube",
+        "cube-structure": expected["cubes"][0]["cube-structure"],
+        "custom information document": {"data file": "file_data_cube_0.parquet"},
+    }
+    assert asm["cubes"][1] == expected["cubes"][1]
+    assert read_data_cube_tables(asm, sink.tables.__getitem__) == expected
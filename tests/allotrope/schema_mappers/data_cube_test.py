@@ -0,0 +1,160 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from allotropy.allotrope.converter import unstructure
+from allotropy.allotrope.models.shared.definitions.definitions import (
+    FieldComponentDatatype,
+    TDatacube,
+    TDatacubeData,
+    TFunction,
+)
+from allotropy.allotrope.schema_mappers.data_cube import (
+    DataCube,
+    DataCubeComponent,
+    encode_linear_dimensions,
+    get_data_cube,
+)
+from allotropy.exceptions import AllotropeConversionError
+
+COMPONENT = DataCubeComponent(FieldComponentDatatype.double, "concept", "unit")
+
+
+def _get_data_cube(
+    dimensions: list[Any], measures: list[Any], linear_tolerance: float | None = None
+) -> TDatacube:
+    data_cube = get_data_cube(
+        DataCube(
+            label="label",
+            structure_dimensions=[COMPONENT] * len(dimensions),
+            structure_measures=[COMPONENT] * len(measures),
+            dimensions=dimensions,
+            measures=measures,
+        ),
+        TDatacube,
+        linear_tolerance=linear_tolerance,
+    )
+    assert data_cube
+    return data_cube
+
+
+def _get_data(
+    dimensions: list[Any], measures: list[Any], linear_tolerance: float | None = None
+) -> TDatacubeData:
+    data = _get_data_cube(dimensions, measures, linear_tolerance).data
+    assert data
+    return data
+
+
+def test_get_data_cube_with_lists() -> None:
+    data = _get_data(
+        [[1, 2.5], ["a", "b"], [True, False], []],
+        [[1, None], ["a", None], [None, None]],
+    )
+
+    assert data.dimensions == [[1.0, 2.5], ["a", "b"], [1.0, 0.0], []]
+    assert data.measures == [[1.0, None], ["a", None], [None, None]]
+    assert all(isinstance(value, float) for value in data.dimensions[0])  # type: ignore[union-attr]
+
+
+def test_get_data_cube_with_mixed_list() -> None:
+    with pytest.raises(
+        AllotropeConversionError,
+        match="Unable to extract a TMeasureArray from datacube measure",
+    ):
+        _get_data([[1, 2]], [[1.0, "a"]])
+
+
+def test_get_data_cube_with_arrays() -> None:
+    dimension = np.array([1.0, 2.0])
+    measure = np.array([1.5, np.nan])
+    data_cube = _get_data_cube(
+        [dimension, np.array([1, 2])],
+        [measure, np.array(["a", "b"]), np.array([True, False])],
+    )
+
+    # Arrays with a known dtype are used as is, and only converted to lists when unstructured.
+    assert data_cube.data
+    assert data_cube.data.dimensions[0] is dimension
+    assert data_cube.data.measures
+    assert data_cube.data.measures[0] is measure
+    data = unstructure(data_cube)["data"]
+    assert data["dimensions"] == [[1.0, 2.0], [1.0, 2.0]]
+    assert isinstance(data["dimensions"][1][0], float)
+    assert data["measures"][1:] == [["a", "b"], [1.0, 0.0]]
+    assert np.isnan(data["measures"][0][1])
+
+
+def test_get_data_cube_with_arrays_matches_lists() -> None:
+    dimensions = [[1, 2.5], ["a", "b"], [True, False]]
+    measures = [[1.0, 2.0], ["a", "b"], [True, False]]
+
+    data_cube = _get_data_cube(dimensions, measures)
+    array_data_cube = _get_data_cube(
+        [np.array(dimension) for dimension in dimensions],
+        [np.array(measure) for measure in measures],
+    )
+
+    assert array_data_cube == data_cube
+    assert unstructure(array_data_cube) == unstructure(data_cube)
+    assert array_data_cube != _get_data_cube(dimensions, [[1.0, 3.0], *measures[1:]])
+
+
+def test_get_data_cube_with_object_array() -> None:
+    data = _get_data(
+        [np.array([1, 2.5], dtype=object)], [np.array([1.0, None], dtype=object)]
+    )
+
+    assert data.dimensions == [[1.0, 2.5]]
+    assert data.measures == [[1.0, None]]
+
+
+def test_get_data_cube_with_linear_dimensions() -> None:
+    data = _get_data(
+        [
+            list(range(1, 11)),
+            np.arange(0.0, 2.0, 0.1),
+            [*range(9), 10.0],
+            list(range(9)),
+            [5.0] * 10,
+            list("abcdefghij"),
+            np.array([*range(9), np.nan]),
+        ],
+        [],
+        linear_tolerance=1e-9,
+    )
+
+    assert data.dimensions[:2] == [
+        TFunction(start=1.0, length=10, incr=1.0),
+        TFunction(start=0.0, length=20, incr=pytest.approx(0.1)),  # type: ignore[arg-type]
+    ]
+    # Unevenly spaced, short and constant dimensions, strings and NaN are kept as arrays.
+    assert not any(
+        isinstance(dimension, TFunction) for dimension in data.dimensions[2:]
+    )
+    assert unstructure(data)["dimensions"][0] == {
+        "type": "linear",
+        "start": 1.0,
+        "length": 10,
+        "incr": 1.0,
+    }
+
+
+def test_get_data_cube_with_linear_dimensions_tolerance() -> None:
+    dimension = [*range(5), 5.001, *range(6, 10)]
+
+    assert _get_data([dimension], [], linear_tolerance=1e-9).dimensions == [dimension]
+    assert _get_data([dimension], [], linear_tolerance=1e-3).dimensions == [
+        TFunction(start=0.0, length=10, incr=1.0)
+    ]
+
+
+def test_get_data_cube_encode_linear_dimensions() -> None:
+    dimension = list(range(10))
+
+    assert _get_data([dimension], []).dimensions == [dimension]
+    with encode_linear_dimensions():
+        assert _get_data([dimension], []).dimensions == [
+            TFunction(start=0.0, length=10, incr=1.0)
+        ]
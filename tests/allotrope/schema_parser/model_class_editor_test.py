@@ -6,6 +6,7 @@ from allotropy.allotrope.schema_parser.model_class_editor import (
     _split_types,
     _to_or_union,
     _union_to_or,
+    add_model_base_class,
     ClassLines,
     create_class_lines,
     DataclassField,
@@ -111,24 +112,24 @@ import json
 from typing import Union
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ClassA:
     key: str
     value: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ClassB:
     key: str
     value: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class UnusedClass:
     value: int
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     key: str
     value: str
@@ -142,13 +143,13 @@ from typing import Union
 from allotropy.allotrope.models.shared.definitions import Thing1, Thing2
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ClassB:
     key: str
     value: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     key: str
     value: str
@@ -161,7 +162,7 @@ class Model:
 def test__class_lines_dataclass_parent_classes() -> None:
     class_lines = class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ClassA:
     key: str
     value: str
@@ -173,7 +174,7 @@ class ClassA:
 
     class_lines = class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ClassB(ClassA):
     key: str
     value: str
@@ -185,7 +186,7 @@ class ClassB(ClassA):
 
     class_lines = class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ClassB(ClassA, ClassC):
     key: str
     value: str
@@ -197,7 +198,7 @@ class ClassB(ClassA, ClassC):
 
     class_lines = class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ClassB(
     ClassA,
     ClassC
@@ -214,7 +215,7 @@ class ClassB(
 def test__class_lines_dataclass_field_parsing() -> None:
     class_lines = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class Test:
     key: str
     value: str
@@ -229,7 +230,7 @@ class Test:
 
     class_lines = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class Test:
     key: str|None
     value: str|None="something"
@@ -250,7 +251,7 @@ class Test:
 
     class_lines = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class Test:
     key: str
     item: Union[
@@ -282,7 +283,7 @@ class Test:
 def test__class_lines_bar_union() -> None:
     class_lines = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class Test:
     key: str | int
     value: str | None
@@ -301,7 +302,7 @@ class Test:
 def test__class_lines_merge_parent() -> None:
     parent_class = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class ClassA:
     a_required: str
     a_optional: str|None
@@ -309,7 +310,7 @@ class ClassA:
     )
     child_class = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class ClassB(ClassA):
     b_required: str
     b_optional: str|None
@@ -319,7 +320,7 @@ class ClassB(ClassA):
     validate_lines_against_multistring(
         child_class.merge_parent(parent_class),
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class ClassB:
     b_required: str
     a_required: str
@@ -332,7 +333,7 @@ class ClassB:
 def test__class_lines_merge_parent_multiple() -> None:
     parent_class = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class ClassA:
     a_required: str
     a_optional: str|None
@@ -340,7 +341,7 @@ class ClassA:
     )
     child_class = data_class_lines_from_multistring(
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class ClassB(ClassA, ClassC):
     b_required: str
     b_optional: Optional[
@@ -351,7 +352,7 @@ class ClassB(ClassA, ClassC):
     validate_lines_against_multistring(
         child_class.merge_parent(parent_class),
         """
-@dataclass(kw_only=True)
+@dataclass(kw_only=True,slots=True)
 class ClassB(ClassC):
     b_required: str
     a_required: str
@@ -364,7 +365,7 @@ class ClassB(ClassC):
 def test__class_lines_dataclass_eq() -> None:
     class_lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: Union[str, int]
 """
@@ -372,7 +373,7 @@ class Item:
 
     other_lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: Union[
         str,
@@ -412,7 +413,7 @@ TDateTimeStampValue = Union[str, TDateTimeStampValue2]
 def test__class_lines_dataclass_should_merge() -> None:
     lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: str
     special: Optional[int]
@@ -420,7 +421,7 @@ class Item:
     )
     other_lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: str
     other_special: Optional[int]
@@ -431,7 +432,7 @@ class Item1:
     # Extra required key will be added as optional
     other_lines_extra_required_key = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: str
     other_special: int
@@ -441,7 +442,7 @@ class Item1:
 
     other_lines_missing_required_key = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     other_special: Optional[int]
 """
@@ -450,7 +451,7 @@ class Item1:
 
     other_lines_non_matching_shared_key = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: str|None
 """
@@ -461,7 +462,7 @@ class Item1:
 def test__class_lines_dataclass_should_not_merge() -> None:
     lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item(Base1):
     key: str
 """
@@ -470,7 +471,7 @@ class Item(Base1):
     # Different base classes should not merge.
     other_lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1(Base2):
     key: str
 """
@@ -481,7 +482,7 @@ class Item1(Base2):
 def test__class_lines_merge_similar() -> None:
     lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: str
     other_key: str
@@ -491,7 +492,7 @@ class Item:
 
     other_lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: str
     other_key: Union[
@@ -505,7 +506,7 @@ class Item1:
     validate_lines_against_multistring(
         lines.merge_similar(other_lines),
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: str
     other_key: Union[float,int,str]
@@ -518,7 +519,7 @@ class Item:
 def test__class_lines_merge_similar_with_lists() -> None:
     lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: list[str]
 """
@@ -526,7 +527,7 @@ class Item:
 
     other_lines = data_class_lines_from_multistring(
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: list[int]
 """
@@ -535,7 +536,7 @@ class Item1:
     validate_lines_against_multistring(
         lines.merge_similar(other_lines),
         """
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: Union[list[int],list[str]]
 """,
@@ -555,17 +556,17 @@ import json
 from typing import Union
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class OptionalFieldParentClass:
     optional_parent: str|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldChildClass(OptionalFieldParentClass):
     required_child: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     key: str
     value: str
@@ -577,13 +578,13 @@ import json
 from typing import Union
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldChildClass:
     required_child: str
     optional_parent: str|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     key: str
     value: str
@@ -606,32 +607,32 @@ import json
 from typing import Union
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldParentClass:
     required_parent: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class OptionalFieldParentClass:
     optional_parent: str|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldChildClassUsingRequiredParent(RequiredFieldParentClass):
     required_child: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldChildUsingOptionalParent(OptionalFieldParentClass):
     required_child: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class OptionalFieldChildClass(OptionalFieldParentClass):
     optional_child: str|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     key: str
     thing1: RequiredFieldChildClassUsingRequiredParent
@@ -644,33 +645,33 @@ import json
 from typing import Union
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldParentClass:
     required_parent: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class OptionalFieldParentClass:
     optional_parent: str|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldChildClassUsingRequiredParent(RequiredFieldParentClass):
     required_child: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class RequiredFieldChildUsingOptionalParent:
     required_child: str
     optional_parent: str|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class OptionalFieldChildClass(OptionalFieldParentClass):
     optional_child: str|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     key: str
     thing1: RequiredFieldChildClassUsingRequiredParent
@@ -693,33 +694,33 @@ def test__modify_file_removes_identical_classes() -> None:
 import json
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item2:
     key: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item12:
     value: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ParentItem:
     item: Item1
     other_item: Item2|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     item: Item
     thing: ParentItem
@@ -730,19 +731,19 @@ class Model:
 import json
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: str|None=None
     value: str|None=None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class ParentItem:
     item: Item
     other_item: Item|None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     item: Item
     thing: ParentItem
@@ -764,27 +765,27 @@ def test__modify_file_merges_similar_classes() -> None:
 import json
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: str
     disagree: int
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item1:
     key: str
     disagree: str
     extra_key: str|None="test"
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item2:
     key: str
     disagree: str
     extra_key: str
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     item: Item
     item1: Item1
@@ -795,14 +796,14 @@ class Model:
 import json
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Item:
     key: str
     disagree: int|str
     extra_key: str|None=None
 
 
-@dataclass(frozen=True,kw_only=True)
+@dataclass(frozen=True,kw_only=True,slots=True)
 class Model:
     item: Item
     item1: Item
@@ -810,3 +811,35 @@ class Model:
     manifest: str=\"fake_manifest\"
 """
     assert editor.modify_file(model_file_contents) == expected
+
+
+def test__add_model_base_class() -> None:
+    model_file_contents = """
+@dataclass(kw_only=True,slots=True)
+class OrderedItem:
+    field_index: int|None=None
+
+
+@dataclass(frozen=True,kw_only=True,slots=True)
+class Item(OrderedItem):
+    key: str
+
+
+class Scale(Enum):
+    linear = "linear"
+"""
+    expected = """
+@dataclass(kw_only=True,slots=True)
+class OrderedItem(CustomInformationDocumentHolder):
+    field_index: int|None=None
+
+
+@dataclass(frozen=True,kw_only=True,slots=True)
+class Item(OrderedItem):
+    key: str
+
+
+class Scale(Enum):
+    linear = "linear"
+"""
+    assert add_model_base_class(model_file_contents) == expected
@@ -0,0 +1,218 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+import pytest
+
+from allotropy.allotrope.schema_parser.path_util import (
+    get_manifest_from_schema_path,
+    get_rel_schema_path,
+    get_schema_bundle_path_from_manifest,
+    get_schema_path_from_manifest,
+    SCHEMA_DIR_PATH,
+)
+from allotropy.allotrope.schema_parser.schema_bundler import (
+    bundle_schema,
+    get_unresolved_references,
+    write_schema_bundle,
+)
+from allotropy.allotrope.schemas import (
+    get_schema,
+    get_schema_bundle_from_manifest,
+    get_schema_from_manifest,
+    get_schema_source_hash,
+)
+
+CORE_SCHEMA_ID = (
+    "http://purl.allotrope.org/json-schemas/adm/core/REC/2024/06/core.schema"
+)
+STRING_VALUE_SCHEMA = {"type": "string"}
+
+
+def _get_schema(properties: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "$id": "http://purl.allotrope.org/json-schemas/adm/test/test.schema",
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "properties": properties,
+        "$defs": {
+            "local": {"type": "number"},
+            CORE_SCHEMA_ID: {
+                "$id": CORE_SCHEMA_ID,
+                "$defs": {
+                    "tStringValue": STRING_VALUE_SCHEMA,
+                    "tName": {"$ref": "#/$defs/tStringValue"},
+                    "a/b": {"type": "boolean"},
+                },
+            },
+        },
+    }
+
+
+def test_bundle_schema() -> None:
+    schema = _get_schema(
+        {
+            "local": {"$ref": "#/$defs/local"},
+            "string": {"$ref": f"{CORE_SCHEMA_ID}#/$defs/tStringValue"},
+            "nested": {"$ref": f"{CORE_SCHEMA_ID}#/$defs/tName"},
+            "escaped": {"$ref": f"{CORE_SCHEMA_ID}#/$defs/a~1b"},
+            "enum": {"enum": [{"$ref": "#/$defs/local"}]},
+        }
+    )
+
+    assert bundle_schema(schema) == {
+        "$id": "http://purl.allotrope.org/json-schemas/adm/test/test.schema",
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "properties": {
+            "local": {"type": "number"},
+            "string": STRING_VALUE_SCHEMA,
+            "nested": STRING_VALUE_SCHEMA,
+            "escaped": {"type": "boolean"},
+            "enum": {"enum": [{"$ref": "#/$defs/local"}]},
+        },
+    }
+
+
+def test_bundle_schema_reference_with_siblings() -> None:
+    schema = _get_schema(
+        {
+            "value": {
+                "$asm.pattern": "value datum",
+                "allOf": [{"minLength": 1}],
+                "$ref": f"{CORE_SCHEMA_ID}#/$defs/tStringValue",
+            }
+        }
+    )
+
+    assert bundle_schema(schema)["properties"]["value"] == {
+        "$asm.pattern": "value datum",
+        "allOf": [{"minLength": 1}, STRING_VALUE_SCHEMA],
+    }
+
+
+def test_bundle_schema_shares_dereferenced_definitions() -> None:
+    schema = _get_schema(
+        {
+            "first": {"$ref": f"{CORE_SCHEMA_ID}#/$defs/tName"},
+            "second": {"$ref": f"{CORE_SCHEMA_ID}#/$defs/tName"},
+        }
+    )
+
+    properties = bundle_schema(schema)["properties"]
+    assert properties["first"] is properties["second"]
+
+
+def test_bundle_schema_keeps_unresolvable_references() -> None:
+    schema = _get_schema(
+        {
+            "todo": {"$ref": "TODO"},
+            "missing": {"$ref": f"{CORE_SCHEMA_ID}#/$defs/missing"},
+        }
+    )
+
+    bundle = bundle_schema(schema)
+    assert get_unresolved_references(bundle) == {
+        "http://purl.allotrope.org/json-schemas/adm/test/TODO",
+        f"{CORE_SCHEMA_ID}#/$defs/missing",
+    }
+
+
+def test_bundle_schema_resolves_missing_references_to_shared_definitions() -> None:
+    units_schema_id = (
+        "http://purl.allotrope.org/json-schemas/qudt/REC/2024/03/units.schema"
+    )
+    micrometer = {"properties": {"unit": {"type": "string", "const": "µm"}}}
+    kilodalton = {"properties": {"unit": {"type": "string", "const": "kDa"}}}
+    schema = _get_schema(
+        {
+            "todo": {"$ref": "TODO"},
+            "unit": {"$ref": f"{units_schema_id}#/$defs/µm"},
+            "name": {"$ref": f"{CORE_SCHEMA_ID}#/$defs/Micrometer"},
+            "custom": {"$ref": f"{CORE_SCHEMA_ID}#/$custom/tQuantityValueKiloDalton"},
+        }
+    )
+    schema["$defs"].update({"TODO": STRING_VALUE_SCHEMA, "Micrometer": micrometer})
+    schema["$custom"] = {"tQuantityValueKiloDalton": kilodalton}
+
+    assert bundle_schema(schema)["properties"] == {
+        "todo": STRING_VALUE_SCHEMA,
+        "unit": micrometer,
+        "name": micrometer,
+        "custom": kilodalton,
+    }
+
+
+def test_bundle_schema_recursive_reference() -> None:
+    schema = _get_schema({"loop": {"$ref": "#/$defs/loop"}})
+    schema["$defs"]["loop"] = {"properties": {"child": {"$ref": "#/$defs/loop"}}}
+
+    with pytest.raises(AssertionError, match="recursive reference"):
+        bundle_schema(schema)
+
+
+@pytest.mark.parametrize(
+    "output_path",
+    [
+        "tests/parsers/agilent_gen5/testdata/absorbance/010307_114129_BNCH654563_stdcurve_singleplate01.json",
+        "tests/parsers/beckman_vi_cell_blu/testdata/Beckman_Vi-Cell-BLU_example01.json",
+        "tests/parsers/appbio_quantstudio/testdata/appbio_quantstudio_example03.json",
+    ],
+)
+def test_schema_bundle_validates_asm(output_path: str) -> None:
+    with open(Path(output_path)) as f:
+        asm = json.load(f)
+    bundle = get_schema_bundle_from_manifest(asm["$asm.manifest"])
+
+    assert not get_unresolved_references(bundle)
+    jsonschema.validators.Draft202012Validator(bundle).validate(asm)
+
+
+@pytest.mark.parametrize(
+    "schema_path",
+    [
+        get_rel_schema_path(path)
+        for path in sorted(Path(SCHEMA_DIR_PATH, "adm").rglob("*.schema.json"))
+    ],
+)
+def test_schema_bundle_has_no_unresolved_references(schema_path: Path) -> None:
+    manifest = get_manifest_from_schema_path(Path(SCHEMA_DIR_PATH, schema_path))
+
+    assert not get_unresolved_references(get_schema_bundle_from_manifest(manifest))
+
+
+def test_write_schema_bundle_unresolved_references() -> None:
+    schema_path = Path(SCHEMA_DIR_PATH, "adm/test/test.schema.json")
+
+    with pytest.raises(AssertionError, match="unresolved references"):
+        write_schema_bundle(
+            schema_path, _get_schema({"todo": {"$ref": "TODO"}}), "hash"
+        )
+
+
+def test_get_schema_bundle_from_manifest_skips_stale_bundle(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        "allotropy.allotrope.schema_parser.path_util.SCHEMA_BUNDLE_DIR_PATH", tmp_path
+    )
+    manifest = "http://purl.allotrope.org/manifests/cell-counting/BENCHLING/2023/09/cell-counting.manifest"
+    schema_path = get_schema_path_from_manifest(manifest)
+    expected = bundle_schema(get_schema_from_manifest(manifest))
+
+    bundle_path = write_schema_bundle(
+        schema_path, get_schema(schema_path), get_schema_source_hash(schema_path)
+    )
+    assert bundle_path == get_schema_bundle_path_from_manifest(manifest)
+    assert bundle_path.is_relative_to(tmp_path)
+    assert get_schema_bundle_from_manifest(manifest) == expected
+
+    # A bundle built from other sources, e.g. before a schema update, is not used.
+    with open(bundle_path, "w") as f:
+        json.dump({"source hash": "stale", "bundle": {"stale": True}}, f)
+    assert get_schema_bundle_from_manifest(manifest) == expected
+
+    with open(bundle_path, "w") as f:
+        json.dump(
+            {"source hash": get_schema_source_hash(schema_path), "bundle": {"a": 1}}, f
+        )
+    assert get_schema_bundle_from_manifest(manifest) == {"a": 1}
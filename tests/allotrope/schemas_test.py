@@ -1,6 +1,13 @@
 from pathlib import Path
 
+import pytest
+
 from allotropy.allotrope.schema_parser.path_util import SCHEMA_DIR_PATH
+from allotropy.allotrope.schemas import (
+    get_schema_bundle_from_manifest,
+    get_schema_validator,
+    get_schema_validator_from_model,
+)
 
 
 def test_custom_schemas_have_changenotes() -> None:
@@ -9,3 +16,17 @@ def test_custom_schemas_have_changenotes() -> None:
             continue
         if "BENCHLING" in str(file):
             assert Path(file.parent, "CHANGE_NOTES.md").exists()
+
+
+def test_get_schema_validator_is_cached() -> None:
+    manifest = "http://purl.allotrope.org/manifests/plate-reader/REC/2024/06/plate-reader.manifest"
+    validator = get_schema_validator(manifest)
+    assert get_schema_validator(manifest) is validator
+    assert validator.schema == get_schema_bundle_from_manifest(manifest)
+
+
+def test_get_schema_validator_from_model_without_manifest() -> None:
+    with pytest.raises(
+        ValueError, match="No 'manifest' or 'field_asm_manifest' found in model"
+    ):
+        get_schema_validator_from_model(object())
@@ -0,0 +1,188 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from allotropy.batch import (
+    _convert_files,
+    _get_output_path,
+    allotrope_from_files,
+    BatchResult,
+    main,
+)
+from allotropy.exceptions import AllotropeConversionError
+from allotropy.parser_factory import Vendor
+from allotropy.testing.utils import from_file
+
+TESTDATA_DIR = Path("tests/parsers/beckman_vi_cell_blu/testdata")
+TEST_FILE_PATHS = [
+    str(Path(TESTDATA_DIR, "Beckman_Vi-Cell-BLU_example01.csv")),
+    str(Path(TESTDATA_DIR, "Beckman_Vi-Cell-BLU_example02.csv")),
+]
+
+
+def _by_filepath(results: list[BatchResult]) -> dict[str, BatchResult]:
+    return {result.filepath: result for result in results}
+
+
+def test_allotrope_from_files() -> None:
+    results = _by_filepath(
+        list(
+            allotrope_from_files(
+                [*TEST_FILE_PATHS, "not/a/path.csv"],
+                Vendor.BECKMAN_VI_CELL_BLU,
+                max_workers=2,
+                chunk_size=1,
+            )
+        )
+    )
+
+    assert len(results) == 3
+    for filepath in TEST_FILE_PATHS:
+        result = results[filepath]
+        assert result.ok
+        assert result.vendor == Vendor.BECKMAN_VI_CELL_BLU
+        assert result.allotrope_dict is not None
+        assert result.allotrope_dict["$asm.manifest"]
+    assert not results["not/a/path.csv"].ok
+    assert results["not/a/path.csv"].error == "File not found: not/a/path.csv."
+
+
+def test_allotrope_from_files_unregistered_vendor() -> None:
+    with pytest.raises(AllotropeConversionError, match="unregistered vendor: NOPE"):
+        list(allotrope_from_files(TEST_FILE_PATHS, "NOPE"))
+
+
+def test_allotrope_from_files_writes_output(tmp_path: Path) -> None:
+    results = _by_filepath(
+        list(
+            allotrope_from_files(
+                [f"{TESTDATA_DIR}/Beckman_Vi-Cell-BLU_example0[12].csv"],
+                Vendor.BECKMAN_VI_CELL_BLU,
+                output_dir=tmp_path,
+                max_workers=1,
+            )
+        )
+    )
+
+    assert sorted(results) == TEST_FILE_PATHS
+    for filepath, result in results.items():
+        assert result.vendor == Vendor.BECKMAN_VI_CELL_BLU
+        assert result.allotrope_dict is None
+        assert result.output_path == str(Path(tmp_path, f"{Path(filepath).name}.json"))
+        with open(result.output_path) as f:
+            asm = json.load(f)
+        expected = from_file(filepath, Vendor.BECKMAN_VI_CELL_BLU)
+        assert asm["$asm.manifest"] == expected["$asm.manifest"]
+        assert len(
+            asm["cell counting aggregate document"]["cell counting document"]
+        ) == len(expected["cell counting aggregate document"]["cell counting document"])
+
+
+def test_get_output_path_keeps_input_extension(tmp_path: Path) -> None:
+    input_root = str(Path(tmp_path, "input"))
+
+    # Inputs with the same name but different extensions are written to different files.
+    assert [
+        _get_output_path(str(Path(input_root, "a", filename)), input_root, "output")
+        for filename in ["run.csv", "run.txt"]
+    ] == [Path("output", "a", "run.csv.json"), Path("output", "a", "run.txt.json")]
+
+
+def test_allotrope_from_files_detects_vendor(tmp_path: Path) -> None:
+    filepath = "tests/parsers/benchling_empower/testdata/input/example_01.json"
+    results = list(
+        allotrope_from_files(
+            [filepath, TEST_FILE_PATHS[0], "file.unknown"],
+            output_dir=tmp_path,
+            max_workers=1,
+        )
+    )
+
+    result, ambiguous_result, unknown_result = sorted(
+        results, key=lambda result: result.filepath
+    )[::-1]
+    assert result.ok
+    assert result.vendor == Vendor.BENCHLING_EMPOWER
+    assert result.output_path == str(Path(tmp_path, f"{filepath}.json"))
+    # Several parsers support .csv files, so the vendor has to be given.
+    assert ambiguous_result.error
+    assert ambiguous_result.error.startswith(
+        "Several parsers support the '.csv' file extension, set the vendor to one of: "
+    )
+    assert "BECKMAN_VI_CELL_BLU" in ambiguous_result.error
+    assert unknown_result.error == "No parser supports the '.unknown' file extension."
+
+
+def _fail_chunk(filepaths: list[str], *args: Any) -> list[BatchResult]:
+    if "fail.csv" in filepaths:
+        msg = "worker failed"
+        raise RuntimeError(msg)
+    return _convert_files(filepaths, *args)
+
+
+def test_allotrope_from_files_reports_failed_chunk(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("allotropy.batch._convert_files", _fail_chunk)
+
+    results = _by_filepath(
+        list(
+            allotrope_from_files(
+                ["fail.csv", *TEST_FILE_PATHS],
+                Vendor.BECKMAN_VI_CELL_BLU,
+                max_workers=1,
+                chunk_size=2,
+            )
+        )
+    )
+
+    assert (
+        results["fail.csv"].error
+        == "Failed to convert chunk: RuntimeError: worker failed"
+    )
+    assert results[TEST_FILE_PATHS[0]].error == results["fail.csv"].error
+    assert results[TEST_FILE_PATHS[1]].ok
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert (
+        main(
+            [
+                TEST_FILE_PATHS[0],
+                "--output-dir",
+                str(tmp_path),
+                "--vendor",
+                Vendor.BECKMAN_VI_CELL_BLU.value,
+                "--workers",
+                "1",
+            ]
+        )
+        == 0
+    )
+    output_path = Path(tmp_path, "Beckman_Vi-Cell-BLU_example01.csv.json")
+    assert output_path.exists()
+    assert capsys.readouterr().out == f"{TEST_FILE_PATHS[0]} -> {output_path}\n"
+
+    assert main(["not/a/path.csv", "--output-dir", str(tmp_path)]) == 1
+    assert "not/a/path.csv FAILED" in capsys.readouterr().out
+
+
+def test_main_invalid_timezone(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit):
+        main(
+            [
+                TEST_FILE_PATHS[0],
+                "--output-dir",
+                str(tmp_path),
+                "--timezone",
+                "Nowhere/Special",
+            ]
+        )
+    assert (
+        "argument --timezone: unknown timezone: 'Nowhere/Special'"
+        in capsys.readouterr().err
+    )
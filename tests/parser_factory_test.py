@@ -1,6 +1,13 @@
 from pathlib import Path
 
-from allotropy.parser_factory import get_table_contents, Vendor
+from allotropy.allotrope.schemas import get_schema_validator
+from allotropy.parser_factory import (
+    _VENDOR_TO_PARSER,
+    get_table_contents,
+    Vendor,
+    warm_vendor_schema_validators,
+)
+from allotropy.testing.utils import get_imported_modules
 
 
 def test_vendor_display_name() -> None:
@@ -17,12 +24,29 @@ def test_get_parser() -> None:
         assert vendor.get_parser()
 
 
+def test_import_does_not_import_parsers() -> None:
+    # Importing the parser factory used to take ~2s when it imported every parser.
+    parser_modules = {path.rsplit(".", 1)[0] for path in _VENDOR_TO_PARSER.values()}
+    imported_modules = get_imported_modules("allotropy.parser_factory")
+
+    assert "allotropy.parser_factory" in imported_modules
+    assert not parser_modules & imported_modules
+
+
 def test_supported_schemas() -> None:
     assert Vendor.AGILENT_GEN5.asm_versions == ["REC/2024/06"]
     assert Vendor.AGILENT_GEN5.technique == "Plate Reader"
     assert Vendor.APPBIO_ABSOLUTE_Q.technique == "dPCR"
 
 
+def test_warm_vendor_schema_validators() -> None:
+    get_schema_validator.cache_clear()
+    warm_vendor_schema_validators([Vendor.AGILENT_GEN5])
+    assert get_schema_validator.cache_info().currsize == 1
+    warm_vendor_schema_validators([Vendor.AGILENT_GEN5])
+    assert get_schema_validator.cache_info().hits == 1
+
+
 def test_table_contents() -> None:
     table_path = Path(__file__).parent.parent.joinpath(
         "SUPPORTED_INSTRUMENT_SOFTWARE.adoc"
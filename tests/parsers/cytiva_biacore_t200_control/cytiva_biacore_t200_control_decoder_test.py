@@ -0,0 +1,124 @@
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.cytiva_biacore_t200_control.cytiva_biacore_t200_control_decoder import (
+    decode_data,
+    get_sensorgram_data,
+)
+from allotropy.parsers.cytiva_biacore_t200_control.cytiva_biacore_t200_control_parser import (
+    CytivaBiacoreT200ControlParser,
+)
+from allotropy.parsers.utils.data_sink import (
+    CallbackSink,
+    MemorySink,
+    TableData,
+)
+
+TESTDATA_DIR = Path("tests/parsers/cytiva_biacore_t200_control/testdata")
+
+
+def _curve(
+    flow_cell: str, sensorgram: list[float], time: list[float] | None = None
+) -> dict[str, object]:
+    return {
+        "cycle_number": 1,
+        "curve_number": 1,
+        "window_number": 1,
+        "flow_cell": flow_cell,
+        "sensorgram": np.array(sensorgram),
+        "time": None if time is None else np.array(time),
+    }
+
+
+def test_get_sensorgram_data_aligns_time_to_last_flow_cell() -> None:
+    data = get_sensorgram_data(
+        [
+            _curve("1", [1.0, 2.0, 3.0]),
+            _curve("2", [4.0, 5.0]),
+            _curve("2-1", [6.0, 7.0], time=[0.5, 1.5]),
+        ],
+        None,
+        has_time=True,
+    )
+
+    assert list(data) == [
+        "Flow Cell Number",
+        "Cycle Number",
+        "Curve Number",
+        "Window Number",
+        "Time (s)",
+        "Sensorgram (RU)",
+    ]
+    assert data["Flow Cell Number"].tolist() == ["1", "1", "1", "2", "2", "2-1", "2-1"]
+    assert data["Time (s)"].tolist() == [0.5, 1.5, 0.5, 0.5, 1.5, 0.5, 1.5]
+    assert data["Sensorgram (RU)"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+
+
+def test_get_sensorgram_data_without_time() -> None:
+    curves = [_curve("1", [1.0, 2.0]), _curve("2", [3.0]), _curve("1", [4.0])]
+
+    data = get_sensorgram_data(curves, None, has_time=False)
+    assert data["Time (s)"].tolist() == [1, 2, 1, 3]
+
+    data = get_sensorgram_data(curves, {"value": 10}, has_time=False)
+    assert data["Time (s)"].tolist() == [0.0, 0.1, 0.0, 0.2]
+
+
+def test_decode_data_from_stream_to_memory_sink() -> None:
+    file_name = "ED_Fig.6a_immobilization Her2-Her3"
+    with open(Path(TESTDATA_DIR, f"{file_name}.blr"), "rb") as f:
+        contents = BytesIO(f.read())
+    sink = MemorySink()
+
+    # The file path does not need to exist, nothing is read from or written to it.
+    data = decode_data(NamedFileContents(contents, f"not/a/dir/{file_name}.blr"), sink)
+
+    assert len(data["cycle_data"]) == 4
+    assert data["total_cycles"] == 4
+    assert isinstance(data["total_cycles"], int)
+    assert len(sink.tables) == 8
+    for cycle_data in data["cycle_data"]:
+        for key, suffix in (("sensorgram", "sensorgram"), ("r-point", "rpoint")):
+            name = f"{file_name}_cycle_{cycle_data['cycle_number']}_{suffix}.parquet"
+            assert cycle_data[f"{key}_path"] == name
+            pd.testing.assert_frame_equal(
+                pd.DataFrame(sink.tables[name]),
+                pd.read_parquet(Path(TESTDATA_DIR, name)),
+            )
+
+
+def test_decode_data_to_callback_sink() -> None:
+    file_name = "ED_Fig.6a_immobilization Her2-Her3"
+    names = []
+
+    def _store(name: str, _: TableData) -> str:
+        names.append(name)
+        return f"s3://bucket/{name}"
+
+    with open(Path(TESTDATA_DIR, f"{file_name}.blr"), "rb") as f:
+        data = decode_data(
+            NamedFileContents(f, f"{file_name}.blr"), CallbackSink(_store)
+        )
+
+    assert len(names) == 8
+    assert data["cycle_data"][0]["sensorgram_path"] == (
+        f"s3://bucket/{file_name}_cycle_1_sensorgram.parquet"
+    )
+
+
+def test_parser_with_sink() -> None:
+    file_name = "ED_Fig.6a_immobilization Her2-Her3"
+    with open(Path(TESTDATA_DIR, f"{file_name}.blr"), "rb") as f:
+        contents = BytesIO(f.read())
+    sink = MemorySink()
+
+    model = CytivaBiacoreT200ControlParser(data_sink=sink).to_allotrope(
+        NamedFileContents(contents, f"not/a/dir/{file_name}.blr")
+    )
+
+    assert model.binding_affinity_analyzer_aggregate_document
+    assert len(sink.tables) == 8
@@ -0,0 +1,31 @@
+from allotropy.parsers.cytiva_unicorn.reader.unicorn_zip_handler import (
+    UnicornZipHandler,
+)
+
+TEST_FILE_PATH = "tests/parsers/cytiva_unicorn/testdata/unicorn_1.zip"
+
+
+def test_cached_handler_reuses_zips_and_xml() -> None:
+    with UnicornZipHandler.create_from_path(TEST_FILE_PATH, cache=True) as handler:
+        assert handler.get_chrom_1() is handler.get_chrom_1()
+        system_data = handler.get_zip_from_pattern("SystemData(.zip)?$")
+        assert system_data is handler.get_zip_from_pattern("SystemData(.zip)?$")
+        assert system_data.cache
+        assert handler.get_system_data() is handler.get_system_data()
+
+    # Closing the handler closes the file it opened, and the nested zips.
+    assert handler.zip_file.fp is None
+    assert system_data.zip_file.fp is None
+    assert not handler.zips
+
+
+def test_handler_without_cache() -> None:
+    with open(TEST_FILE_PATH, "rb") as f:
+        handler = UnicornZipHandler(f)
+
+        chrom_1 = handler.get_chrom_1()
+        assert chrom_1 is not handler.get_chrom_1()
+        assert chrom_1.find("Curves").findall("Curve")
+        assert handler.get_zip_from_pattern(
+            "SystemData(.zip)?$"
+        ) is not handler.get_zip_from_pattern("SystemData(.zip)?$")
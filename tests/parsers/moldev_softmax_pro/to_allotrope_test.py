@@ -4,7 +4,13 @@ import re
 import pytest
 
 from allotropy.exceptions import AllotropeConversionError
+from allotropy.named_file_contents import NamedFileContents
 from allotropy.parser_factory import Vendor
+from allotropy.parsers.lines_reader import CsvReader
+from allotropy.parsers.moldev_softmax_pro.softmax_pro_structure import (
+    PlateRawData,
+    StructureData,
+)
 from allotropy.testing.utils import from_file
 from tests.to_allotrope_test import ParserTest
 
@@ -47,6 +53,44 @@ def test_missing_kinetic_measurement() -> None:
         from_file(f"{TESTDATA}/errors/missing_kinetic_measurement.txt", VENDOR_TYPE)
 
 
+def test_missing_later_kinetic_measurement() -> None:
+    with pytest.raises(
+        AllotropeConversionError,
+        match="Missing kinetic measurement for well position A2 at 180s.",
+    ):
+        from_file(
+            f"{TESTDATA}/errors/missing_later_kinetic_measurement.txt", VENDOR_TYPE
+        )
+
+
+def _get_kinetic_data(
+    test_file: str,
+) -> list[tuple[str, list[float], list[float | None]]]:
+    with open(test_file, "rb") as f:
+        reader = CsvReader.create(NamedFileContents(f, test_file))
+    return [
+        (
+            data_element.position,
+            data_element.elapsed_time,
+            data_element.kinetic_measures,
+        )
+        for block in StructureData.create(reader).block_list.plate_blocks.values()
+        for data_element in block.iter_data_elements(list(block.iter_wells()))
+    ]
+
+
+def test_kinetic_data_read_in_one_pass_matches_sections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    test_file = f"{TESTDATA}/fl_kinetic_plates.txt"
+    kinetic_data = _get_kinetic_data(test_file)
+
+    monkeypatch.setattr(PlateRawData, "_read_kinetic_data", lambda *_: None)
+
+    assert kinetic_data[0][1] == [0, 90, 180, 270]
+    assert kinetic_data == _get_kinetic_data(test_file)
+
+
 def test_invalid_measurement_table_dimensions() -> None:
     with pytest.raises(
         AllotropeConversionError,
@@ -270,6 +270,56 @@ def test_create_plates_with_calculated_data() -> None:
     assert plate == expected
 
 
+def _result_plate(number: str, label: str, measinfo: str) -> ResultPlate:
+    return ResultPlate(
+        plate_info=ResultPlateInfo(
+            number=number,
+            barcode=f"Plate {number}",
+            measurement_time=None,
+            measured_height=None,
+            chamber_temperature_at_start=None,
+            label=label,
+            measinfo=measinfo,
+            emission_filter_id="1st",
+        ),
+        background_infos=[],
+        results=[],
+    )
+
+
+def test_get_result_plate() -> None:
+    measinfo = "De=1st Ex=Top Em=Top Wdw=1 (14)"
+    plates = [
+        _result_plate(number, label, measinfo)
+        for number in ("1", "2")
+        for label in (
+            "Other label(1)",
+            "AC HTRF Laser [Eu](1)",
+            "AC HTRF Laser [Eu](2)",
+        )
+    ]
+    plate_list = PlateList(results=plates, calculated=[])
+
+    assert (
+        plate_list.get_result_plate(
+            BackgroundInfo(plate_num="2", label="AC HTRF Laser [Eu]", measinfo=measinfo)
+        )
+        is plates[4]
+    )
+    assert (
+        plate_list.get_result_plate(
+            BackgroundInfo(plate_num="3", label="AC HTRF Laser [Eu]", measinfo=measinfo)
+        )
+        is None
+    )
+    assert (
+        plate_list.get_result_plate(
+            BackgroundInfo(plate_num="1", label="AC HTRF Laser [Eu]", measinfo="other")
+        )
+        is None
+    )
+
+
 def test_create_calculated_plate_info() -> None:
     data = SeriesData(
         pd.Series(
@@ -1,3 +1,4 @@
+import math
 import re
 
 import pandas as pd
@@ -5,7 +6,14 @@ import pytest
 
 from allotropy.allotrope.models.shared.definitions.definitions import NaN
 from allotropy.exceptions import AllotropeConversionError, AllotropeParsingError
-from allotropy.parsers.utils.pandas import read_csv, read_excel, SeriesData
+from allotropy.parsers.utils.pandas import (
+    ColumnData,
+    KeyMatcher,
+    map_rows,
+    read_csv,
+    read_excel,
+    SeriesData,
+)
 
 EXPECTED_DATA_FRAME = pd.DataFrame({"Hello": ["World"]})
 TESTDATA = "tests/parsers/utils/testdata"
@@ -290,3 +298,116 @@ def test_get_unread_regex() -> None:
         "unread_float_as_str": 5.0,
         "unread_str": "hello!",
     }
+
+
+def _read_row(data: SeriesData) -> tuple[object, ...]:
+    return (
+        data.get(float, "float"),
+        data.get(float, "float", validate=SeriesData.NOT_NAN),
+        data.get(str, "float"),
+        data.get(int, "int"),
+        data.get(str, "int"),
+        data.get(float, "str"),
+        data.get(str, "str", validate=SeriesData.NOT_NAN),
+        data.get(bool, "str"),
+        data.get(float, ["missing", "percent"]),
+        data.get(str, "missing", "default"),
+        data.has_key("int"),
+        data.series.name,
+        data.get_unread(),
+    )
+
+
+def test_map_rows_matches_series_data() -> None:
+    df = pd.DataFrame(
+        {
+            "float": [1.5, math.nan, 3.0],
+            "int": [1, 2, 3],
+            "str": ["yes", None, "4.5"],
+            "percent": ["10%", "bad", None],
+        },
+        index=[10, 11, 12],
+    )
+
+    rows = map_rows(df, _read_row)
+
+    # repr, as nan != nan
+    assert repr(rows) == repr(
+        [_read_row(SeriesData(series)) for _, series in df.iterrows()]
+    )
+    assert rows[0][:4] == (1.5, 1.5, "1.5", 1)
+    assert math.isnan(rows[1][0])  # type: ignore[arg-type]
+    assert rows[1][1] is None
+
+
+def test_map_rows_matches_series_data_for_numeric_data_frame() -> None:
+    # All values of a row are upcast to float, as they are in a row series.
+    df = pd.DataFrame({"float": [1.5, 2.5], "int": [1, 2]})
+
+    assert map_rows(df, lambda data: data.get(str, "int")) == ["1.0", "2.0"]
+
+
+def test_map_rows_with_duplicate_columns() -> None:
+    df = pd.DataFrame([[1, 2]], columns=["a", "a"])
+
+    assert map_rows(df, lambda data: data.series.tolist()) == [[1, 2]]
+    with pytest.raises(AllotropeConversionError, match="column names are not unique"):
+        ColumnData(df)
+
+
+def test_column_data_converts_each_column_once() -> None:
+    columns = ColumnData(pd.DataFrame({"value": ["1", "2", "x"]}))
+
+    column = columns.get_column(float, "value")
+
+    assert column == [1.0, 2.0, None]
+    assert columns.get_column(float, "value") is column
+    assert columns.get_column(str, "missing") == [None, None, None]
+    assert [row.get(float, "value") for row in columns.rows()] == column
+
+
+def test_column_data_converts_float32_column_as_series_data() -> None:
+    df = pd.DataFrame({"value": [0.1, 2.5]}, dtype="float32")
+
+    columns = ColumnData(df)
+
+    assert columns.get_column(float, "value") == [0.1, 2.5]
+    assert map_rows(df, lambda data: data.get(float, "value")) == [0.1, 2.5]
+
+
+def test_column_data_raises_conversion_errors_on_read() -> None:
+    rows = ColumnData(pd.DataFrame({"value": [1.0, math.inf]})).rows()
+
+    assert rows[0].get(int, "value") == 1
+    with pytest.raises(OverflowError):
+        rows[1].get(int, "value")
+
+
+def test_column_data_row_series_is_built_once() -> None:
+    row = ColumnData(pd.DataFrame({"value": [1, 2]})).rows()[1]
+
+    assert row.series is row.series
+    assert row.series.tolist() == [2]
+
+
+def test_key_matcher_is_shared_by_rows() -> None:
+    df = pd.DataFrame({"custom 1": ["a", "b"], "custom 2": ["c", "d"], "value": [1, 2]})
+
+    rows = map_rows(df, lambda data: (data, data.get_unread(regex="custom.*")))
+
+    assert [unread for _, unread in rows] == [
+        {"custom 1": "a", "custom 2": "c"},
+        {"custom 1": "b", "custom 2": "d"},
+    ]
+    key_matcher = rows[0][0].key_matcher
+    assert rows[1][0].key_matcher is key_matcher
+    assert key_matcher.matches["custom.*"] == {"custom 1", "custom 2"}
+
+
+def test_key_matcher() -> None:
+    key_matcher = KeyMatcher(pd.Index(["a1", "a2", "b"]))
+
+    assert key_matcher.match("a.") == {"a1", "a2"}
+    assert key_matcher.match("a") == set()
+    assert key_matcher.match("a.") is key_matcher.match("a.")
+    assert key_matcher.keys == {"a1", "a2", "b"}
@@ -4,7 +4,12 @@ from zoneinfo import ZoneInfo
 import pytest
 
 from allotropy.exceptions import AllotropeConversionError
-from allotropy.parsers.utils.timestamp_parser import TimestampParser
+from allotropy.parsers.utils.timestamp_parser import (
+    TimestampParser,
+    TimestampParserStats,
+    TimezoneCodes,
+)
+from allotropy.testing.utils import get_imported_modules
 
 
 @pytest.mark.parametrize(
@@ -59,3 +64,88 @@ def test_timestamp_parser_handles_24h_pm() -> None:
     assert (
         TimestampParser().parse("2023-03-16 16:52:37 PM") == "2023-03-16T16:52:37+00:00"
     )
+
+
+def test_timestamp_parser_caches_repeated_strings() -> None:
+    parser = TimestampParser()
+    assert parser.parse("Fri, 11 Nov 2011 03:18:09") == "2011-11-11T03:18:09+00:00"
+    assert parser.parse("Fri, 11 Nov 2011 03:18:09") == "2011-11-11T03:18:09+00:00"
+
+    assert parser.stats == TimestampParserStats(
+        cache_hits=1, format_hits=0, fallbacks=1
+    )
+    assert parser.stats.cache_hit_rate == 0.5
+
+
+def test_timestamp_parser_learns_format() -> None:
+    parser = TimestampParser(US_PACIFIC)
+    assert parser.parse("10/13/2022 3:08:06 PM") == "2022-10-13T15:08:06-07:00"
+    assert parser.learned_format == "%m/%d/%Y %I:%M:%S %p"
+
+    assert parser.parse("01/02/2022 11:08:06 AM") == "2022-01-02T11:08:06-08:00"
+    assert parser.parse("10/13/2022 3:08:06 PM EDT") == "2022-10-13T15:08:06-04:00"
+    assert parser.stats == TimestampParserStats(
+        cache_hits=0, format_hits=1, fallbacks=2
+    )
+    assert parser.stats.format_hit_rate == pytest.approx(1 / 3)
+
+
+@pytest.mark.parametrize(
+    "time_str",
+    [
+        "2023-03-16 16:52:37 PM",
+        "10-11-08",
+        "Tue Jun 22 07:46:22 EST 2010",
+        "Measured on 2022-10-13",
+    ],
+)
+def test_timestamp_parser_does_not_learn_ambiguous_formats(time_str: str) -> None:
+    parser = TimestampParser()
+    parser.parse(time_str)
+    assert parser.learned_format is None
+
+
+@pytest.mark.parametrize(
+    "time_str",
+    [
+        "2022-10-13 15:08:06",
+        "2022-10-13T15:08:06.123",
+        "2022-10-13T15:08:06+02:00",
+        "2022-10-13 03:08:06 PM",
+        "2022-10-13",
+        "10/13/2022 15:08",
+        "13-Oct-2022 15:08:06",
+    ],
+)
+def test_timestamp_parser_learned_format_matches_dateutil(time_str: str) -> None:
+    parser = TimestampParser()
+    expected = parser.parse(time_str)
+    assert parser.learned_format is not None
+
+    format_parser = TimestampParser()
+    format_parser.learned_format = parser.learned_format
+    assert format_parser.parse(time_str) == expected
+    assert format_parser.stats.format_hits == 1
+
+
+def test_import_does_not_load_timezones() -> None:
+    # Loading every timezone in dateutil's zoneinfo when the module was imported took ~250ms.
+    get_imported_modules(
+        "allotropy.parsers.utils.timestamp_parser",
+        check="from dateutil import zoneinfo\n"
+        "assert not hasattr(zoneinfo.get_zonefile_instance, '_cached_instance')",
+    )
+
+
+def test_timezone_codes_are_loaded_on_lookup() -> None:
+    codes = TimezoneCodes()
+    assert None not in codes
+    assert "EDT" in codes
+    assert codes["EDT"] == timezone(timedelta(hours=-4), "EDT")
+    assert codes._zone_names is None
+
+    assert "XYZ" not in codes
+    assert codes["EST"] is codes["EST"]
+    assert codes["US/Pacific"] is not None
+    assert codes.get("XYZ") is None
+    assert "America/New_York" in set(codes)
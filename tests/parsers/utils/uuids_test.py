@@ -1,12 +1,94 @@
+from hashlib import sha256
+from io import BytesIO, StringIO
 import re
+import uuid
 
-from allotropy.parsers.utils.uuids import random_uuid_str
+import pytest
+
+from allotropy.exceptions import AllotropeConversionError
+from allotropy.named_file_contents import NamedFileContents
+from allotropy.parsers.utils.uuids import (
+    BlockRandomUuidGenerator,
+    ContentHashUuidGenerator,
+    get_default_id_generator,
+    random_uuid_str,
+    set_default_id_generator,
+    use_id_generator,
+)
+
+UUID_REGEX = (
+    "[a-zA-Z0-9]{8}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{12}"
+)
 
 
 def test_random_uuid_str() -> None:
-    uuid = random_uuid_str()
-    assert isinstance(uuid, str)
-    assert re.match(
-        "[a-zA-Z0-9]{8}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{4}-[a-zA-Z0-9]{12}",
-        uuid,
+    uuid_str = random_uuid_str()
+    assert isinstance(uuid_str, str)
+    assert re.match(UUID_REGEX, uuid_str)
+
+
+def test_block_random_uuid_generator() -> None:
+    generator = BlockRandomUuidGenerator(block_size=4)
+    ids = [generator.generate_id() for _ in range(10)]
+
+    assert len(set(ids)) == 10
+    for id_ in ids:
+        assert str(uuid.UUID(id_)) == id_
+        assert uuid.UUID(id_).version == 4
+        assert uuid.UUID(id_).variant == uuid.RFC_4122
+
+
+def test_content_hash_uuid_generator(monkeypatch: pytest.MonkeyPatch) -> None:
+    contents = BytesIO(b"contents")
+    contents.seek(2)
+    named_file_contents = NamedFileContents(contents, "file.txt")
+    generator = ContentHashUuidGenerator().for_contents(named_file_contents)
+    ids = [generator.generate_id() for _ in range(3)]
+
+    # The contents are hashed from the current position, which is restored for the parser.
+    assert contents.tell() == 2
+    seed_namespace = uuid.UUID(bytes=sha256(b"").digest()[:16])
+    namespace = uuid.UUID(bytes=sha256(seed_namespace.bytes + b"ntents").digest()[:16])
+    assert ids == [str(uuid.uuid5(namespace, str(n))) for n in range(3)]
+
+    # The same contents give the same ids, also when read in chunks or as text.
+    monkeypatch.setattr("allotropy.parsers.utils.uuids.HASH_CHUNK_SIZE", 4)
+    for other_named_file_contents in [
+        NamedFileContents(BytesIO(b"ntents"), "other.txt"),
+        NamedFileContents(StringIO("ntents"), "other.txt"),
+    ]:
+        generator = ContentHashUuidGenerator().for_contents(other_named_file_contents)
+        assert [generator.generate_id() for _ in range(3)] == ids
+
+    # A different seed gives different ids for the same contents.
+    generator = ContentHashUuidGenerator(b"seed").for_contents(
+        NamedFileContents(BytesIO(b"ntents"), "other.txt")
     )
+    assert generator.generate_id() != ids[0]
+
+
+def test_content_hash_uuid_generator_fails_on_unseekable_contents() -> None:
+    class UnseekableBytesIO(BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    named_file_contents = NamedFileContents(UnseekableBytesIO(b"contents"), "file.txt")
+    with pytest.raises(AllotropeConversionError, match="not seekable"):
+        ContentHashUuidGenerator().for_contents(named_file_contents)
+
+
+def test_use_id_generator() -> None:
+    generator = ContentHashUuidGenerator(b"seed")
+    expected = ContentHashUuidGenerator(b"seed").generate_id()
+    with use_id_generator(generator):
+        assert random_uuid_str() == expected
+    assert random_uuid_str() != ContentHashUuidGenerator(b"seed").generate_id()
+
+
+def test_set_default_id_generator() -> None:
+    default = get_default_id_generator()
+    try:
+        set_default_id_generator(ContentHashUuidGenerator(b"seed"))
+        assert random_uuid_str() == ContentHashUuidGenerator(b"seed").generate_id()
+    finally:
+        set_default_id_generator(default)
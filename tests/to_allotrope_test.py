@@ -1,14 +1,29 @@
+import io
+import json
 import os
 from pathlib import Path
 import re
+import shutil
 
 import pytest
 
+from allotropy.allotrope.data_cube_tables import read_data_cube_tables
 from allotropy.constants import CHARDET_ENCODING
 from allotropy.exceptions import AllotropeConversionError
 from allotropy.parser_factory import Vendor
-from allotropy.testing.utils import from_file, validate_contents
-from allotropy.to_allotrope import allotrope_from_file, allotrope_model_from_file
+from allotropy.parsers.utils.data_sink import DirectorySink, MemorySink
+from allotropy.parsers.utils.uuids import ContentHashUuidGenerator
+from allotropy.testing.utils import (
+    from_file,
+    mock_uuid_generation,
+    validate_contents,
+)
+from allotropy.to_allotrope import (
+    allotrope_from_file,
+    allotrope_from_io,
+    allotrope_model_from_file,
+    allotrope_to_stream,
+)
 
 INVALID_FILE_PATH = "not/a/path"
 EXPECTED_ERROR_MESSAGE = f"File not found: {INVALID_FILE_PATH}"
@@ -37,6 +52,95 @@ def test_allotrope_model_from_file_not_found() -> None:
         allotrope_model_from_file(INVALID_FILE_PATH, Vendor.AGILENT_GEN5)
 
 
+def test_allotrope_to_stream() -> None:
+    test_file_path = (
+        "tests/parsers/beckman_vi_cell_blu/testdata/Beckman_Vi-Cell-BLU_example01.csv"
+    )
+    vendor = Vendor.BECKMAN_VI_CELL_BLU
+    out = io.StringIO()
+    with mock_uuid_generation(vendor.name), open(test_file_path, "rb") as f:
+        allotrope_to_stream(f, test_file_path, vendor, out)
+
+    allotrope_dict = from_file(test_file_path, vendor)
+    assert out.getvalue() == json.dumps(allotrope_dict, ensure_ascii=False)
+
+
+def test_allotrope_from_io_with_content_hash_ids() -> None:
+    test_file_path = (
+        "tests/parsers/beckman_vi_cell_blu/testdata/Beckman_Vi-Cell-BLU_example01.csv"
+    )
+    vendor = Vendor.BECKMAN_VI_CELL_BLU
+    id_generator = ContentHashUuidGenerator()
+    with open(test_file_path, "rb") as f:
+        allotrope_dict = allotrope_from_io(
+            f, test_file_path, vendor, id_generator=id_generator
+        )
+
+    assert (
+        allotrope_from_file(test_file_path, vendor, id_generator=id_generator)
+        == allotrope_dict
+    )
+    assert allotrope_from_file(test_file_path, vendor) != allotrope_dict
+
+
+def test_allotrope_from_file_with_data_sink(tmp_path: Path) -> None:
+    test_file_path = "tests/parsers/cytiva_unicorn/testdata/unicorn_1.zip"
+    vendor = Vendor.CYTIVA_UNICORN
+    id_generator = ContentHashUuidGenerator()
+    allotrope_dict = allotrope_from_file(
+        test_file_path,
+        vendor,
+        id_generator=id_generator,
+        data_sink=DirectorySink(str(tmp_path)),
+    )
+
+    assert len(list(tmp_path.glob("unicorn_1_data_cube_*.parquet"))) == 18
+    assert '"data file"' in json.dumps(allotrope_dict)
+    assert read_data_cube_tables(allotrope_dict) == allotrope_from_file(
+        test_file_path, vendor, id_generator=id_generator
+    )
+
+
+def test_allotrope_from_io_with_memory_sink(tmp_path: Path) -> None:
+    test_file_path = shutil.copy(
+        "tests/parsers/cytiva_biacore_t200_control/testdata/ED_Fig.6a_immobilization Her2-Her3.blr",
+        tmp_path,
+    )
+    sink = MemorySink()
+    with open(test_file_path, "rb") as f:
+        allotrope_dict = allotrope_from_io(
+            f, test_file_path, Vendor.CYTIVA_BIACORE_T200_CONTROL, data_sink=sink
+        )
+
+    assert allotrope_dict["binding affinity analyzer aggregate document"]
+    assert len(sink.tables) == 8
+    # The sensorgram and r-point tables are kept in the sink, rather than written next to the input file.
+    assert [path.name for path in tmp_path.iterdir()] == [
+        "ED_Fig.6a_immobilization Her2-Her3.blr"
+    ]
+
+
+def test_allotrope_from_file_with_data_sink_writes_parser_tables(
+    tmp_path: Path,
+) -> None:
+    test_file_path = shutil.copy(
+        "tests/parsers/cytiva_biacore_t200_control/testdata/ED_Fig.6a_immobilization Her2-Her3.blr",
+        tmp_path,
+    )
+    output_dir = Path(tmp_path, "output")
+    output_dir.mkdir()
+    allotrope_dict = allotrope_from_file(
+        test_file_path,
+        Vendor.CYTIVA_BIACORE_T200_CONTROL,
+        data_sink=DirectorySink(str(output_dir)),
+    )
+
+    assert len(list(output_dir.glob("*_sensorgram.parquet"))) == 4
+    assert len(list(output_dir.glob("*_rpoint.parquet"))) == 4
+    assert not list(tmp_path.glob("*.parquet"))
+    assert str(output_dir) in json.dumps(allotrope_dict)
+
+
 # A parser can inherit from this test to automatically test all positive test cases of converting from file.
 @pytest.mark.long
 class ParserTest: